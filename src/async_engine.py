@@ -0,0 +1,247 @@
+"""
+asyncio 수집 엔진.
+
+스레드 기반 collect_all 대신 이벤트 루프 하나에서 모든 소스를 동시에 수집한다.
+fetch_company_async를 구현한 소스(wanted, saramin, greetinghr, career, linkedin)는
+공유 aiohttp 세션으로 요청하고, 동기 전용 소스(playwright, mock 등)는
+BaseSource의 스레드 어댑터를 통해 그대로 동작한다.
+
+settings.yaml의 concurrency.engine을 "asyncio"로 지정하면 사용된다.
+aiohttp가 설치되지 않았으면 모든 소스가 스레드 어댑터로 실행된다.
+
+의존성:
+    pip install aiohttp
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable
+
+from config_loader import AppSettings, CompanyConfig
+import http_client
+from http_client import DEFAULT_HEADERS, ENCODINGS, HtmlPage
+from models import JobPosting
+from run_stats import RUN_STATS
+from throttle import THROTTLE_STATUS, AdaptiveRateLimiter, AsyncHostLimiter, host_of, parse_retry_after
+
+if TYPE_CHECKING:
+    from sources.base import BaseSource
+
+logger = logging.getLogger(__name__)
+
+# aiohttp 가용 여부 플래그
+_AIOHTTP_AVAILABLE = False
+try:
+    import aiohttp
+
+    _AIOHTTP_AVAILABLE = True
+except ImportError:
+    logger.debug("aiohttp 패키지가 설치되지 않음 – asyncio 엔진은 스레드 어댑터만 사용")
+
+# 요청 기본 타임아웃 (초)
+DEFAULT_TIMEOUT = 30
+
+
+class AsyncHttpError(Exception):
+    """비동기 HTTP 요청 실패 (연결 오류, 타임아웃, 4xx/5xx 응답).
+
+    Attributes:
+        status: 응답 상태 코드 (응답이 없으면 None)
+        retry_after: 429/503 응답의 Retry-After (초, 없으면 None)
+    """
+
+    def __init__(self, message: str, status: int | None = None, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AsyncHttpClient:
+    """소스에 전달되는 얇은 aiohttp 래퍼.
+
+    소스 코드가 aiohttp에 직접 의존하지 않도록
+    텍스트/JSON 조회와 오류 변환만 제공한다.
+    적응형 속도 제한기는 스레드 엔진(http_client)과 같은 인스턴스를 공유한다.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        timeout: float = DEFAULT_TIMEOUT,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+    ) -> None:
+        self._session = session
+        self._timeout = timeout
+        self._rate_limiter = rate_limiter
+
+    async def _get(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        timeout: float | None,
+        read: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+    ) -> Any:
+        host = host_of(url)
+        if self._rate_limiter is not None:
+            wait = self._rate_limiter.reserve(host)
+            if wait > 0:
+                await asyncio.sleep(wait)
+        try:
+            async with self._session.get(
+                url,
+                params=_flatten_params(params),
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout or self._timeout),
+            ) as resp:
+                retry_after = resp.headers.get("Retry-After")
+                if self._rate_limiter is not None:
+                    self._rate_limiter.record(host, resp.status, retry_after)
+                if resp.status >= 400:
+                    raise AsyncHttpError(
+                        f"{url}: HTTP {resp.status}",
+                        status=resp.status,
+                        retry_after=parse_retry_after(retry_after) if resp.status in THROTTLE_STATUS else None,
+                    )
+                return await read(resp)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            raise AsyncHttpError(f"{url}: {exc!r}") from exc
+
+    async def get_text(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> tuple[str, str]:
+        """GET 요청 후 (본문 텍스트, 최종 URL)을 반환한다."""
+
+        async def read(resp: aiohttp.ClientResponse) -> tuple[str, str]:
+            return await resp.text(), str(resp.url)
+
+        return await self._get(url, params, headers, timeout, read)
+
+    async def get_html(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> HtmlPage:
+        """GET 요청 후 본문을 디코딩하지 않은 채 인코딩과 함께 반환한다."""
+
+        async def read(resp: aiohttp.ClientResponse) -> HtmlPage:
+            body = await resp.read()
+            encoding = ENCODINGS.detect(resp.url.host or "", resp.headers.get("Content-Type"), body)
+            return HtmlPage(body, encoding, str(resp.url))
+
+        return await self._get(url, params, headers, timeout, read)
+
+    async def get_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """GET 요청 후 JSON 본문을 반환한다 (파싱 실패 시 ValueError)."""
+
+        async def read(resp: aiohttp.ClientResponse) -> Any:
+            return await resp.json(content_type=None)
+
+        return await self._get(url, params, headers, timeout, read)
+
+
+def _flatten_params(params: dict[str, Any] | None) -> list[tuple[str, str]] | None:
+    """requests와 동일하게 리스트 값을 반복 키로 펼친다 (years=5&years=7)."""
+    if params is None:
+        return None
+    flat: list[tuple[str, str]] = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        flat.extend((key, str(v)) for v in values)
+    return flat
+
+
+@asynccontextmanager
+async def open_http_client(max_connections: int) -> AsyncIterator[AsyncHttpClient | None]:
+    """공유 aiohttp 세션을 열어 AsyncHttpClient를 제공한다.
+
+    aiohttp가 없으면 None을 제공하며, 이때 소스는 스레드 어댑터로 동작한다.
+    """
+    if not _AIOHTTP_AVAILABLE:
+        yield None
+        return
+
+    connector = aiohttp.TCPConnector(limit=max_connections)
+    # Accept-Encoding은 aiohttp가 지원 가능한 방식으로 직접 설정한다.
+    headers = {k: v for k, v in DEFAULT_HEADERS.items() if k != "Accept-Encoding"}
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        yield AsyncHttpClient(session, rate_limiter=http_client.get_client().rate_limiter)
+
+
+async def collect_sources_async(
+    runnable: list[tuple[str, BaseSource, list[CompanyConfig]]],
+    settings: AppSettings,
+) -> list[list[JobPosting]]:
+    """모든 소스를 이벤트 루프 하나에서 동시에 수집한다.
+
+    Args:
+        runnable: (소스 이름, 소스 인스턴스, 기업 목록) 목록
+        settings: 애플리케이션 설정
+
+    Returns:
+        runnable과 같은 순서의 소스별 공고 목록
+    """
+    concurrency = settings.concurrency
+    host_limiter = AsyncHostLimiter(concurrency.per_host_limit)
+
+    async with open_http_client(concurrency.async_max_connections) as http:
+        if http is None:
+            logger.warning("aiohttp 미설치 – 모든 소스를 스레드 어댑터로 실행합니다")
+
+        async def collect(name: str, source: BaseSource, companies: list[CompanyConfig]) -> list[JobPosting]:
+            logger.info(
+                "━━━ [%s] 비동기 수집 시작 – 기업 %d개 (%s) ━━━",
+                name,
+                len(companies),
+                "native" if http is not None and source.supports_async else "thread adapter",
+            )
+            started = time.perf_counter()
+            max_workers = min(concurrency.workers_for(name), len(companies))
+            try:
+                # 브라우저 풀 기동처럼 오래 걸리는 open()이 다른 소스의 코루틴을 멈추지 않도록 스레드에서 실행
+                await asyncio.to_thread(source.open, max_workers)
+                jobs = await source.fetch_all_companies_async(
+                    companies,
+                    http,
+                    exp_filter=settings.experience_filter,
+                    skip_filter=settings.mock_skip_filter if name == "mock" else False,
+                    max_workers=max_workers,
+                    host_limiter=host_limiter,
+                )
+            except Exception as exc:
+                logger.error("[%s] 소스 수집 중 예외 발생: %s", name, exc)
+                jobs = []
+            elapsed = time.perf_counter() - started
+            RUN_STATS.set("source_wall_time_s", name, elapsed)
+            logger.info("━━━ [%s] 수집 종료 – %d건, %.1f초 ━━━", name, len(jobs), elapsed)
+            return jobs
+
+        # gather는 입력 순서대로 결과를 돌려준다.
+        return list(await asyncio.gather(*(collect(*entry) for entry in runnable)))
+
+
+def run_async_collection(
+    runnable: list[tuple[str, BaseSource, list[CompanyConfig]]],
+    settings: AppSettings,
+) -> list[list[JobPosting]]:
+    """collect_sources_async를 새 이벤트 루프에서 실행한다."""
+    return asyncio.run(collect_sources_async(runnable, settings))
@@ -0,0 +1,115 @@
+"""
+JobPosting 메모리 벤치마크.
+
+합성 공고 N건을 저장 파일에서 불러오는 것과 같은 방식(JSON → from_dict)으로 만들고
+tracemalloc으로 객체 목록이 차지하는 메모리를 잰다.
+
+- before: __dict__ 기반 dataclass, 문자열 intern 없음 (이전 JobPosting과 같은 구조)
+- after: 현재 JobPosting (__slots__ + 값 종류가 적은 필드 intern)
+
+실행:
+    python src/bench_models.py [--count 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+# ── sys.path에 src 디렉토리 추가 (패키지 임포트 지원) ──────────
+SRC_DIR = Path(__file__).resolve().parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from models import JobPosting
+
+_SOURCES = ("wanted", "saramin", "greetinghr", "linkedin")
+_LOCATIONS = ("서울 강남구", "서울 서초구", "경기 성남시", "서울 송파구", "부산 해운대구")
+_LEVELS = ("5-7년", "3-5년", "7-10년")
+
+
+@dataclass
+class _DictJobPosting:
+    """비교용: __dict__ 기반, intern 없는 공고 모델."""
+
+    source: str
+    company: str
+    title: str
+    level: str
+    location: str
+    url: str
+    description: str
+    date_found: str
+    unique_key: str
+    description_ref: str
+
+
+def _records(count: int) -> list[dict[str, Any]]:
+    """저장 파일을 읽은 것처럼 레코드마다 별도 문자열 객체를 가진 합성 공고를 만든다."""
+    records = [
+        {
+            "source": _SOURCES[i % len(_SOURCES)],
+            "company": f"회사{i % 500}",
+            "title": f"백엔드 개발자 {i} - 경력 5~7년",
+            "level": _LEVELS[i % len(_LEVELS)],
+            "location": _LOCATIONS[i % len(_LOCATIONS)],
+            "url": f"https://www.wanted.co.kr/wd/{100000 + i}",
+            "description": "",
+            "date_found": f"2026-10-{1 + i % 28:02d}",
+            "unique_key": f"{i:016x}",
+            "description_ref": "",
+        }
+        for i in range(count)
+    ]
+    return json.loads(json.dumps(records, ensure_ascii=False))
+
+
+def _measure(build: Callable[[list[dict[str, Any]]], list[Any]], count: int) -> tuple[float, float]:
+    """(메모리 MB, 생성 시간 ms)를 반환한다.
+
+    메모리는 레코드를 버린 뒤 공고 목록이 붙잡고 있는 양(문자열 포함)이고,
+    시간은 tracemalloc 없이 따로 잰다 (tracemalloc은 할당을 크게 느리게 한다).
+    """
+    records = _records(count)
+    started = time.perf_counter()
+    build(records)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    del records
+    gc.collect()
+
+    tracemalloc.start()
+    jobs = build(_records(count))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del jobs
+    return current / 1024 / 1024, elapsed_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JobPosting 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    cases: dict[str, Callable[[list[dict[str, Any]]], list[Any]]] = {
+        "before (dict)": lambda records: [_DictJobPosting(**record) for record in records],
+        "after (slots+intern)": lambda records: [JobPosting.from_dict(record) for record in records],
+    }
+
+    print(f"공고 {args.count:,}건")
+    print(f"{'model':<24}{'memory MB':>12}{'bytes/job':>12}{'build ms':>12}")
+    for name, build in cases.items():
+        memory_mb, build_ms = _measure(build, args.count)
+        per_job = memory_mb * 1024 * 1024 / args.count
+        print(f"{name:<24}{memory_mb:>12.1f}{per_job:>12.0f}{build_ms:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+HTML 파서 백엔드 벤치마크.
+
+저장해 둔 채용 페이지(fixture)를 소스별 파싱 로직으로 처리하면서
+백엔드(html.parser, lxml)마다 시간을 비교한다.
+
+- full parse ms: 문서 전체를 트리로 만드는 시간
+- source ms: 소스가 실제로 하는 파싱(부분 트리 포함) + 공고 추출 시간
+
+fixture 배치:
+    fixtures/<source>/<기업명>.html
+    (source: saramin, greetinghr, career, linkedin, playwright)
+    파일 이름이 companies.yaml의 기업명과 같으면 그 기업의 url/selectors를 사용한다.
+    리포지토리에는 소스별(saramin, greetinghr, career, linkedin) 대표 페이지가 하나씩 들어 있다.
+    실제 페이지 구조(공고 마크업 + 헤더/스크립트/푸터)를 줄여 옮긴 것이며, 실측 페이지를
+    같은 자리에 저장해 두면 함께 측정한다.
+
+실행:
+    python src/bench_parsers.py [fixture 디렉토리] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+# ── sys.path에 src 디렉토리 추가 (패키지 임포트 지원) ──────────
+SRC_DIR = Path(__file__).resolve().parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import html_parser
+from config_loader import CompanyConfig, load_companies
+from models import JobPosting
+from sources.career_page import CareerPageSource
+from sources.greetinghr import GreetingHRSource
+from sources.linkedin import LinkedInSource
+from sources.playwright_source import PlaywrightSource
+from sources.saramin import SaraminSource
+
+# 기본 fixture 디렉토리 (리포지토리 루트 기준)
+DEFAULT_FIXTURE_DIR = SRC_DIR.parent / "fixtures"
+
+# 소스 이름 → (html, 기업 설정) → 추출된 공고
+Extractor = Callable[[str, CompanyConfig], list[JobPosting]]
+
+
+def _extractors() -> dict[str, Extractor]:
+    today = date.today().isoformat()
+    saramin = SaraminSource()
+    greetinghr = GreetingHRSource()
+    career = CareerPageSource()
+    linkedin = LinkedInSource()
+    playwright = PlaywrightSource()
+
+    def parse_saramin(html: str, company: CompanyConfig) -> list[JobPosting]:
+        jobs: list[JobPosting] = []
+        saramin._collect_page(html, 1, company.name, today, jobs)
+        return jobs
+
+    return {
+        "saramin": parse_saramin,
+        "greetinghr": lambda html, company: greetinghr._parse_page(html, company.url, company),
+        "career": career._parse_page,
+        "linkedin": linkedin._parse_page,
+        "playwright": lambda html, company: playwright._parse_dom(html, company, today),
+    }
+
+
+def _timed(fn: Callable[[], object], repeat: int) -> tuple[float, object]:
+    """fn을 repeat번 실행하고 (1회 평균 ms, 마지막 결과)를 반환한다."""
+    result: object = None
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - started) * 1000 / repeat, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    parser.add_argument("fixtures", nargs="?", type=Path, default=DEFAULT_FIXTURE_DIR)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    known = {c.name: c for c in load_companies()}
+    backends = sorted({html_parser.resolve_backend(b) for b in ("html.parser", "lxml")})
+    extractors = _extractors()
+
+    rows: list[tuple[str, str, str, float, float, int]] = []
+    for source_name, extract in extractors.items():
+        for path in sorted((args.fixtures / source_name).glob("*.html")):
+            html = path.read_text(encoding="utf-8")
+            company = known.get(path.stem) or CompanyConfig(
+                name=path.stem, source=source_name, url="https://example.com/"
+            )
+            for backend in backends:
+                html_parser.configure(backend)
+                parse_ms, _ = _timed(lambda: html_parser.parse_html(html), args.repeat)
+                total_ms, jobs = _timed(lambda: extract(html, company), args.repeat)
+                rows.append((source_name, path.stem, backend, parse_ms, total_ms, len(jobs)))
+
+    if not rows:
+        print(f"fixture가 없습니다: {args.fixtures}/<source>/*.html")
+        return
+
+    print(f"{'source':<12}{'fixture':<24}{'backend':<13}{'full parse ms':>15}{'source ms':>11}{'jobs':>6}")
+    for source_name, fixture, backend, parse_ms, total_ms, count in rows:
+        print(f"{source_name:<12}{fixture:<24}{backend:<13}{parse_ms:>15.2f}{total_ms:>11.2f}{count:>6}")
+
+
+if __name__ == "__main__":
+    main()
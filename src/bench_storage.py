@@ -0,0 +1,94 @@
+"""
+공고 저장/불러오기 벤치마크.
+
+합성 공고 N건을 data/jobs.json 형식으로 저장하고 다시 불러오는 시간과 파일 크기를 잰다.
+
+- baseline: dataclasses.asdict + json.dumps(indent=2) / json.loads + 필드 필터링 (이전 저장 경로)
+- codec: 현재 storage.save_jobs / load_jobs (기본 형식, 들여쓰기 유지)
+- codec compact: storage.compact 형식 (들여쓰기 없음, 기본값 필드 생략)
+
+실행:
+    python src/bench_storage.py [--counts 10000 100000 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+# ── sys.path에 src 디렉토리 추가 (패키지 임포트 지원) ──────────
+SRC_DIR = Path(__file__).resolve().parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import codec
+from models import JobPosting
+from storage import load_jobs, save_jobs
+
+_SOURCES = ("wanted", "saramin", "greetinghr", "linkedin")
+_LOCATIONS = ("서울 강남구", "", "경기 성남시", "서울 송파구")
+
+
+def _jobs(count: int) -> list[JobPosting]:
+    return [
+        JobPosting(
+            source=_SOURCES[i % len(_SOURCES)],
+            company=f"회사{i % 500}",
+            title=f"백엔드 개발자 {i} - 경력 5~7년",
+            location=_LOCATIONS[i % len(_LOCATIONS)],
+            url=f"https://www.wanted.co.kr/wd/{100000 + i}",
+            date_found=f"2026-10-{1 + i % 28:02d}",
+        )
+        for i in range(count)
+    ]
+
+
+def _baseline_save(jobs: list[JobPosting], path: Path) -> None:
+    data = [dataclasses.asdict(job) for job in jobs]
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def _baseline_load(path: Path) -> list[JobPosting]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    names = JobPosting.__dataclass_fields__
+    return [JobPosting(**{k: v for k, v in item.items() if k in names and k != "unique_key"}) for item in data]
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="공고 저장/불러오기 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    modes: dict[str, tuple[Callable[[list[JobPosting], Path], None], Callable[[Path], object]]] = {
+        "baseline": (_baseline_save, _baseline_load),
+        "codec": (lambda jobs, path: save_jobs(jobs, path), load_jobs),
+        "codec compact": (lambda jobs, path: save_jobs(jobs, path, compact=True), load_jobs),
+    }
+
+    print(f"codec backend: {codec.BACKEND}")
+    print(f"{'count':>10}  {'mode':<15}{'save ms':>10}{'load ms':>10}{'size MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "jobs.json"
+        for count in args.counts:
+            jobs = _jobs(count)
+            for mode, (save, load) in modes.items():
+                save_ms = _timed(lambda: save(jobs, path))
+                load_ms = _timed(lambda: load(path))
+                size_mb = path.stat().st_size / 1024 / 1024
+                print(f"{count:>10,}  {mode:<15}{save_ms:>10.0f}{load_ms:>10.0f}{size_mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
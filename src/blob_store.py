@@ -0,0 +1,127 @@
+"""
+description 전용 내용 주소(content-addressed) 압축 저장소.
+
+공고 상세 설명은 수 KB씩 되므로 jobs.json에 그대로 넣지 않고
+본문의 SHA-256 해시를 이름으로 하는 압축 파일에 한 번만 저장한다.
+jobs.json에는 해시(description_ref)만 남는다.
+
+- 같은 설명(소스 간 중복, 재등록 공고)은 파일 하나를 공유한다.
+- zstandard 패키지가 있으면 zstd, 없으면 표준 라이브러리 zlib로 압축한다.
+  읽을 때는 확장자로 구분하므로 두 방식이 섞여 있어도 된다.
+
+파일 배치:
+    data/descriptions/ab/cdef....zst   (또는 .zz)
+
+의존성 (선택):
+    pip install zstandard
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import zlib
+from pathlib import Path
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+# zstandard 가용 여부 플래그
+_ZSTD_AVAILABLE = False
+try:
+    import zstandard
+
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    logger.debug("zstandard 패키지가 설치되지 않음 – zlib로 압축")
+
+# 기본 저장 경로 (리포지토리 루트 기준)
+DEFAULT_BLOB_DIR = Path(__file__).resolve().parent.parent / "data" / "descriptions"
+
+# 압축 방식별 파일 확장자
+_ZSTD_SUFFIX = ".zst"
+_ZLIB_SUFFIX = ".zz"
+
+# 압축 수준 (한 번 쓰고 여러 번 읽으므로 높게)
+_ZSTD_LEVEL = 19
+_ZLIB_LEVEL = 9
+
+
+def content_key(text: str) -> str:
+    """설명 본문의 저장 키(SHA-256 hex)를 반환한다."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class BlobStore:
+    """해시 → 압축 본문 파일 저장소.
+
+    Attributes:
+        root: 저장 디렉토리
+    """
+
+    def __init__(self, root: Path = DEFAULT_BLOB_DIR) -> None:
+        self.root = root
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.root / key[:2] / f"{key[2:]}{suffix}"
+
+    def _existing(self, key: str) -> Path | None:
+        for suffix in (_ZSTD_SUFFIX, _ZLIB_SUFFIX):
+            path = self._path(key, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def put(self, text: str) -> str:
+        """본문을 저장하고 키를 반환한다 (이미 있으면 쓰지 않음)."""
+        key = content_key(text)
+        if self._existing(key) is not None:
+            return key
+        raw = text.encode("utf-8")
+        if _ZSTD_AVAILABLE:
+            data = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw)
+            path = self._path(key, _ZSTD_SUFFIX)
+        else:
+            data = zlib.compress(raw, _ZLIB_LEVEL)
+            path = self._path(key, _ZLIB_SUFFIX)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        return key
+
+    def get(self, key: str) -> str:
+        """키에 해당하는 본문을 반환한다 (없거나 읽을 수 없으면 빈 문자열)."""
+        path = self._existing(key)
+        if path is None:
+            logger.warning("description 파일 없음: %s", key)
+            return ""
+        data = path.read_bytes()
+        try:
+            if path.suffix == _ZSTD_SUFFIX:
+                if not _ZSTD_AVAILABLE:
+                    logger.warning("zstandard 미설치 – %s를 읽을 수 없음 (pip install zstandard)", path)
+                    return ""
+                raw = zstandard.ZstdDecompressor().decompress(data)
+            else:
+                raw = zlib.decompress(data)
+        except Exception as exc:
+            logger.warning("description 파일 손상: %s (%s)", path, exc)
+            return ""
+        return raw.decode("utf-8")
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """keep에 없는 파일을 지우고 지운 개수를 반환한다."""
+        if not self.root.exists():
+            return 0
+        keep_set = set(keep)
+        removed = 0
+        for path in self.root.glob("*/*"):
+            key = path.parent.name + path.name.split(".", 1)[0]
+            if key not in keep_set:
+                path.unlink()
+                removed += 1
+        if removed:
+            logger.info("사용하지 않는 description 파일 %d개 삭제", removed)
+        return removed
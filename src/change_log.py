@@ -0,0 +1,228 @@
+"""
+공고 변경 이력(change log) 모듈.
+
+실행마다 변경 감지 결과(신규/삭제/수정)를 data/history/changes.jsonl에
+한 줄에 이벤트 하나씩 덧붙인다. 기록 비용은 전체 공고 수가 아니라 변경 건수에 비례한다.
+
+이벤트가 compact_after건을 넘으면 로그를 snapshot.json에 접어 넣고(compaction) 비운다.
+스냅샷은 공고별 최종 상태(마지막 공고 정보, 최초 발견/마지막 변경/삭제 시각)를 담는다.
+
+- "X 이후 무엇이 바뀌었나": changes_since(X) – 스냅샷 + 로그로 계산 (git 이력 diff 불필요)
+- 공고 하나의 이력: history(unique_key)
+- 접힌 구간은 공고별 최종 상태만 남는다 (중간 수정 이벤트는 마지막 것만).
+
+파일 배치:
+    data/history/changes.jsonl   ← 아직 접지 않은 이벤트 (append-only)
+    data/history/snapshot.json   ← 마지막 compaction 시점까지의 공고별 상태
+
+실행 (조회):
+    python src/change_log.py --since 2026-10-01
+    python src/change_log.py --key <unique_key>
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+from zoneinfo import ZoneInfo
+
+from models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+KST = ZoneInfo("Asia/Seoul")
+
+# 기본 이력 디렉토리 (리포지토리 루트 기준)
+DEFAULT_HISTORY_DIR = Path(__file__).resolve().parent.parent / "data" / "history"
+
+# 로그가 이 건수를 넘으면 스냅샷으로 접는다
+DEFAULT_COMPACT_AFTER = 2000
+
+# 이벤트 종류
+EVENT_NEW = "new"
+EVENT_REMOVED = "removed"
+EVENT_UPDATED = "updated"
+
+_LOG_NAME = "changes.jsonl"
+_SNAPSHOT_NAME = "snapshot.json"
+
+
+def _now() -> str:
+    return datetime.now(tz=KST).isoformat(timespec="seconds")
+
+
+def _job_record(job: JobPosting) -> dict[str, Any]:
+    """이벤트에 남길 공고 정보 (본문은 크므로 제외, description_ref는 유지)."""
+    record = job.to_dict(description=False)
+    del record["description"]
+    return record
+
+
+class ChangeLog:
+    """append-only 변경 이벤트 로그 + 주기적 스냅샷.
+
+    Attributes:
+        root: 이력 디렉토리
+        compact_after: compaction 기준 이벤트 수
+    """
+
+    def __init__(self, root: Path = DEFAULT_HISTORY_DIR, compact_after: int = DEFAULT_COMPACT_AFTER) -> None:
+        self.root = root
+        self.compact_after = compact_after
+        self.log_path = root / _LOG_NAME
+        self.snapshot_path = root / _SNAPSHOT_NAME
+
+    # ── 기록 ─────────────────────────────────────────────
+
+    def append(
+        self,
+        new: Iterable[JobPosting] = (),
+        removed: Iterable[JobPosting] = (),
+        updated: Iterable[JobPosting] = (),
+        at: str | None = None,
+    ) -> int:
+        """이번 실행의 변경 이벤트를 로그 끝에 덧붙이고 기록 건수를 반환한다."""
+        at = at or _now()
+        events = [
+            {"at": at, "event": event, "key": job.unique_key, "job": _job_record(job)}
+            for event, jobs in ((EVENT_NEW, new), (EVENT_REMOVED, removed), (EVENT_UPDATED, updated))
+            for job in jobs
+        ]
+        if not events:
+            return 0
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self.log_path.open("a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False))
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        logger.info("변경 이력 %d건 기록: %s", len(events), self.log_path)
+        return len(events)
+
+    def maybe_compact(self) -> bool:
+        """로그가 compact_after건을 넘었으면 compaction한다."""
+        if self.compact_after <= 0 or not self.log_path.exists():
+            return False
+        with self.log_path.open("r", encoding="utf-8") as f:
+            count = sum(1 for line in f if line.strip())
+        if count < self.compact_after:
+            return False
+        self.compact()
+        return True
+
+    def compact(self) -> int:
+        """로그를 스냅샷에 접어 넣고 로그를 비운다. 접은 이벤트 수를 반환한다.
+
+        스냅샷을 먼저 교체하고 로그를 비우므로, 그 사이에 중단돼도
+        다음 compaction에서 스냅샷 시각(as_of) 이전 이벤트는 다시 반영하지 않는다.
+        """
+        snapshot = self.load_snapshot()
+        as_of = snapshot["as_of"]
+        folded = 0
+        for event in self.events():
+            if as_of and event["at"] <= as_of:
+                continue
+            _fold(snapshot["jobs"], event)
+            snapshot["as_of"] = max(snapshot["as_of"] or "", event["at"])
+            folded += 1
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(snapshot, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.snapshot_path)
+        self.log_path.write_text("", encoding="utf-8")
+        logger.info("변경 이력 compaction – 이벤트 %d건 → 스냅샷 (공고 %d건)", folded, len(snapshot["jobs"]))
+        return folded
+
+    # ── 조회 ─────────────────────────────────────────────
+
+    def load_snapshot(self) -> dict[str, Any]:
+        """스냅샷을 불러온다 (없으면 빈 스냅샷)."""
+        if not self.snapshot_path.exists():
+            return {"as_of": None, "jobs": {}}
+        try:
+            return json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            logger.error("변경 이력 스냅샷 파싱 실패: %s", exc)
+            return {"as_of": None, "jobs": {}}
+
+    def events(self) -> Iterator[dict[str, Any]]:
+        """아직 접지 않은 로그 이벤트를 순서대로 읽는다 (깨진 줄은 건너뜀)."""
+        if not self.log_path.exists():
+            return
+        with self.log_path.open("r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as exc:
+                    logger.error("변경 이력 %s:%d 파싱 실패: %s", self.log_path, line_no, exc)
+
+    def changes_since(self, since: str) -> list[dict[str, Any]]:
+        """since(ISO 날짜/시각) 이후의 변경 이벤트를 시간순으로 반환한다.
+
+        스냅샷에 접힌 구간은 공고별 최종 상태에서 이벤트를 복원한다.
+        """
+        changes: list[dict[str, Any]] = []
+        for key, state in self.load_snapshot()["jobs"].items():
+            for event, at in (
+                (EVENT_NEW, state.get("first_seen")),
+                (EVENT_UPDATED, state.get("updated_at")),
+                (EVENT_REMOVED, state.get("removed_at")),
+            ):
+                if at and at >= since:
+                    changes.append({"at": at, "event": event, "key": key, "job": state["job"]})
+        changes.extend(event for event in self.events() if event["at"] >= since)
+        changes.sort(key=lambda event: event["at"])
+        return changes
+
+    def history(self, key: str) -> list[dict[str, Any]]:
+        """공고 하나의 변경 이벤트를 시간순으로 반환한다."""
+        return [event for event in self.changes_since("") if event["key"] == key]
+
+
+def _fold(jobs: dict[str, dict[str, Any]], event: dict[str, Any]) -> None:
+    """이벤트 하나를 스냅샷의 공고별 상태에 반영한다.
+
+    first_seen은 new 이벤트로만 정한다. 로그가 생기기 전부터 있던 공고는
+    첫 이벤트가 updated/removed이므로 first_seen이 None으로 남는다.
+    """
+    state = jobs.get(event["key"])
+    if state is None or event["event"] == EVENT_NEW and state.get("removed_at"):
+        # 처음 보는 공고 또는 삭제 후 다시 올라온 공고
+        state = {"first_seen": None, "updated_at": None, "removed_at": None}
+        jobs[event["key"]] = state
+    if event["event"] == EVENT_NEW:
+        state["first_seen"] = event["at"]
+    state["job"] = event["job"]
+    if event["event"] == EVENT_UPDATED:
+        state["updated_at"] = event["at"]
+    elif event["event"] == EVENT_REMOVED:
+        state["removed_at"] = event["at"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="공고 변경 이력 조회")
+    parser.add_argument("--dir", type=Path, default=DEFAULT_HISTORY_DIR)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--since", help="이 날짜/시각(ISO) 이후 변경")
+    group.add_argument("--key", help="공고 unique_key의 이력")
+    args = parser.parse_args()
+
+    log = ChangeLog(args.dir)
+    events = log.history(args.key) if args.key else log.changes_since(args.since)
+    for event in events:
+        job = event["job"]
+        print(f"{event['at']}  {event['event']:<8}{job['company']} – {job['title']} ({event['key']})")
+    print(f"총 {len(events)}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+JSON 인코더/디코더 선택 모듈.
+
+공고 저장 파일(jobs.json, jobs.jsonl)을 읽고 쓸 때 쓰는 JSON 코덱.
+설치된 패키지에 따라 가장 빠른 구현을 고른다.
+
+- orjson: 가장 빠름, 들여쓰기(2칸) 지원
+- msgspec: orjson이 없을 때 사용 (들여쓰기는 msgspec.json.format으로)
+- json (표준 라이브러리): 둘 다 없을 때
+
+어느 쪽이든 UTF-8 바이트를 주고받고, 한글은 이스케이프하지 않는다.
+디코딩 실패는 구현과 관계없이 ValueError로 올린다.
+
+의존성 (선택):
+    pip install orjson
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# orjson / msgspec 가용 여부 플래그
+_ORJSON_AVAILABLE = False
+_MSGSPEC_AVAILABLE = False
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    try:
+        import msgspec
+
+        _MSGSPEC_AVAILABLE = True
+    except ImportError:
+        logger.debug("orjson/msgspec 패키지가 설치되지 않음 – 표준 json 사용")
+
+if _ORJSON_AVAILABLE:
+    BACKEND = "orjson"
+elif _MSGSPEC_AVAILABLE:
+    BACKEND = "msgspec"
+else:
+    BACKEND = "json"
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """obj를 UTF-8 JSON 바이트로 인코딩한다 (indent면 2칸 들여쓰기)."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if _MSGSPEC_AVAILABLE:
+        data = msgspec.json.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """JSON 바이트/문자열을 디코딩한다 (실패하면 ValueError)."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)  # orjson.JSONDecodeError는 ValueError의 하위 클래스
+    if _MSGSPEC_AVAILABLE:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+    return json.loads(data)
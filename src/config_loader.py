@@ -36,12 +36,16 @@ class CompanyConfig:
             - link: 링크 셀렉터 (없으면 title에서 href 추출)
             - location: 근무지 셀렉터 (선택)
             - experience: 경력 조건 셀렉터 (선택)
+        render: 페이지 렌더링 대기 전략 (playwright 소스용, 선택)
+        capture: SPA JSON 응답 캡처 설정 (playwright 소스용, 선택)
     """
 
     name: str
     source: str
     url: str = ""
     selectors: dict[str, str] = field(default_factory=dict)
+    render: dict[str, Any] = field(default_factory=dict)
+    capture: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -85,12 +89,129 @@ class WantedConfig:
         years_min: 최소 경력 (년)
         years_max: 최대 경력 (년)
         keywords: 제목 필터 키워드 (쉼표 구분)
+        incremental: 이미 알고 있는 공고만 있는 페이지에서 페이지 요청을 멈출지 여부
+        full_sweep_days: 증분 모드에서 삭제 감지를 위해 전체 페이지를 훑는 주기 (일, 0이면 안 함)
+        state_path: 마지막 전체 수집 날짜를 기록하는 파일 (리포지토리 루트 기준)
     """
 
     tag_type_ids: str = "518"
     years_min: int = 5
     years_max: int = 7
     keywords: str = "자바,Java,백엔드,Backend,서버,Server,스프링,Spring"
+    incremental: bool = True
+    full_sweep_days: int = 7
+    state_path: str = "data/wanted_state.json"
+
+
+@dataclass
+class ConcurrencyConfig:
+    """기업별 동시 수집 설정.
+
+    Attributes:
+        max_workers: 소스별 기본 동시 수집 기업 수 (1이면 순차 수집)
+        per_host_limit: 같은 호스트에 동시에 보내는 최대 요청 수
+        source_workers: 소스 이름 → 동시 수집 기업 수 (max_workers 덮어쓰기)
+        parallel_sources: 소스 그룹(wanted, saramin, playwright 등)을 동시에 실행할지 여부
+        engine: 수집 엔진 ("thread" = 스레드 풀, "asyncio" = 이벤트 루프)
+        async_max_connections: asyncio 엔진의 전체 동시 연결 수 상한
+        breaker_threshold: 호스트 서킷을 열기 위한 연속 수집 실패 횟수
+    """
+
+    max_workers: int = 1
+    per_host_limit: int = 2
+    source_workers: dict[str, int] = field(default_factory=dict)
+    parallel_sources: bool = True
+    engine: str = "thread"
+    async_max_connections: int = 100
+    breaker_threshold: int = 5
+
+    def workers_for(self, source_name: str) -> int:
+        """소스별 동시 수집 기업 수를 반환한다."""
+        return max(1, self.source_workers.get(source_name, self.max_workers))
+
+
+@dataclass
+class PlaywrightConfig:
+    """Playwright 렌더링 설정.
+
+    Attributes:
+        block_resource_types: 요청을 차단할 리소스 타입 (image, font, media 등)
+        block_domains: 요청을 차단할 도메인 목록 (하위 도메인 포함)
+    """
+
+    block_resource_types: list[str] = field(
+        default_factory=lambda: ["image", "font", "media"]
+    )
+    block_domains: list[str] = field(default_factory=list)
+
+
+@dataclass
+class HttpConfig:
+    """공유 HTTP 클라이언트 설정.
+
+    Attributes:
+        pool_maxsize: 호스트당 유지할 keep-alive 연결 수
+        timeout: 기본 요청 타임아웃 (초)
+        adaptive: 429/503/Retry-After에 따른 호스트별 자동 감속 사용 여부
+        max_rate: 호스트당 최대 초당 요청 수 (0이면 무제한에서 시작)
+        min_rate: 감속 하한 (초당 요청 수)
+        success_threshold: 다시 가속하기 위한 연속 성공 횟수
+        default_retry_after: Retry-After 헤더가 없을 때 멈추는 시간 (초)
+        html_parser: BeautifulSoup 트리 빌더 ("auto", "lxml", "html.parser")
+    """
+
+    pool_maxsize: int = 10
+    timeout: float = 30
+    adaptive: bool = True
+    max_rate: float = 0.0
+    min_rate: float = 0.2
+    success_threshold: int = 20
+    default_retry_after: float = 5.0
+    html_parser: str = "auto"
+
+
+@dataclass
+class DescriptionConfig:
+    """상세 설명(description) 보강 설정.
+
+    Attributes:
+        max_workers: 동시에 상세 페이지를 요청하는 작업 수 (여러 호스트에 분산)
+        rate: 호스트당 초당 요청 수 (토큰 버킷 충전 속도)
+        burst: 호스트당 연속으로 보낼 수 있는 최대 요청 수
+        per_host_limit: 같은 호스트에 동시에 보내는 최대 요청 수
+    """
+
+    max_workers: int = 8
+    rate: float = 2.0
+    burst: int = 2
+    per_host_limit: int = 2
+
+
+@dataclass
+class StorageConfig:
+    """공고 저장소 설정.
+
+    Attributes:
+        backend: 저장소 종류 ("json" = data/jobs.json, "sqlite" = SQLite + JSON 내보내기)
+        sqlite_path: SQLite 파일 경로 (리포지토리 루트 기준)
+        json_export: sqlite 사용 시 git에 커밋하는 data/jobs.json도 함께 쓸지 여부
+        description_blobs: description을 압축 blob 저장소에 두고 공고 파일에는 키만 남길지 여부
+        description_dir: blob 저장소 디렉토리 (리포지토리 루트 기준)
+        compact: 공고 파일을 들여쓰기 없이, 기본값 필드를 빼고 저장할지 여부
+        change_log: 실행마다 신규/삭제/수정 이벤트를 변경 이력 로그에 덧붙일지 여부
+        history_dir: 변경 이력 디렉토리 (리포지토리 루트 기준)
+        compact_after: 변경 이력 로그를 스냅샷으로 접는 이벤트 수 (0이면 접지 않음)
+    """
+
+    backend: str = "json"
+    sqlite_path: str = "data/jobs.sqlite3"
+    json_export: bool = True
+    description_blobs: bool = True
+    description_dir: str = "data/descriptions"
+    compact: bool = False
+    change_log: bool = True
+    history_dir: str = "data/history"
+    compact_after: int = 2000
 
 
 @dataclass
@@ -103,6 +224,11 @@ class AppSettings:
         mock_skip_filter: mock 소스 필터 건너뛰기 여부
         saramin_config: 사람인 검색 설정
         wanted_config: 원티드 검색 설정
+        concurrency: 동시 수집 설정
+        http: 공유 HTTP 클라이언트 설정
+        playwright_config: Playwright 렌더링 설정
+        description: 상세 설명 보강 설정
+        storage: 공고 저장소 설정
     """
 
     companies: list[CompanyConfig] = field(default_factory=list)
@@ -110,6 +236,11 @@ class AppSettings:
     mock_skip_filter: bool = True
     saramin_config: SaraminConfig = field(default_factory=SaraminConfig)
     wanted_config: WantedConfig = field(default_factory=WantedConfig)
+    concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
+    http: HttpConfig = field(default_factory=HttpConfig)
+    playwright_config: PlaywrightConfig = field(default_factory=PlaywrightConfig)
+    description: DescriptionConfig = field(default_factory=DescriptionConfig)
+    storage: StorageConfig = field(default_factory=StorageConfig)
 
 
 # ── 로더 함수 ─────────────────────────────────────────────────
@@ -140,6 +271,8 @@ def load_companies(path: Path | None = None) -> list[CompanyConfig]:
                     source=item["source"].lower().strip(),
                     url=item.get("url", ""),
                     selectors=item.get("selectors", {}),
+                    render=item.get("render", {}) or {},
+                    capture=item.get("capture", {}) or {},
                 )
             )
     logger.info("기업 설정 %d건 로드: %s", len(companies), path)
@@ -188,6 +321,9 @@ def load_settings(
             "keywords",
             "자바,Java,백엔드,Backend,서버,Server,스프링,Spring",
         ),
+        incremental=bool(wt_raw.get("incremental", True)),
+        full_sweep_days=int(wt_raw.get("full_sweep_days", 7)),
+        state_path=str(wt_raw.get("state_path", "data/wanted_state.json")),
     )
 
     logger.info(
@@ -203,15 +339,114 @@ def load_settings(
         saramin_cfg.experience_max,
     )
     logger.info(
-        "원티드 설정 로드 – tag: %s, 경력: %d~%d년, keywords: %s",
+        "원티드 설정 로드 – tag: %s, 경력: %d~%d년, keywords: %s, 증분: %s (전체 %d일 주기)",
         wanted_cfg.tag_type_ids,
         wanted_cfg.years_min,
         wanted_cfg.years_max,
         wanted_cfg.keywords,
+        wanted_cfg.incremental,
+        wanted_cfg.full_sweep_days,
     )
     return exp_filter, mock_skip, saramin_cfg, wanted_cfg
 
 
+def load_concurrency_settings(path: Path | None = None) -> ConcurrencyConfig:
+    """settings.yaml의 concurrency 섹션을 로드한다."""
+    path = path or CONFIG_DIR / "settings.yaml"
+    raw = _load_yaml(path).get("concurrency", {}) or {}
+
+    concurrency = ConcurrencyConfig(
+        max_workers=int(raw.get("max_workers", 1)),
+        per_host_limit=int(raw.get("per_host_limit", 2)),
+        source_workers={
+            str(name).lower().strip(): int(workers)
+            for name, workers in (raw.get("sources", {}) or {}).items()
+        },
+        parallel_sources=bool(raw.get("parallel_sources", True)),
+        engine=str(raw.get("engine", "thread")).lower().strip(),
+        async_max_connections=int(raw.get("async_max_connections", 100)),
+        breaker_threshold=int(raw.get("breaker_threshold", 5)),
+    )
+    logger.info(
+        "동시 수집 설정 로드 – 엔진: %s, 기본 %d, 호스트당 %d, 소스별: %s, 소스 병렬: %s",
+        concurrency.engine,
+        concurrency.max_workers,
+        concurrency.per_host_limit,
+        concurrency.source_workers,
+        concurrency.parallel_sources,
+    )
+    return concurrency
+
+
+def load_http_settings(path: Path | None = None) -> HttpConfig:
+    """settings.yaml의 http 섹션을 로드한다."""
+    path = path or CONFIG_DIR / "settings.yaml"
+    raw = _load_yaml(path).get("http", {}) or {}
+    return HttpConfig(
+        pool_maxsize=int(raw.get("pool_maxsize", 10)),
+        timeout=float(raw.get("timeout", 30)),
+        adaptive=bool(raw.get("adaptive", True)),
+        max_rate=float(raw.get("max_rate", 0)),
+        min_rate=float(raw.get("min_rate", 0.2)),
+        success_threshold=int(raw.get("success_threshold", 20)),
+        default_retry_after=float(raw.get("default_retry_after", 5)),
+        html_parser=str(raw.get("html_parser", "auto")),
+    )
+
+
+def load_playwright_settings(path: Path | None = None) -> PlaywrightConfig:
+    """settings.yaml의 playwright 섹션을 로드한다."""
+    path = path or CONFIG_DIR / "settings.yaml"
+    raw = _load_yaml(path).get("playwright", {}) or {}
+    config = PlaywrightConfig(
+        block_resource_types=[
+            str(t).lower().strip()
+            for t in raw.get("block_resource_types", ["image", "font", "media"]) or []
+        ],
+        block_domains=[
+            str(d).lower().strip().lstrip(".")
+            for d in raw.get("block_domains", []) or []
+        ],
+    )
+    logger.info(
+        "Playwright 설정 로드 – 차단 타입: %s, 차단 도메인 %d개",
+        config.block_resource_types,
+        len(config.block_domains),
+    )
+    return config
+
+
+def load_description_settings(path: Path | None = None) -> DescriptionConfig:
+    """settings.yaml의 description 섹션을 로드한다."""
+    path = path or CONFIG_DIR / "settings.yaml"
+    raw = _load_yaml(path).get("description", {}) or {}
+    return DescriptionConfig(
+        max_workers=int(raw.get("max_workers", 8)),
+        rate=float(raw.get("rate", 2.0)),
+        burst=int(raw.get("burst", 2)),
+        per_host_limit=int(raw.get("per_host_limit", 2)),
+    )
+
+
+def load_storage_settings(path: Path | None = None) -> StorageConfig:
+    """settings.yaml의 storage 섹션을 로드한다."""
+    path = path or CONFIG_DIR / "settings.yaml"
+    raw = _load_yaml(path).get("storage", {}) or {}
+    config = StorageConfig(
+        backend=str(raw.get("backend", "json")).lower().strip(),
+        sqlite_path=str(raw.get("sqlite_path", "data/jobs.sqlite3")),
+        json_export=bool(raw.get("json_export", True)),
+        description_blobs=bool(raw.get("description_blobs", True)),
+        description_dir=str(raw.get("description_dir", "data/descriptions")),
+        compact=bool(raw.get("compact", False)),
+        change_log=bool(raw.get("change_log", True)),
+        history_dir=str(raw.get("history_dir", "data/history")),
+        compact_after=int(raw.get("compact_after", 2000)),
+    )
+    logger.info("저장소 설정 로드 – backend: %s", config.backend)
+    return config
+
+
 def load_app_settings() -> AppSettings:
     """전체 설정을 한 번에 로드한다."""
     companies = load_companies()
@@ -222,4 +457,9 @@ def load_app_settings() -> AppSettings:
         mock_skip_filter=mock_skip,
         saramin_config=saramin_cfg,
         wanted_config=wanted_cfg,
+        concurrency=load_concurrency_settings(),
+        http=load_http_settings(),
+        playwright_config=load_playwright_settings(),
+        description=load_description_settings(),
+        storage=load_storage_settings(),
     )
@@ -4,20 +4,87 @@
 각 소스 플러그인의 fetch_description() 메서드에 위임하여
 소스별 상세 페이지 크롤링 로직을 수행한다.
 이전 실행에서 이미 description이 있는 공고는 건너뛴다.
+
+상세 페이지는 스레드 풀로 동시에 요청하되, 호스트마다 토큰 버킷을 두어
+같은 사이트에는 설정된 속도(rate/burst) 이내로만 요청한다.
+서로 다른 호스트의 공고는 병렬로 진행된다.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
+from config_loader import DescriptionConfig
 from models import JobPosting
+from run_stats import RUN_STATS
 from sources.base import BaseSource
+from throttle import HostLimiter, HostRateLimiter, host_of
 
 logger = logging.getLogger(__name__)
 
-# 요청 간 딜레이 (초) – 사이트 부하/차단 방지
-_REQUEST_DELAY = 0.5
+# 진행 로그 간격 (완료 건수 기준)
+_PROGRESS_EVERY = 20
+
+
+@dataclass
+class _HostProgress:
+    """호스트별 처리량 집계."""
+
+    requests: int = 0
+    fetched: int = 0
+    started: float = 0.0
+    finished: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """초당 요청 수 (첫 요청 시작 ~ 마지막 요청 완료 기준)."""
+        elapsed = self.finished - self.started
+        return self.requests / elapsed if elapsed > 0 else 0.0
+
+
+class _Progress:
+    """여러 작업 스레드에서 갱신하는 진행 상황 / 호스트별 처리량."""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+        self.fetched = 0
+        self.hosts: dict[str, _HostProgress] = {}
+        self._lock = threading.Lock()
+
+    def start(self, host: str) -> None:
+        with self._lock:
+            entry = self.hosts.setdefault(host, _HostProgress())
+            if not entry.started:
+                entry.started = time.monotonic()
+
+    def finish(self, host: str, ok: bool) -> None:
+        with self._lock:
+            entry = self.hosts[host]
+            entry.requests += 1
+            entry.finished = time.monotonic()
+            self.done += 1
+            if ok:
+                entry.fetched += 1
+                self.fetched += 1
+            if self.done % _PROGRESS_EVERY == 0:
+                logger.info(
+                    "[description] 진행 %d/%d (수집 %d건) – %s",
+                    self.done,
+                    self.total,
+                    self.fetched,
+                    self.throughput_text(),
+                )
+
+    def throughput_text(self) -> str:
+        return ", ".join(
+            f"{host or '-'} {entry.throughput:.1f}req/s"
+            for host, entry in sorted(self.hosts.items())
+        )
 
 
 def enrich_descriptions(
@@ -25,36 +92,41 @@ def enrich_descriptions(
     source_registry: dict[str, BaseSource],
     company_selectors: dict[str, dict[str, str]] | None = None,
     previous_jobs: list[JobPosting] | None = None,
+    config: DescriptionConfig | None = None,
 ) -> None:
     """공고 목록에 description을 보강한다 (in-place).
 
     1. 이전 데이터에 description이 있으면 복사한다.
     2. description이 없는 공고만 해당 소스 플러그인의
        fetch_description()을 호출하여 상세 페이지를 크롤링한다.
+       (호스트별 토큰 버킷으로 속도를 제한하며 동시에 요청)
 
     Args:
         jobs: description을 보강할 공고 목록
         source_registry: 소스 이름 → BaseSource 인스턴스 매핑
         company_selectors: 회사 이름 → selectors 딕셔너리 매핑 (companies.yaml에서 로드)
         previous_jobs: 이전 실행의 공고 목록 (description 재활용용)
+        config: 동시성/속도 제한 설정 (None이면 기본값)
     """
     company_selectors = company_selectors or {}
+    config = config or DescriptionConfig()
 
-    # 이전 description 캐시 (unique_key → description)
-    prev_desc: dict[str, str] = {}
+    # description이 있는 이전 공고 (unique_key → 공고)
+    # 지연 로드된 본문은 읽지 않고 로더째 넘긴다.
+    prev_with_desc: dict[str, JobPosting] = {}
     if previous_jobs:
         for job in previous_jobs:
-            if job.description:
-                prev_desc[job.unique_key] = job.description
+            if job.has_description:
+                prev_with_desc[job.unique_key] = job
 
     # 이전 데이터에서 description 복사
     need_fetch: list[JobPosting] = []
     for job in jobs:
-        if job.description:
+        if job.has_description:
             continue
-        if job.unique_key in prev_desc:
-            job.description = prev_desc[job.unique_key]
-        else:
+        if job.unique_key in prev_with_desc:
+            job.copy_description_from(prev_with_desc[job.unique_key])
+        elif job.source in source_registry:
             need_fetch.append(job)
 
     if not need_fetch:
@@ -62,33 +134,49 @@ def enrich_descriptions(
         return
 
     logger.info(
-        "[description] %d건의 신규 공고에서 상세 설명 수집 시작",
+        "[description] %d건의 신규 공고에서 상세 설명 수집 시작 "
+        "(작업 %d개, 호스트당 %.1freq/s, burst %d)",
         len(need_fetch),
+        config.max_workers,
+        config.rate,
+        config.burst,
     )
 
-    fetched = 0
-    for i, job in enumerate(need_fetch, 1):
-        source = source_registry.get(job.source)
-        if not source:
-            continue
+    rate_limiter = HostRateLimiter(config.rate, config.burst)
+    host_limiter = HostLimiter(config.per_host_limit)
+    progress = _Progress(len(need_fetch))
+    started = time.perf_counter()
 
+    def enrich(job: JobPosting) -> None:
+        source = source_registry[job.source]
+        host = host_of(job.url) or source.default_host
         # 해당 회사의 selectors 전달
         selectors = company_selectors.get(job.company, {})
-        desc = source.fetch_description(job, selectors=selectors)
-        if desc:
-            job.description = desc
-            fetched += 1
-
-        if i % 20 == 0:
-            logger.info(
-                "[description] 진행 %d/%d (수집 %d건)",
-                i, len(need_fetch), fetched,
-            )
-
-        # 요청 간 딜레이
-        time.sleep(_REQUEST_DELAY)
-
+        with host_limiter.slot(host):
+            rate_limiter.acquire(host)
+            progress.start(host)
+            desc = ""
+            try:
+                desc = source.fetch_description(job, selectors=selectors)
+            except Exception as exc:
+                logger.debug("[description] %s 상세 수집 실패: %s", job.url, exc)
+            if desc:
+                job.description = desc
+            progress.finish(host, bool(desc))
+
+    workers = max(1, min(config.max_workers, len(need_fetch)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="description") as pool:
+        # 결과는 job 객체에 직접 기록되므로 완료만 기다린다.
+        list(pool.map(enrich, need_fetch))
+
+    elapsed = time.perf_counter() - started
+    for host, entry in progress.hosts.items():
+        RUN_STATS.set("description_req_per_s", host or "-", round(entry.throughput, 2))
+    RUN_STATS.set("description", "wall_time_s", elapsed)
     logger.info(
-        "[description] 완료 – %d/%d건 상세 설명 수집",
-        fetched, len(need_fetch),
+        "[description] 완료 – %d/%d건 상세 설명 수집, %.1f초 (%s)",
+        progress.fetched,
+        len(need_fetch),
+        elapsed,
+        progress.throughput_text(),
     )
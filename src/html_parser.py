@@ -0,0 +1,103 @@
+"""
+HTML 파서 모듈 – 모든 BeautifulSoup 소스가 같은 트리 빌더를 쓰도록 한다.
+
+BeautifulSoup 위에서 CSS 셀렉터(soupsieve)를 그대로 쓰므로
+companies.yaml의 selectors 의미는 백엔드와 관계없이 같다.
+바뀌는 것은 HTML을 트리로 만드는 빌더뿐이다.
+
+- "lxml": C로 구현된 lxml 빌더 (html.parser보다 수 배 빠름)
+- "html.parser": 파이썬 표준 라이브러리 빌더 (추가 설치 불필요)
+- "auto": lxml이 설치되어 있으면 lxml, 없으면 html.parser
+
+settings.yaml의 http.html_parser로 지정한다.
+
+소스는 parse_only(SoupStrainer)로 필요한 부분 트리만 만들 수 있다.
+(예: 공고 카드 요소만 파싱하고, 못 찾으면 전체 트리로 폴백)
+
+파싱 시간은 실행 통계에 입력 종류별로 누적한다.
+바이트 입력(http_client.HtmlPage)은 디코딩이 파서 안에서 일어나므로 "디코딩 + 파싱" 시간이다.
+    html_parse_ms / html_parse_pages   키: "bytes:<인코딩>" 또는 "str"
+
+의존성 (선택):
+    pip install lxml
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from run_stats import RUN_STATS
+
+logger = logging.getLogger(__name__)
+
+# lxml 가용 여부 플래그
+_LXML_AVAILABLE = False
+try:
+    import lxml  # noqa: F401
+
+    _LXML_AVAILABLE = True
+except ImportError:
+    logger.debug("lxml 패키지가 설치되지 않음 – html.parser 사용")
+
+# 지원하는 백엔드 이름
+BACKENDS = ("auto", "lxml", "html.parser")
+
+# 현재 사용 중인 BeautifulSoup 트리 빌더
+_features = "lxml" if _LXML_AVAILABLE else "html.parser"
+
+
+def resolve_backend(backend: str) -> str:
+    """설정값을 실제 사용할 트리 빌더 이름으로 바꾼다."""
+    backend = backend.lower().strip()
+    if backend not in BACKENDS:
+        logger.warning("알 수 없는 html_parser '%s' – auto로 대체", backend)
+        backend = "auto"
+    if backend == "html.parser":
+        return backend
+    if not _LXML_AVAILABLE:
+        if backend == "lxml":
+            logger.warning("lxml 미설치 – html.parser로 대체합니다 (pip install lxml)")
+        return "html.parser"
+    return "lxml"
+
+
+def configure(backend: str = "auto") -> None:
+    """모든 소스가 사용할 HTML 파서 백엔드를 지정한다."""
+    global _features
+    _features = resolve_backend(backend)
+    logger.info("HTML 파서 백엔드: %s", _features)
+
+
+def current_backend() -> str:
+    """현재 사용 중인 트리 빌더 이름을 반환한다."""
+    return _features
+
+
+def parse_html(
+    html: str | bytes,
+    parse_only: SoupStrainer | None = None,
+    backend: str | None = None,
+    encoding: str | None = None,
+) -> BeautifulSoup:
+    """HTML을 현재 백엔드로 파싱한다.
+
+    Args:
+        html: 파싱할 HTML (바이트면 encoding으로 파서가 직접 디코딩)
+        parse_only: 지정하면 일치하는 요소(와 그 하위 요소)만 트리로 만든다
+        backend: 이번 호출에만 쓸 백엔드 (None이면 configure()로 지정한 값)
+        encoding: html이 바이트일 때의 인코딩 (http_client.HtmlPage.encoding)
+    """
+    features = resolve_backend(backend) if backend else _features
+    started = time.perf_counter()
+    if isinstance(html, bytes):
+        key = f"bytes:{encoding or 'auto'}"
+        soup = BeautifulSoup(html, features, parse_only=parse_only, from_encoding=encoding)
+    else:
+        key = "str"
+        soup = BeautifulSoup(html, features, parse_only=parse_only)
+    RUN_STATS.add("html_parse_ms", key, (time.perf_counter() - started) * 1000)
+    RUN_STATS.add("html_parse_pages", key)
+    return soup
@@ -0,0 +1,336 @@
+"""
+공유 HTTP 클라이언트 모듈.
+
+모든 소스와 상세 설명 크롤링이 같은 requests.Session을 사용하도록 하여
+호스트별 커넥션 풀/keep-alive로 TCP+TLS 핸드셰이크를 재사용한다.
+
+- 기본 헤더(User-Agent, Accept-Language, Accept-Encoding)와 타임아웃을 한 곳에서 관리
+- gzip/deflate 압축 협상 (brotli/zstd 패키지가 설치되어 있으면 br/zstd도 협상)
+- 호스트별 요청 수 / 새 연결 수 카운터 (커넥션 재사용률 확인용)
+- 429/503/Retry-After 응답에 따라 호스트별 속도를 조절하는 적응형 제한기
+  (목록 수집과 상세 설명 크롤링이 같은 제한기를 공유)
+- HTML 응답은 resp.text 대신 원본 바이트와 인코딩(헤더 → <meta> → 호스트 캐시 순)을
+  그대로 파서에 넘긴다 (get_html). requests의 본문 전체 charset 추측을 피한다.
+
+소스에서는 요청마다 달라지는 헤더(Accept, Referer 등)만 넘기면 된다.
+
+사용 예시:
+    from http_client import get
+
+    resp = get(url, headers={"Referer": "https://example.com/"})
+"""
+
+from __future__ import annotations
+
+import codecs
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from run_stats import RUN_STATS
+from throttle import AdaptiveRateLimiter, host_of
+
+logger = logging.getLogger(__name__)
+
+# ── 공통 헤더 / 타임아웃 ──────────────────────────────────────
+
+# 브라우저 위장용 User-Agent (Playwright 컨텍스트와 공유)
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# HTML 페이지 요청용 Accept
+ACCEPT_HTML = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+
+# JSON API 요청용 Accept
+ACCEPT_JSON = "application/json, text/plain, */*"
+
+# 모든 요청에 붙는 기본 헤더
+# Accept-Encoding은 urllib3가 실제로 디코딩할 수 있는 방식만 광고한다.
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept": ACCEPT_HTML,
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# 목록 페이지 요청 타임아웃 (초)
+DEFAULT_TIMEOUT = 30
+
+# 상세 페이지(description) 요청 타임아웃 (초)
+DETAIL_TIMEOUT = 15
+
+# <meta charset> 탐색 범위 (바이트, HTML 표준의 prescan 범위)
+_META_SNIFF_BYTES = 1024 * 4
+
+# 인코딩 선언이 없을 때 UTF-8 여부를 확인하는 범위 (바이트)
+_UTF8_PROBE_BYTES = 1024 * 64
+
+# 선언도 없고 UTF-8도 아닐 때 쓰는 인코딩 (EUC-KR 상위 호환)
+_FALLBACK_ENCODING = "cp949"
+
+_CHARSET_HEADER = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_CHARSET_META = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+@dataclass
+class HostConnectionStats:
+    """호스트별 커넥션 사용 통계.
+
+    Attributes:
+        requests: 보낸 요청 수
+        connections: 새로 연 TCP 연결 수
+    """
+
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        """기존 연결을 재사용한 요청 수."""
+        return max(0, self.requests - self.connections)
+
+
+@dataclass
+class HtmlPage:
+    """디코딩하지 않은 HTML 응답.
+
+    Attributes:
+        content: 응답 본문 바이트
+        encoding: 선언되었거나 추정한 인코딩 (파서에 from_encoding으로 전달)
+        url: 리다이렉트 후 최종 URL
+    """
+
+    content: bytes
+    encoding: str
+    url: str
+
+
+class EncodingDetector:
+    """HTML 본문의 인코딩을 정한다.
+
+    Content-Type 헤더 → BOM → 앞부분 <meta charset> 순으로 선언을 찾고,
+    선언이 없으면 호스트별로 캐시한 값을 쓰거나 앞부분이 UTF-8로 읽히는지만 확인한다.
+    같은 사이트는 페이지마다 같은 인코딩을 쓰므로 추정 결과를 호스트 단위로 캐시한다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_host: dict[str, str] = {}
+
+    def detect(self, host: str, content_type: str | None, body: bytes) -> str:
+        """본문 인코딩을 정하고, 판별에 걸린 시간(ms)을 호스트별 실행 통계에 누적한다.
+
+        실제 디코딩은 파싱 단계에서 하며, 그 시간은 html_parser가 html_parse_ms로 따로 잰다.
+        """
+        started = time.perf_counter()
+        encoding = self._detect(host, content_type, body)
+        RUN_STATS.add("encoding_detect_ms", host, (time.perf_counter() - started) * 1000)
+        RUN_STATS.set("html_encoding", host, encoding)
+        return encoding
+
+    def _detect(self, host: str, content_type: str | None, body: bytes) -> str:
+        declared = _declared_encoding(content_type, body)
+        if declared:
+            return declared
+        with self._lock:
+            cached = self._by_host.get(host)
+        if cached:
+            return cached
+        encoding = _probe_encoding(body)
+        with self._lock:
+            self._by_host[host] = encoding
+        logger.debug("[http] %s – 인코딩 선언 없음, %s로 추정", host, encoding)
+        return encoding
+
+
+def _normalize_encoding(name: str) -> str | None:
+    """파이썬이 아는 인코딩 이름으로 바꾼다 (모르면 None).
+
+    브라우저처럼 euc-kr 선언은 확장 문자까지 포함하는 cp949로 읽는다.
+    """
+    try:
+        encoding = codecs.lookup(name).name
+    except LookupError:
+        return None
+    return _FALLBACK_ENCODING if encoding == "euc_kr" else encoding
+
+
+def _declared_encoding(content_type: str | None, body: bytes) -> str | None:
+    match = _CHARSET_HEADER.search(content_type or "")
+    if match and (encoding := _normalize_encoding(match.group(1))):
+        return encoding
+    for bom, encoding in _BOMS:
+        if body.startswith(bom):
+            return encoding
+    match = _CHARSET_META.search(body[:_META_SNIFF_BYTES])
+    if match:
+        return _normalize_encoding(match.group(1).decode("ascii", "ignore"))
+    return None
+
+
+def _probe_encoding(body: bytes) -> str:
+    """본문 앞부분이 UTF-8로 읽히면 utf-8, 아니면 cp949를 반환한다."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        decoder.decode(body[:_UTF8_PROBE_BYTES], final=False)
+    except UnicodeDecodeError:
+        return _FALLBACK_ENCODING
+    return "utf-8"
+
+
+# 스레드/asyncio 엔진이 공유하는 호스트별 인코딩 캐시
+ENCODINGS = EncodingDetector()
+
+
+class HttpClient:
+    """호스트별 커넥션 풀을 가진 공유 HTTP 클라이언트.
+
+    requests.Session은 GET 위주의 사용에서 스레드 간 공유가 가능하며,
+    pool_maxsize는 호스트당 동시 요청 수(per_host_limit) 이상으로 둔다.
+    pool_connections는 풀을 유지할 호스트 수로, 넘치면 오래된 풀부터 닫힌다.
+
+    Attributes:
+        timeout: 기본 요청 타임아웃 (초)
+        rate_limiter: 호스트별 적응형 속도 제한기 (None이면 제한 없음)
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 32,
+        pool_maxsize: int = 10,
+        timeout: float = DEFAULT_TIMEOUT,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self._session = requests.Session()
+        self._session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._adapter = adapter
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        """GET 요청을 보낸다. headers는 기본 헤더 위에 덮어쓴다."""
+        host = host_of(url)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(host)
+        resp = self._session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout or self.timeout,
+        )
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(host, resp.status_code, resp.headers.get("Retry-After"))
+        return resp
+
+    def get_html(self, url: str, **kwargs: Any) -> HtmlPage:
+        """GET 요청 후 본문을 디코딩하지 않은 채 인코딩과 함께 반환한다.
+
+        4xx/5xx 응답이면 requests.HTTPError를 발생시킨다.
+        """
+        resp = self.get(url, **kwargs)
+        resp.raise_for_status()
+        encoding = ENCODINGS.detect(host_of(resp.url), resp.headers.get("Content-Type"), resp.content)
+        return HtmlPage(resp.content, encoding, resp.url)
+
+    def connection_stats(self) -> dict[str, HostConnectionStats]:
+        """urllib3 커넥션 풀의 누적 카운터를 호스트별로 합산해 반환한다."""
+        stats: dict[str, HostConnectionStats] = {}
+        pools = self._adapter.poolmanager.pools
+        with self._lock:
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                host = (pool.host or "").lower()
+                entry = stats.setdefault(host, HostConnectionStats())
+                entry.requests += pool.num_requests
+                entry.connections += pool.num_connections
+        return stats
+
+    def close(self) -> None:
+        """세션과 풀에 남은 연결을 닫는다."""
+        self._session.close()
+
+
+# ── 프로세스 전역 클라이언트 ──────────────────────────────────
+
+_client: HttpClient | None = None
+_client_lock = threading.Lock()
+
+
+def configure(
+    pool_maxsize: int = 10,
+    timeout: float = DEFAULT_TIMEOUT,
+    rate_limiter: AdaptiveRateLimiter | None = None,
+) -> HttpClient:
+    """전역 클라이언트를 주어진 설정으로 (재)생성한다."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = HttpClient(
+            pool_maxsize=pool_maxsize,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+        )
+        return _client
+
+
+def get_client() -> HttpClient:
+    """전역 클라이언트를 반환한다 (없으면 기본 설정으로 생성)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(rate_limiter=AdaptiveRateLimiter())
+        return _client
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    """전역 클라이언트로 GET 요청을 보낸다."""
+    return get_client().get(url, **kwargs)
+
+
+def get_html(url: str, **kwargs: Any) -> HtmlPage:
+    """전역 클라이언트로 HTML 페이지를 요청한다 (본문은 바이트 그대로)."""
+    return get_client().get_html(url, **kwargs)
+
+
+def log_connection_stats() -> dict[str, HostConnectionStats]:
+    """호스트별 커넥션 재사용 통계를 로그로 남기고 반환한다."""
+    stats = get_client().connection_stats()
+    for host, s in sorted(stats.items(), key=lambda kv: kv[1].requests, reverse=True):
+        logger.info(
+            "[http] %s – 요청 %d건, 새 연결 %d개, 재사용 %d건",
+            host,
+            s.requests,
+            s.connections,
+            s.reused,
+        )
+    return stats
@@ -0,0 +1,102 @@
+"""
+공고 식별자 모듈 – 소스 고유 ID 추출과 URL 정규화.
+
+제목/지역 문구가 조금만 바뀌어도 고유키가 달라지지 않도록,
+소스가 부여한 공고 ID를 꺼내 JobPosting.unique_key의 기준으로 쓴다.
+
+소스별 고유 ID:
+    wanted      https://www.wanted.co.kr/wd/{id}
+    greetinghr  https://{기업}.career.greetinghr.com/ko/o/{id}   (ID는 기업별 번호이므로 "{호스트}|{id}")
+    saramin     .../zf_user/jobs/relay/view?rec_idx={id}
+    linkedin    https://www.linkedin.com/jobs/view/{slug}-{id}
+
+URL 정규화는 추적용 쿼리 파라미터(utm_*, fbclid, trk 등)를 지우고
+호스트를 소문자로 맞춘다. 사람인처럼 공고 URL에 검색 맥락 파라미터가 붙는
+사이트는 공고를 가리키는 파라미터만 남긴다.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 지우는 추적용 쿼리 파라미터 (이름 / 접두어)
+_TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "refid", "trackingid", "trk"}
+)
+_TRACKING_PREFIXES = ("utm_", "t_ref", "trk_")
+
+# 호스트(접미어) → 남길 쿼리 파라미터 (나머지는 모두 제거)
+_KEEP_PARAMS: dict[str, frozenset[str]] = {
+    "saramin.co.kr": frozenset({"rec_idx"}),
+}
+
+_WANTED_ID = re.compile(r"/wd/(\d+)")
+_GREETINGHR_ID = re.compile(r"/[a-z]{2}/o/(\d+)")
+_LINKEDIN_ID = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)")
+
+
+def canonicalize_url(url: str) -> str:
+    """공고 URL을 정규화한다 (추적 파라미터 제거, 호스트 소문자).
+
+    쿼리가 없는 URL은 그대로 둔다 (불러올 때마다 다시 정규화하므로 빠른 경로).
+    fragment는 SPA 라우팅에 쓰일 수 있으므로 그대로 둔다.
+    """
+    if not url or "?" not in url or "://" not in url:
+        return url
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    keep = next((names for suffix, names in _KEEP_PARAMS.items() if host.endswith(suffix)), None)
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if (name in keep if keep is not None else not _is_tracking(name))
+    ]
+    return urlunsplit((parts.scheme.lower(), host, parts.path, urlencode(query), parts.fragment))
+
+
+def _is_tracking(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in _TRACKING_PARAMS or lowered.startswith(_TRACKING_PREFIXES)
+
+
+def _path_id(pattern: re.Pattern[str]) -> Callable[[str], str]:
+    def extract(url: str) -> str:
+        # urlsplit보다 훨씬 싸고, 공고 ID는 쿼리 앞(경로)에만 있다
+        match = pattern.search(url.partition("?")[0])
+        return match.group(1) if match else ""
+
+    return extract
+
+
+def _greetinghr_id(url: str) -> str:
+    # 공고 번호는 기업(테넌트) 안에서만 유일하므로 호스트를 붙인다
+    head = url.partition("?")[0]
+    match = _GREETINGHR_ID.search(head)
+    if not match:
+        return ""
+    host = head.partition("://")[2].partition("/")[0].lower()
+    return f"{host}|{match.group(1)}"
+
+
+def _saramin_id(url: str) -> str:
+    value = dict(parse_qsl(urlsplit(url).query)).get("rec_idx", "")
+    return value if value.isdigit() else ""
+
+
+# 소스 이름 → URL에서 고유 ID를 꺼내는 함수
+_NATIVE_ID_EXTRACTORS: dict[str, Callable[[str], str]] = {
+    "wanted": _path_id(_WANTED_ID),
+    "greetinghr": _greetinghr_id,
+    "saramin": _saramin_id,
+    "linkedin": _path_id(_LINKEDIN_ID),
+}
+
+
+def native_id(source: str, url: str) -> str:
+    """소스가 부여한 공고 ID를 반환한다 (지원하지 않는 소스이거나 없으면 빈 문자열)."""
+    extract = _NATIVE_ID_EXTRACTORS.get(source)
+    if extract is None or not url:
+        return ""
+    return extract(url)
@@ -14,18 +14,26 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
 
 # ── sys.path에 src 디렉토리 추가 (패키지 임포트 지원) ──────────
 SRC_DIR = Path(__file__).resolve().parent
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from config_loader import AppSettings, CompanyConfig, load_app_settings
+import html_parser
+import http_client
+from async_engine import run_async_collection
+from change_log import ChangeLog
+from config_loader import AppSettings, CompanyConfig, HttpConfig, load_app_settings
 from markdown import write_markdown
 from models import JobPosting
 from notify.emailer import send_email
+from run_stats import RUN_STATS
 from sources.base import BaseSource
 from sources.career_page import CareerPageSource
 from sources.greetinghr import GreetingHRSource
@@ -34,8 +42,9 @@ from sources.mock_source import MockSource
 from sources.playwright_source import PlaywrightSource
 from sources.saramin import SaraminSource
 from sources.wanted import WantedSource
-from storage import compute_diff, load_jobs, save_jobs
+from storage import ROOT_DIR, open_job_store
 from description_fetcher import enrich_descriptions
+from throttle import HOST_BREAKER, AdaptiveRateLimiter, HostLimiter
 
 # ── 로깅 설정 ──────────────────────────────────────────────────
 logging.basicConfig(
@@ -48,13 +57,12 @@ logger = logging.getLogger(__name__)
 # ── 소스 레지스트리 ────────────────────────────────────────────
 # 소스 이름(companies.yaml의 source 필드)과 소스 인스턴스를 매핑한다.
 # 새 소스를 추가하면 여기에 등록하라.
-# saramin/wanted는 설정 의존적이므로 build_source_registry()에서 초기화된다.
+# saramin/wanted/playwright는 설정 의존적이므로 build_source_registry()에서 초기화된다.
 _STATIC_SOURCES: dict[str, BaseSource] = {
     "mock": MockSource(),
     "linkedin": LinkedInSource(),
     "career": CareerPageSource(),        # 회사 공식 채용 페이지 범용 크롤러
     "greetinghr": GreetingHRSource(),    # GreetingHR 플랫폼 (카카오페이 등)
-    "playwright": PlaywrightSource(),    # SPA 사이트 (JS 렌더링 필요)
 }
 
 
@@ -62,15 +70,64 @@ def build_source_registry(settings: AppSettings) -> dict[str, BaseSource]:
     """설정에 따라 소스 레지스트리를 생성한다."""
     registry = dict(_STATIC_SOURCES)
     registry["saramin"] = SaraminSource(config=settings.saramin_config)
-    registry["wanted"] = WantedSource(config=settings.wanted_config)
+    registry["wanted"] = WantedSource(
+        config=settings.wanted_config,
+        state_path=ROOT_DIR / settings.wanted_config.state_path,
+    )
+    registry["playwright"] = PlaywrightSource(config=settings.playwright_config)  # SPA 사이트
     return registry
 
 
-def collect_all(settings: AppSettings) -> list[JobPosting]:
+def _collect_source(
+    source_name: str,
+    source: BaseSource,
+    companies: list[CompanyConfig],
+    settings: AppSettings,
+    host_limiter: HostLimiter,
+) -> list[JobPosting]:
+    """소스 하나에 할당된 기업 공고를 수집하고 소요 시간을 기록한다."""
+    logger.info(
+        "━━━ [%s] 수집 시작 – 기업 %d개 ━━━",
+        source_name,
+        len(companies),
+    )
+    started = time.perf_counter()
+
+    # mock 소스는 필터 건너뛰기 설정 적용
+    skip_filter = settings.mock_skip_filter if source_name == "mock" else False
+    max_workers = min(settings.concurrency.workers_for(source_name), len(companies))
+
+    source.open(max_workers)
+    jobs = source.fetch_all_companies(
+        companies=companies,
+        exp_filter=settings.experience_filter,
+        skip_filter=skip_filter,
+        max_workers=max_workers,
+        host_limiter=host_limiter,
+    )
+
+    elapsed = time.perf_counter() - started
+    RUN_STATS.set("source_wall_time_s", source_name, elapsed)
+    logger.info(
+        "━━━ [%s] 수집 종료 – %d건, %.1f초 ━━━",
+        source_name,
+        len(jobs),
+        elapsed,
+    )
+    return jobs
+
+
+def collect_all(
+    settings: AppSettings,
+    previous_jobs: Iterable[JobPosting] | None = None,
+    source_registry: dict[str, BaseSource] | None = None,
+) -> list[JobPosting]:
     """설정에 따라 모든 소스에서 공고를 수집하여 합친다.
 
     1. companies.yaml의 기업을 source별로 그룹핑한다.
-    2. 각 소스 플러그인에 해당 기업 목록을 전달한다.
+    2. 각 소스 플러그인에 해당 기업 목록(과 이전 실행의 공고)을 전달한다.
+       이전 공고는 한 번만 훑고, uses_known_jobs인 소스의 공고만 모은다.
+       (parallel_sources 설정 시 소스 그룹을 동시에 실행한다.)
     3. 경력 필터를 적용한다.
     4. 중복을 제거한다.
     """
@@ -79,11 +136,16 @@ def collect_all(settings: AppSettings) -> list[JobPosting]:
     for company in settings.companies:
         source_groups[company.source].append(company)
 
-    # 설정 기반 소스 레지스트리 생성
-    source_registry = build_source_registry(settings)
+    # 설정 기반 소스 레지스트리 (없으면 생성)
+    if source_registry is None:
+        source_registry = build_source_registry(settings)
 
-    all_jobs: list[JobPosting] = []
+    # 모든 소스가 공유하는 호스트별 동시 요청 제한기
+    host_limiter = HostLimiter(settings.concurrency.per_host_limit)
+    # 호스트별 서킷 브레이커는 실행마다 닫힌 상태로 시작한다.
+    HOST_BREAKER.reset(settings.concurrency.breaker_threshold)
 
+    runnable: list[tuple[str, BaseSource, list[CompanyConfig]]] = []
     for source_name, companies in source_groups.items():
         source = source_registry.get(source_name)
         if source is None:
@@ -94,23 +156,64 @@ def collect_all(settings: AppSettings) -> list[JobPosting]:
                 [c.name for c in companies],
             )
             continue
-
+        runnable.append((source_name, source, companies))
+
+    known_sources = {source.name for _, source, _ in runnable if source.uses_known_jobs}
+    known_jobs: dict[str, list[JobPosting]] = defaultdict(list)
+    if known_sources:
+        for job in previous_jobs or ():
+            if job.source in known_sources:
+                known_jobs[job.source].append(job)
+    for _, source, _ in runnable:
+        if source.uses_known_jobs:
+            source.set_known_jobs(known_jobs[source.name])
+
+    # 소스별 결과는 완료 순서와 무관하게 source_groups 순서로 모은다.
+    # (중복 제거 시 어느 소스의 공고가 남는지가 실행마다 달라지지 않도록)
+    results: list[list[JobPosting]] = []
+    started = time.perf_counter()
+
+    try:
+        if settings.concurrency.engine == "asyncio":
+            results = run_async_collection(runnable, settings)
+        elif settings.concurrency.parallel_sources and len(runnable) > 1:
+            with ThreadPoolExecutor(max_workers=len(runnable), thread_name_prefix="source") as pool:
+                futures = [
+                    pool.submit(_collect_source, name, source, companies, settings, host_limiter)
+                    for name, source, companies in runnable
+                ]
+                for (name, _, _), future in zip(runnable, futures):
+                    try:
+                        results.append(future.result())
+                    except Exception as exc:
+                        logger.error("[%s] 소스 수집 중 예외 발생: %s", name, exc)
+                        results.append([])
+        else:
+            for name, source, companies in runnable:
+                try:
+                    results.append(_collect_source(name, source, companies, settings, host_limiter))
+                except Exception as exc:
+                    logger.error("[%s] 소스 수집 중 예외 발생: %s", name, exc)
+                    results.append([])
+    finally:
+        # 브라우저 등 소스가 공유하던 자원 정리
+        for _, source, _ in runnable:
+            try:
+                source.close()
+            except Exception as exc:
+                logger.warning("[%s] 소스 종료 중 오류: %s", source.name, exc)
+
+    all_jobs = [job for jobs in results for job in jobs]
+
+    wall_times = RUN_STATS.section("source_wall_time_s")
+    if wall_times:
+        ranking = sorted(wall_times.items(), key=lambda kv: kv[1], reverse=True)
         logger.info(
-            "━━━ [%s] 수집 시작 – 기업 %d개 ━━━",
-            source_name,
-            len(companies),
+            "소스별 소요 시간 (전체 %.1f초): %s",
+            time.perf_counter() - started,
+            ", ".join(f"{name} {sec:.1f}초" for name, sec in ranking),
         )
 
-        # mock 소스는 필터 건너뛰기 설정 적용
-        skip_filter = settings.mock_skip_filter if source_name == "mock" else False
-
-        jobs = source.fetch_all_companies(
-            companies=companies,
-            exp_filter=settings.experience_filter,
-            skip_filter=skip_filter,
-        )
-        all_jobs.extend(jobs)
-
     # 중복 제거 (unique_key 기준, 먼저 나온 것 유지)
     seen: dict[str, JobPosting] = {}
     for job in all_jobs:
@@ -126,6 +229,18 @@ def collect_all(settings: AppSettings) -> list[JobPosting]:
     return deduped
 
 
+def _build_rate_limiter(config: HttpConfig) -> AdaptiveRateLimiter | None:
+    """http 설정으로 적응형 속도 제한기를 만든다 (adaptive: false면 None)."""
+    if not config.adaptive:
+        return None
+    return AdaptiveRateLimiter(
+        max_rate=config.max_rate,
+        min_rate=config.min_rate,
+        success_threshold=config.success_threshold,
+        default_pause=config.default_retry_after,
+    )
+
+
 def run() -> None:
     """메인 실행 흐름."""
     logger.info("=" * 60)
@@ -134,35 +249,53 @@ def run() -> None:
 
     # 0. 설정 로드
     settings = load_app_settings()
+    http_client.configure(
+        pool_maxsize=settings.http.pool_maxsize,
+        timeout=settings.http.timeout,
+        rate_limiter=_build_rate_limiter(settings.http),
+    )
+    html_parser.configure(settings.http.html_parser)
 
     if not settings.companies:
         logger.warning("config/companies.yaml에 기업이 없습니다. 종료합니다.")
         return
 
     # 1. 이전 데이터 로드
-    previous_jobs = load_jobs()
+    #    (JSON Lines 저장소는 목록으로 올리지 않고 필요할 때 파일에서 한 줄씩 읽는다)
+    store = open_job_store(settings.storage)
+    previous_jobs = None if store.streams_previous else store.load()
 
     # 2. 모든 소스에서 수집
-    current_jobs = collect_all(settings)
+    source_registry = build_source_registry(settings)
+    known_jobs = store.iter_jobs() if previous_jobs is None else previous_jobs
+    current_jobs = collect_all(settings, known_jobs, source_registry)
 
     # 3. 변경 감지
-    diff = compute_diff(previous_jobs, current_jobs)
+    diff = store.compute_diff(previous_jobs, current_jobs)
 
     # 4. 전체 목록 = 신규 + 유지 (삭제된 것은 제외)
     all_current = diff.all_current_jobs
 
     # 5. 상세 설명(description) 보강 – 신규 공고만 크롤링
-    source_registry = build_source_registry(settings)
+    #    (고유키가 소스 고유 ID 기준이므로 제목 문구만 바뀐 수정 공고도 이전 description을 재활용)
     company_selectors = {c.name: c.selectors for c in settings.companies if c.selectors}
     enrich_descriptions(
         all_current,
         source_registry=source_registry,
         company_selectors=company_selectors,
         previous_jobs=previous_jobs,
+        config=settings.description,
     )
 
-    # 6. 데이터 저장
-    save_jobs(all_current)
+    # 6. 데이터 저장 + 변경 이력 기록
+    store.save(diff)
+    store.close()
+    for source in source_registry.values():
+        source.on_saved()
+    if settings.storage.change_log:
+        change_log = ChangeLog(ROOT_DIR / settings.storage.history_dir, settings.storage.compact_after)
+        change_log.append(new=diff.new_jobs, removed=diff.removed_jobs, updated=diff.updated_jobs)
+        change_log.maybe_compact()
 
     # 7. JOB_TRACKER.md 갱신
     write_markdown(diff, all_current)
@@ -172,14 +305,21 @@ def run() -> None:
         send_email(diff.new_jobs)
 
     # 9. 요약 출력
+    for host, stats in http_client.log_connection_stats().items():
+        RUN_STATS.set("http_connections", host, f"{stats.requests}req/{stats.connections}conn")
+    http_client.get_client().close()
+
     logger.info("=" * 60)
     logger.info(
-        "실행 완료 – 신규: %d건, 삭제: %d건, 유지: %d건, 전체: %d건",
+        "실행 완료 – 신규: %d건, 삭제: %d건, 수정: %d건, 유지: %d건, 전체: %d건",
         len(diff.new_jobs),
         len(diff.removed_jobs),
+        len(diff.updated_jobs),
         len(diff.unchanged_jobs),
         len(all_current),
     )
+    for line in RUN_STATS.summary_lines():
+        logger.info("실행 통계 %s", line)
     logger.info("=" * 60)
 
 
@@ -3,18 +3,36 @@
 
 채용 공고(JobPosting)의 구조를 정의하고,
 직렬화/역직렬화 및 고유키 해시 생성 로직을 포함한다.
+
+JobPosting은 수만 건이 한꺼번에 메모리에 올라가므로 __slots__ 기반으로 두고,
+값 종류가 적은 필드(source, company, level, location, date_found)는 문자열을 intern하여
+같은 값을 객체 하나로 공유한다. (메모리 측정: python src/bench_models.py)
+
+description은 저장소가 지연 로더(set_description_loader)를 달아 두면
+처음 읽을 때 본문 저장소(blob_store)에서 가져온다. 변경 감지, 표/메일 작성처럼
+본문을 쓰지 않는 단계는 읽기 비용을 치르지 않는다.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import asdict, dataclass, field
+import sys
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Callable
 
+from identity import canonicalize_url, native_id
 
-@dataclass
+
+# level 기본값
+DEFAULT_LEVEL = "5-7년"
+
+# intern하는 값 종류가 적은 필드
+_INTERNED_FIELDS = ("source", "company", "level", "location", "date_found")
+
+
+@dataclass(slots=True)
 class JobPosting:
     """채용 공고 데이터 모델.
 
@@ -24,42 +42,142 @@ class JobPosting:
         title: 공고 제목
         level: 경력 수준 (예: "5-7년")
         location: 근무 지역
-        url: 공고 상세 링크 (없을 수 있음)
+        url: 공고 상세 링크 (없을 수 있음, 추적 파라미터를 지운 정규화 URL)
+        description: 상세 설명 (지연 로더가 있으면 처음 읽을 때 가져옴, 본문을 읽지 않도록 repr/==에서 제외)
         date_found: 최초 발견 일자 (YYYY-MM-DD)
-        unique_key: 중복 판별용 고유키 (자동 생성)
+        unique_key: 중복 판별용 고유키 (자동 생성, 소스 고유 ID가 있으면 그 기준)
+        description_ref: description 저장소(blob_store)의 키 (저장 시 설정)
     """
 
     source: str
     company: str
     title: str
-    level: str = "5-7년"
+    level: str = DEFAULT_LEVEL
     location: str = ""
     url: str = ""
-    description: str = ""
+    description: str = field(default="", repr=False, compare=False)
     date_found: str = field(default_factory=lambda: date.today().isoformat())
     unique_key: str = ""
+    description_ref: str = ""
+    _description_loader: Callable[[], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        """고유키가 없으면 자동으로 생성한다."""
+        """필드를 intern/정규화하고, 고유키가 없으면 자동으로 생성한다."""
+        for name in _INTERNED_FIELDS:
+            setattr(self, name, sys.intern(getattr(self, name)))
+        self.url = canonicalize_url(self.url)
         if not self.unique_key:
             self.unique_key = self._generate_key()
 
+    def set_description_loader(self, loader: Callable[[], str]) -> None:
+        """description을 처음 읽을 때 호출할 로더를 단다 (이미 값이 있으면 무시)."""
+        if not _DESCRIPTION_SLOT.__get__(self):
+            self._description_loader = loader
+
+    @property
+    def description_loaded(self) -> bool:
+        """description을 이미 메모리에 가지고 있는지 여부 (읽어도 로드가 일어나지 않음)."""
+        return self._description_loader is None
+
+    @property
+    def has_description(self) -> bool:
+        """description이 있는지 여부 (아직 읽지 않은 본문이면 로드하지 않고 True)."""
+        return not self.description_loaded or bool(_DESCRIPTION_SLOT.__get__(self))
+
+    def copy_description_from(self, other: JobPosting) -> None:
+        """other의 description을 가져온다 (아직 읽지 않았으면 로더와 키만 넘김)."""
+        if other.description_loaded:
+            self.description = other.description
+        else:
+            self.description_ref = other.description_ref
+            self._description_loader = other._description_loader
+
+    @property
+    def native_id(self) -> str:
+        """소스가 부여한 공고 ID (원티드/GreetingHR/사람인/LinkedIn, 없으면 빈 문자열)."""
+        return native_id(self.source, self.url)
+
     def _generate_key(self) -> str:
-        """(source, company, title, location, url) 조합으로 고유키를 생성한다.
+        """고유키를 생성한다.
 
-        url이 비어있거나 변동 가능한 경우 해시로 대체한다.
+        소스 고유 ID가 있으면 (source, 고유 ID)만으로 만들어 제목/지역 문구가 바뀌어도 유지된다.
+        없으면 (source, company, title, location, url) 조합의 해시를 쓴다.
         """
-        raw = f"{self.source}|{self.company}|{self.title}|{self.location}|{self.url}"
+        job_id = self.native_id
+        if job_id:
+            raw = f"{self.source}|id|{job_id}"
+        else:
+            raw = f"{self.source}|{self.company}|{self.title}|{self.location}|{self.url}"
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
 
-    def to_dict(self) -> dict[str, Any]:
-        """딕셔너리로 변환한다."""
-        return asdict(self)
+    def to_dict(self, description: bool = True) -> dict[str, Any]:
+        """딕셔너리로 변환한다.
+
+        필드가 모두 문자열이므로 dataclasses.asdict(재귀 깊은 복사) 대신 바로 만든다.
+        description=False면 본문을 읽지 않고 빈 문자열로 둔다 (description_ref만 기록할 때).
+        """
+        return {
+            "source": self.source,
+            "company": self.company,
+            "title": self.title,
+            "level": self.level,
+            "location": self.location,
+            "url": self.url,
+            "description": self.description if description else "",
+            "date_found": self.date_found,
+            "unique_key": self.unique_key,
+            "description_ref": self.description_ref,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> JobPosting:
-        """딕셔너리에서 JobPosting 인스턴스를 생성한다."""
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        """딕셔너리에서 JobPosting 인스턴스를 생성한다.
+
+        없는 필드는 기본값을 쓰고, 모르는 키는 무시한다. null 값은 빈 문자열로 바꾼다 (intern은 str만 받음).
+        저장된 unique_key는 쓰지 않고 다시 계산한다 (이전 방식의 키는 불러올 때 새 키로 바뀐다).
+        """
+        get = data.get
+        return cls(
+            source=_text(data["source"]),
+            company=_text(data["company"]),
+            title=_text(data["title"]),
+            level=_text(get("level", DEFAULT_LEVEL)),
+            location=_text(get("location")),
+            url=_text(get("url")),
+            description=_text(get("description")),
+            date_found=get("date_found") or date.today().isoformat(),
+            description_ref=_text(get("description_ref")),
+        )
+
+
+def _text(value: str | None) -> str:
+    return "" if value is None else value
+
+
+class _LazyDescription:
+    """JobPosting.description 슬롯을 감싸 처음 읽을 때 로더를 호출하는 디스크립터."""
+
+    def __init__(self, slot: Any) -> None:
+        self.slot = slot
+
+    def __get__(self, job: JobPosting | None, owner: type | None = None) -> Any:
+        if job is None:
+            return self
+        loader = job._description_loader
+        if loader is not None:
+            job._description_loader = None
+            self.slot.__set__(job, loader())
+        return self.slot.__get__(job)
+
+    def __set__(self, job: JobPosting, value: str) -> None:
+        self.slot.__set__(job, value)
+        job._description_loader = None
+
+
+_DESCRIPTION_SLOT = JobPosting.__dict__["description"]
+JobPosting.description = _LazyDescription(_DESCRIPTION_SLOT)
 
 
 @dataclass
@@ -70,18 +188,20 @@ class DiffResult:
         new_jobs: 이번 실행에서 새로 발견된 공고 목록
         removed_jobs: 이전에는 있었지만 이번에 사라진 공고 목록
         unchanged_jobs: 변경 없이 유지된 공고 목록
+        updated_jobs: 같은 공고지만 제목/지역이 바뀐 공고 목록
     """
 
     new_jobs: list[JobPosting] = field(default_factory=list)
     removed_jobs: list[JobPosting] = field(default_factory=list)
     unchanged_jobs: list[JobPosting] = field(default_factory=list)
+    updated_jobs: list[JobPosting] = field(default_factory=list)
 
     @property
     def all_current_jobs(self) -> list[JobPosting]:
-        """현재 유효한 전체 공고 목록 (신규 + 유지)."""
-        return self.new_jobs + self.unchanged_jobs
+        """현재 유효한 전체 공고 목록 (신규 + 수정 + 유지)."""
+        return self.new_jobs + self.updated_jobs + self.unchanged_jobs
 
     @property
     def has_changes(self) -> bool:
         """변경 사항이 있는지 여부."""
-        return bool(self.new_jobs or self.removed_jobs)
+        return bool(self.new_jobs or self.removed_jobs or self.updated_jobs)
@@ -0,0 +1,101 @@
+"""
+페이지 단위 목록 수집 도우미.
+
+검색 결과처럼 페이지 URL(offset, page 번호)을 미리 알 수 있는 목록을
+최대 max_concurrency개까지 동시에 요청하면서도, 결과는 페이지 순서대로 처리한다.
+
+- fetch(page): 페이지 하나를 요청한다. 실패하면 None을 반환한다 (수집 중단).
+- collect(page, result): 결과를 순서대로 처리하고, 다음 페이지가 필요하면 True를 반환한다.
+
+빈 페이지나 마지막 페이지를 만나 collect가 False를 반환하면
+아직 시작하지 않은 페이지 요청은 취소하고 이미 받은 결과는 버린다.
+
+두 함수 모두 목록 끝까지 읽었는지(collect가 False로 멈췄는지)를 반환한다.
+요청 실패로 멈췄거나 pages를 다 쓰도록 끝이 나오지 않았으면 False다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Awaitable, Callable, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# 한 목록에서 동시에 요청하는 기본 페이지 수
+DEFAULT_PAGE_CONCURRENCY = 3
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+
+def fetch_pages(
+    pages: Sequence[P],
+    fetch: Callable[[P], R | None],
+    collect: Callable[[P, R], bool],
+    max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+) -> bool:
+    """pages를 동시에 요청하고 결과를 페이지 순서대로 collect에 넘긴다.
+
+    앞 페이지가 처리될 때마다 다음 페이지를 하나씩 요청하므로
+    동시에 진행 중인 요청은 max_concurrency개를 넘지 않는다.
+    """
+    workers = min(max(1, max_concurrency), len(pages))
+    if workers <= 1:
+        for page in pages:
+            result = fetch(page)
+            if result is None:
+                return False
+            if not collect(page, result):
+                return True
+        return False
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="page")
+    futures: list[Future] = [pool.submit(fetch, page) for page in pages[:workers]]
+    try:
+        for index, page in enumerate(pages):
+            result = futures[index].result()
+            if result is None:
+                return False
+            if not collect(page, result):
+                return True
+            next_index = index + workers
+            if next_index < len(pages):
+                futures.append(pool.submit(fetch, pages[next_index]))
+        return False
+    finally:
+        # 진행 중인 요청은 끝나기를 기다리지 않고 결과만 버린다.
+        pending = sum(not future.done() for future in futures)
+        pool.shutdown(wait=False, cancel_futures=True)
+        if pending:
+            logger.debug("[paging] 남은 페이지 요청 %d개 취소", pending)
+
+
+async def fetch_pages_async(
+    pages: Sequence[P],
+    fetch: Callable[[P], Awaitable[R | None]],
+    collect: Callable[[P, R], bool],
+    max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+) -> bool:
+    """fetch_pages의 asyncio 버전. 중단 시 진행 중인 요청 태스크도 취소한다."""
+    workers = min(max(1, max_concurrency), len(pages))
+    tasks: list[asyncio.Task] = [asyncio.ensure_future(fetch(page)) for page in pages[:workers]]
+    try:
+        for index, page in enumerate(pages):
+            result = await tasks[index]
+            if result is None:
+                return False
+            if not collect(page, result):
+                return True
+            next_index = index + workers
+            if next_index < len(pages):
+                tasks.append(asyncio.ensure_future(fetch(pages[next_index])))
+        return False
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.debug("[paging] 진행 중인 페이지 요청 %d개 취소", len(pending))
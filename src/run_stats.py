@@ -0,0 +1,62 @@
+"""
+실행 통계 모듈 – 한 번의 실행 동안 쌓이는 계측값을 모은다.
+
+소스별 소요 시간 등 여러 스레드에서 기록되는 값을 섹션 단위로 모아 두었다가
+실행 종료 시 main.run()이 요약 로그로 출력한다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any
+
+
+class RunStats:
+    """섹션(section) → 항목(key) → 값 형태의 스레드 안전 통계 저장소."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sections: dict[str, dict[str, Any]] = defaultdict(dict)
+
+    def set(self, section: str, key: str, value: Any) -> None:
+        """값을 기록한다 (기존 값 덮어쓰기)."""
+        with self._lock:
+            self._sections[section][key] = value
+
+    def add(self, section: str, key: str, amount: float = 1) -> None:
+        """숫자 값을 누적한다."""
+        with self._lock:
+            bucket = self._sections[section]
+            bucket[key] = bucket.get(key, 0) + amount
+
+    def section(self, section: str) -> dict[str, Any]:
+        """섹션의 복사본을 반환한다."""
+        with self._lock:
+            return dict(self._sections.get(section, {}))
+
+    def reset(self) -> None:
+        """모든 통계를 비운다."""
+        with self._lock:
+            self._sections.clear()
+
+    def summary_lines(self) -> list[str]:
+        """요약 로그용 문자열 목록을 반환한다."""
+        lines: list[str] = []
+        with self._lock:
+            for section, values in self._sections.items():
+                items = ", ".join(
+                    f"{key}={_format(value)}" for key, value in values.items()
+                )
+                lines.append(f"[{section}] {items}")
+        return lines
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+# 프로세스 전역 통계 인스턴스
+RUN_STATS = RunStats()
@@ -10,7 +10,7 @@
 ─────────────────────────────────
 # src/sources/wanted.py
 
-import requests
+import http_client
 from sources.base import BaseSource
 from models import JobPosting
 from config_loader import CompanyConfig
@@ -22,7 +22,7 @@ class WantedSource(BaseSource):
         # 1. company.url (기업 채용 페이지)에 직접 접근
         # 2. 공고 목록을 파싱
         # 3. JobPosting 리스트로 반환
-        resp = requests.get(company.url)
+        resp = http_client.get(company.url)
         ...
         return [
             JobPosting(
@@ -41,18 +41,35 @@ class WantedSource(BaseSource):
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from config_loader import CompanyConfig, ExperienceFilter
 from models import JobPosting
+from run_stats import RUN_STATS
+from throttle import (
+    DEFAULT_MAX_BACKOFF,
+    HOST_BREAKER,
+    THROTTLE_STATUS,
+    AsyncHostLimiter,
+    HostLimiter,
+    decorrelated_jitter,
+    host_of,
+    parse_retry_after,
+)
+
+if TYPE_CHECKING:
+    from async_engine import AsyncHttpClient
 
 logger = logging.getLogger(__name__)
 
 # 네트워크 재시도 기본 설정
 DEFAULT_MAX_RETRIES = 3
-DEFAULT_BACKOFF_BASE = 2  # 지수 백오프 밑
+DEFAULT_BACKOFF_BASE = 2  # 재시도 최소 대기 시간 (초)
 
 
 class BaseSource(ABC):
@@ -61,12 +78,18 @@ class BaseSource(ABC):
     Attributes:
         name: 소스 식별 이름 (예: "wanted", "saramin") – companies.yaml의 source와 매칭
         max_retries: 실패 시 최대 재시도 횟수
-        backoff_base: 지수 백오프 밑 (초)
+        backoff_base: 재시도 최소 대기 시간 (초, decorrelated jitter의 하한)
+        max_backoff: 재시도 최대 대기 시간 (초)
+        default_host: company.url이 비어있을 때 사용할 요청 호스트 (검색 기반 소스용)
     """
 
     name: str = "unknown"
     max_retries: int = DEFAULT_MAX_RETRIES
     backoff_base: int = DEFAULT_BACKOFF_BASE
+    max_backoff: float = DEFAULT_MAX_BACKOFF
+    default_host: str = ""
+    # set_known_jobs로 이전 공고를 받는 소스만 True (다른 소스의 공고는 모으지 않음)
+    uses_known_jobs: bool = False
 
     @abstractmethod
     def fetch_company(self, company: CompanyConfig) -> list[JobPosting]:
@@ -98,47 +121,116 @@ class BaseSource(ABC):
         """
         return ""
 
+    def open(self, max_workers: int = 1) -> None:
+        """수집 시작 전에 호출된다.
+
+        브라우저처럼 여러 기업이 공유하는 자원을 준비하는 소스는 오버라이드한다.
+
+        Args:
+            max_workers: 이 소스에서 동시에 수집할 최대 기업 수
+        """
+
+    def close(self) -> None:
+        """수집이 모두 끝난 뒤 호출된다. open()에서 준비한 자원을 정리한다."""
+
+    def on_saved(self) -> None:
+        """이번 실행의 공고가 저장소에 저장된 뒤 호출된다.
+
+        수집 상태(마지막 전체 수집 날짜 등)를 저장이 끝난 뒤에만 기록하려는 소스는 오버라이드한다.
+        """
+
+    def set_known_jobs(self, jobs: list[JobPosting]) -> None:
+        """수집 시작 전에 이전 실행에서 이 소스가 저장한 공고를 전달받는다.
+
+        이미 아는 공고를 만나면 요청을 줄이는 증분 수집 소스는 오버라이드하고
+        uses_known_jobs를 True로 둔다.
+
+        Args:
+            jobs: data/jobs.json에 저장된 이 소스의 공고 목록
+        """
+
+    def host_for(self, company: CompanyConfig) -> str:
+        """기업 수집 시 요청하는 호스트를 반환한다 (호스트별 동시성 제한 키)."""
+        return host_of(company.url) or self.default_host
+
+    def _retry_wait(self, previous: float, exc: Exception) -> float:
+        """직전 대기 시간이 previous초일 때 다음 시도까지 대기할 시간(초)을 반환한다.
+
+        decorrelated jitter로 대기 시간을 흩뜨리고,
+        429/503 응답에 Retry-After가 있으면 그보다 짧게 기다리지 않는다.
+        """
+        wait = decorrelated_jitter(previous, self.backoff_base, self.max_backoff)
+        retry_after = _retry_after_of(exc)
+        return max(wait, retry_after) if retry_after is not None else wait
+
+    def _log_success(self, company: CompanyConfig, jobs: list[JobPosting], attempt: int) -> None:
+        logger.info(
+            "[%s → %s] 수집 성공 – %d건 (시도 %d/%d)",
+            self.name,
+            company.name,
+            len(jobs),
+            attempt,
+            self.max_retries,
+        )
+
+    def _log_failure(self, company: CompanyConfig, attempt: int, exc: Exception, wait: float) -> None:
+        logger.warning(
+            "[%s → %s] 수집 실패 (시도 %d/%d): %s – %.1f초 후 재시도",
+            self.name,
+            company.name,
+            attempt,
+            self.max_retries,
+            exc,
+            wait,
+        )
+
+    def _log_gave_up(self, company: CompanyConfig, last_error: Exception | None) -> None:
+        logger.error(
+            "[%s → %s] 최대 재시도 초과. 마지막 오류: %s",
+            self.name,
+            company.name,
+            last_error,
+        )
+
+    def _breaker_open(self, company: CompanyConfig, host: str) -> bool:
+        """호스트 서킷이 열려 있으면 건너뛴 횟수를 기록하고 True를 반환한다."""
+        if HOST_BREAKER.allow(host):
+            return False
+        RUN_STATS.add("circuit_breaker_skipped", host)
+        logger.warning("[%s → %s] %s 서킷 열림 – 수집 건너뜀", self.name, company.name, host)
+        return True
+
     def fetch_company_with_retry(self, company: CompanyConfig) -> list[JobPosting]:
         """재시도 로직이 포함된 기업별 수집 메서드.
 
-        지수 백오프(exponential backoff)를 적용하여
-        max_retries 회까지 재시도한다.
+        decorrelated jitter 백오프를 적용하여 max_retries 회까지 재시도한다.
+        실패는 호스트별 서킷 브레이커(HOST_BREAKER)에 기록되며,
+        서킷이 열린 호스트는 요청 없이 바로 빈 결과를 반환한다.
         """
+        host = self.host_for(company)
         last_error: Exception | None = None
+        wait = float(self.backoff_base)
+
+        if self._breaker_open(company, host):
+            return []
 
         for attempt in range(1, self.max_retries + 1):
             try:
                 jobs = self.fetch_company(company)
-                logger.info(
-                    "[%s → %s] 수집 성공 – %d건 (시도 %d/%d)",
-                    self.name,
-                    company.name,
-                    len(jobs),
-                    attempt,
-                    self.max_retries,
-                )
+                HOST_BREAKER.record_success(host)
+                self._log_success(company, jobs, attempt)
                 return jobs
             except Exception as exc:
                 last_error = exc
-                wait = self.backoff_base ** attempt
-                logger.warning(
-                    "[%s → %s] 수집 실패 (시도 %d/%d): %s – %d초 후 재시도",
-                    self.name,
-                    company.name,
-                    attempt,
-                    self.max_retries,
-                    exc,
-                    wait,
-                )
+                HOST_BREAKER.record_failure(host)
+                wait = self._retry_wait(wait, exc)
+                self._log_failure(company, attempt, exc, wait)
+                if not HOST_BREAKER.allow(host):
+                    break
                 if attempt < self.max_retries:
                     time.sleep(wait)
 
-        logger.error(
-            "[%s → %s] 최대 재시도 초과. 마지막 오류: %s",
-            self.name,
-            company.name,
-            last_error,
-        )
+        self._log_gave_up(company, last_error)
         return []
 
     def fetch_all_companies(
@@ -146,20 +238,144 @@ class BaseSource(ABC):
         companies: list[CompanyConfig],
         exp_filter: ExperienceFilter | None = None,
         skip_filter: bool = False,
+        max_workers: int = 1,
+        host_limiter: HostLimiter | None = None,
     ) -> list[JobPosting]:
         """할당된 모든 기업의 공고를 수집하고 경력 필터를 적용한다.
 
+        max_workers가 2 이상이면 스레드 풀로 여러 기업을 동시에 수집한다.
+        결과는 동시 수집 여부와 관계없이 companies 순서대로 합쳐진다.
+
         Args:
             companies: 이 소스에 할당된 기업 목록
             exp_filter: 경력 필터 설정 (None이면 필터 안 함)
             skip_filter: True이면 필터를 건너뜀 (mock 소스용)
+            max_workers: 동시에 수집할 최대 기업 수
+            host_limiter: 호스트별 동시 요청 제한기 (None이면 제한 없음)
         """
         all_jobs: list[JobPosting] = []
 
-        for company in companies:
-            jobs = self.fetch_company_with_retry(company)
-            all_jobs.extend(jobs)
+        def fetch(company: CompanyConfig) -> list[JobPosting]:
+            if host_limiter is None:
+                return self.fetch_company_with_retry(company)
+            with host_limiter.slot(self.host_for(company)):
+                return self.fetch_company_with_retry(company)
+
+        workers = min(max_workers, len(companies))
+        if workers > 1:
+            logger.info("[%s] 기업 %d개 동시 수집 (workers=%d)", self.name, len(companies), workers)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.name) as pool:
+                # map은 입력 순서대로 결과를 돌려주므로 수집 순서가 유지된다.
+                for jobs in pool.map(fetch, companies):
+                    all_jobs.extend(jobs)
+        else:
+            for company in companies:
+                all_jobs.extend(fetch(company))
+
+        return self._finalize_jobs(all_jobs, exp_filter, skip_filter)
+
+    # ── asyncio 경로 ─────────────────────────────────────────
+
+    @property
+    def supports_async(self) -> bool:
+        """fetch_company_async를 직접 구현한 소스인지 여부."""
+        return type(self).fetch_company_async is not BaseSource.fetch_company_async
+
+    async def fetch_company_async(
+        self,
+        company: CompanyConfig,
+        http: AsyncHttpClient,
+    ) -> list[JobPosting]:
+        """특정 기업의 채용 공고를 비동기로 수집한다 (선택 구현).
+
+        이벤트 루프 하나에서 많은 요청을 동시에 처리하려는 소스는
+        이 메서드를 오버라이드하여 http(공유 aiohttp 세션)로 요청한다.
+        기본 구현은 동기 fetch_company를 스레드에서 실행하는 어댑터다.
+
+        Args:
+            company: 기업 설정 (이름, URL 등)
+            http: 비동기 HTTP 클라이언트
 
+        Returns:
+            수집된 채용 공고 목록
+        """
+        return await asyncio.to_thread(self.fetch_company, company)
+
+    async def fetch_company_with_retry_async(
+        self,
+        company: CompanyConfig,
+        http: AsyncHttpClient | None,
+    ) -> list[JobPosting]:
+        """fetch_company_with_retry의 비동기 버전.
+
+        비동기 구현이 없는 소스(또는 aiohttp 미설치로 http가 None인 경우)는
+        동기 재시도 로직 전체를 스레드에서 실행한다.
+        """
+        if http is None or not self.supports_async:
+            return await asyncio.to_thread(self.fetch_company_with_retry, company)
+
+        host = self.host_for(company)
+        last_error: Exception | None = None
+        wait = float(self.backoff_base)
+
+        if self._breaker_open(company, host):
+            return []
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                jobs = await self.fetch_company_async(company, http)
+                HOST_BREAKER.record_success(host)
+                self._log_success(company, jobs, attempt)
+                return jobs
+            except Exception as exc:
+                last_error = exc
+                HOST_BREAKER.record_failure(host)
+                wait = self._retry_wait(wait, exc)
+                self._log_failure(company, attempt, exc, wait)
+                if not HOST_BREAKER.allow(host):
+                    break
+                if attempt < self.max_retries:
+                    await asyncio.sleep(wait)
+
+        self._log_gave_up(company, last_error)
+        return []
+
+    async def fetch_all_companies_async(
+        self,
+        companies: list[CompanyConfig],
+        http: AsyncHttpClient | None,
+        exp_filter: ExperienceFilter | None = None,
+        skip_filter: bool = False,
+        max_workers: int = 1,
+        host_limiter: AsyncHostLimiter | None = None,
+    ) -> list[JobPosting]:
+        """fetch_all_companies의 비동기 버전.
+
+        비동기 구현 소스는 호스트별 제한 안에서 모든 기업을 동시에 수집하고,
+        동기 전용 소스는 스레드 어댑터를 max_workers개까지만 동시에 실행한다.
+        결과는 companies 순서대로 합쳐진다.
+        """
+        native = http is not None and self.supports_async
+        workers = asyncio.Semaphore(len(companies) if native else max(1, max_workers))
+
+        async def fetch(company: CompanyConfig) -> list[JobPosting]:
+            async with workers:
+                if host_limiter is None:
+                    return await self.fetch_company_with_retry_async(company, http)
+                async with host_limiter.slot(self.host_for(company)):
+                    return await self.fetch_company_with_retry_async(company, http)
+
+        results = await asyncio.gather(*(fetch(company) for company in companies))
+        all_jobs = [job for jobs in results for job in jobs]
+        return self._finalize_jobs(all_jobs, exp_filter, skip_filter)
+
+    def _finalize_jobs(
+        self,
+        all_jobs: list[JobPosting],
+        exp_filter: ExperienceFilter | None,
+        skip_filter: bool,
+    ) -> list[JobPosting]:
+        """수집 결과에 경력 필터와 level 라벨을 적용한다."""
         # 경력 필터 적용
         if exp_filter and exp_filter.enabled and not skip_filter:
             before = len(all_jobs)
@@ -181,6 +397,19 @@ class BaseSource(ABC):
         return all_jobs
 
 
+def _retry_after_of(exc: Exception) -> float | None:
+    """예외에 담긴 429/503 응답의 Retry-After(초)를 꺼낸다 (없으면 None)."""
+    # AsyncHttpError는 retry_after를 직접 갖고 있다.
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        return float(retry_after)
+    # requests.HTTPError는 response를 갖고 있다.
+    response = getattr(exc, "response", None)
+    if response is None or getattr(response, "status_code", None) not in THROTTLE_STATUS:
+        return None
+    return parse_retry_after(response.headers.get("Retry-After"))
+
+
 def _apply_experience_filter(
     jobs: list[JobPosting],
     exp_filter: ExperienceFilter,
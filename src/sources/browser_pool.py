@@ -0,0 +1,185 @@
+"""
+BrowserPool – Playwright Chromium 인스턴스 재사용 풀.
+
+기업마다 sync_playwright() + chromium.launch()를 반복하면
+매번 브라우저 콜드 스타트 비용을 치르게 된다.
+이 풀은 워커 스레드마다 Chromium을 한 번만 띄우고,
+기업(작업)마다 새 BrowserContext를 만들어 넘겨준다.
+
+Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로
+브라우저는 전용 워커 스레드가 소유하고, 호출 스레드는 작업을 큐에 넣고 결과를 기다린다.
+
+사용 예시:
+    pool = BrowserPool(size=2)
+    html = pool.run(lambda context: render(context, url))
+    ...
+    pool.close()
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable, TypeVar
+
+from run_stats import RUN_STATS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 워커 종료 신호
+_STOP = object()
+
+# 작업 하나를 기다리는 최대 시간(초) – 브라우저가 멈춰도 호출 스레드가 무한 대기하지 않도록
+DEFAULT_TASK_TIMEOUT = 300.0
+
+
+class BrowserPool:
+    """워커 스레드당 Chromium 하나를 유지하는 브라우저 풀.
+
+    Attributes:
+        size: 워커(브라우저) 수
+        context_options: browser.new_context()에 전달할 옵션
+        task_timeout: 작업 하나의 결과를 기다리는 최대 시간(초)
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        context_options: dict[str, Any] | None = None,
+        task_timeout: float = DEFAULT_TASK_TIMEOUT,
+    ) -> None:
+        self.size = max(1, size)
+        self.context_options = context_options or {}
+        self.task_timeout = task_timeout
+        self._tasks: queue.Queue = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        self._live = 0  # 아직 큐를 처리할 수 있는 워커 수 (_lock으로 보호)
+        self._lock = threading.Lock()
+
+    def run(self, fn: Callable[[Any], T]) -> T:
+        """새 BrowserContext에서 fn(context)를 실행하고 결과를 반환한다.
+
+        컨텍스트는 작업이 끝나면 닫히므로 쿠키/스토리지가 기업 간에 공유되지 않는다.
+        살아 있는 워커가 없으면 곧바로 실패하고, task_timeout 안에 끝나지 않으면
+        concurrent.futures.TimeoutError를 던진다.
+        """
+        self._ensure_workers()
+        future: Future = Future()
+        with self._lock:
+            self._tasks.put((fn, future))
+            # 넣는 사이에 마지막 워커가 죽었다면 아무도 꺼내 가지 않는다.
+            if self._live == 0:
+                self._fail_pending(RuntimeError("브라우저 워커가 모두 종료됨"))
+        try:
+            return future.result(timeout=self.task_timeout)
+        except FutureTimeout:
+            future.cancel()  # 아직 큐에 있으면 워커가 건너뛴다
+            logger.error("[browser] 작업이 %.0f초 안에 끝나지 않음", self.task_timeout)
+            raise
+
+    def _ensure_workers(self) -> None:
+        """첫 작업 시점에 워커 스레드를 띄운다."""
+        with self._lock:
+            # 브라우저 시작에 실패해 종료된 워커는 교체한다.
+            self._workers = [w for w in self._workers if w.is_alive()]
+            while len(self._workers) < self.size:
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"browser-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._live += 1
+                worker.start()
+                self._workers.append(worker)
+
+    def _worker_loop(self) -> None:
+        """브라우저를 한 번 띄우고 큐의 작업을 순서대로 처리한다."""
+        pending: Any = None
+        error: Exception = RuntimeError("브라우저 워커가 모두 종료됨")
+        try:
+            from playwright.sync_api import sync_playwright
+
+            with sync_playwright() as p:
+                started = time.perf_counter()
+                browser = p.chromium.launch(headless=True)
+                elapsed = time.perf_counter() - started
+                RUN_STATS.add("browser", "startups")
+                RUN_STATS.add("browser", "startup_s", elapsed)
+                logger.info(
+                    "[browser] Chromium 시작 (%s) – %.2f초",
+                    threading.current_thread().name,
+                    elapsed,
+                )
+
+                try:
+                    while True:
+                        pending = self._tasks.get()
+                        if pending is _STOP:
+                            break
+                        fn, future = pending
+                        if future.set_running_or_notify_cancel():
+                            self._run_task(browser, fn, future)
+                        pending = None
+                finally:
+                    browser.close()
+        except Exception as exc:
+            # 브라우저 시작 실패 시 받아 둔 작업이 멈추지 않도록 실패 처리한다.
+            logger.error("[browser] 워커 오류: %s", exc)
+            error = exc
+            if pending is not None and pending is not _STOP:
+                _fail(pending[1], exc)
+        finally:
+            # 마지막 워커라면 큐에 남은 작업을 꺼내 갈 스레드가 없으므로 모두 실패 처리한다.
+            with self._lock:
+                self._live -= 1
+                if self._live == 0:
+                    self._fail_pending(error)
+
+    def _run_task(self, browser: Any, fn: Callable[[Any], Any], future: Future) -> None:
+        try:
+            context = browser.new_context(**self.context_options)
+        except Exception as exc:
+            future.set_exception(exc)
+            return
+        try:
+            future.set_result(fn(context))
+        except Exception as exc:
+            future.set_exception(exc)
+        finally:
+            context.close()
+
+    def _fail_pending(self, exc: Exception) -> None:
+        while True:
+            try:
+                item = self._tasks.get_nowait()
+            except queue.Empty:
+                return
+            if item is _STOP:
+                continue
+            _fail(item[1], exc)
+
+    def close(self) -> None:
+        """모든 워커에 종료 신호를 보내고 브라우저가 닫힐 때까지 기다린다."""
+        with self._lock:
+            workers = [w for w in self._workers if w.is_alive()]
+            self._workers = []
+        for _ in workers:
+            self._tasks.put(_STOP)
+        for worker in workers:
+            worker.join(timeout=30)
+        if workers:
+            logger.info("[browser] 브라우저 %d개 종료", len(workers))
+
+
+def _fail(future: Future, exc: Exception) -> None:
+    """future에 예외를 설정한다 (run()이 시간 초과로 이미 취소했으면 건너뜀)."""
+    try:
+        future.set_exception(exc)
+    except InvalidStateError:
+        pass
@@ -35,26 +35,20 @@ from __future__ import annotations
 
 import logging
 from datetime import date
+from typing import TYPE_CHECKING
 
-import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
+import http_client
 from config_loader import CompanyConfig
+from html_parser import parse_html
 from models import JobPosting
 from sources.base import BaseSource
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from async_engine import AsyncHttpClient
 
-# 요청 헤더
-_HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-}
+logger = logging.getLogger(__name__)
 
 # selectors 미지정 시 자동으로 시도하는 폴백 셀렉터 목록
 _FALLBACK_JOB_LIST = [
@@ -100,14 +94,30 @@ class CareerPageSource(BaseSource):
         Returns:
             수집된 채용 공고 목록
         """
+        page = http_client.get_html(company.url)
+        return self._parse_page(page.content, company, page.encoding)
+
+    async def fetch_company_async(
+        self,
+        company: CompanyConfig,
+        http: AsyncHttpClient,
+    ) -> list[JobPosting]:
+        """fetch_company의 비동기 버전 (asyncio 엔진용)."""
+        page = await http.get_html(company.url)
+        return self._parse_page(page.content, company, page.encoding)
+
+    def _parse_page(
+        self,
+        html: str | bytes,
+        company: CompanyConfig,
+        encoding: str | None = None,
+    ) -> list[JobPosting]:
+        """채용 페이지 HTML에서 selectors 설정에 따라 공고를 파싱한다."""
         today = date.today().isoformat()
         jobs: list[JobPosting] = []
         sel = company.selectors  # YAML에서 정의한 셀렉터
 
-        resp = requests.get(company.url, headers=_HEADERS, timeout=30)
-        resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = parse_html(html, encoding=encoding)
 
         # ── 1. 공고 목록 컨테이너 찾기 ───────────────────
         job_items: list[Tag] = []
@@ -34,26 +34,31 @@ from __future__ import annotations
 
 import logging
 from datetime import date
+from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
+import http_client
 from config_loader import CompanyConfig
+from html_parser import parse_html
+from http_client import DETAIL_TIMEOUT
 from models import JobPosting
 from sources.base import BaseSource
 
+if TYPE_CHECKING:
+    from async_engine import AsyncHttpClient
+
 logger = logging.getLogger(__name__)
 
-_HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-}
+
+def _is_job_link(href: str | None) -> bool:
+    """GreetingHR 공고 상세 링크(/ko/o/{id})인지 여부."""
+    return bool(href) and "/ko/o/" in href
+
+
+# 채용 페이지에서 파싱할 부분 (공고 카드 링크만)
+_JOB_LINK_STRAINER = SoupStrainer("a", href=_is_job_link)
 
 
 class GreetingHRSource(BaseSource):
@@ -67,16 +72,34 @@ class GreetingHRSource(BaseSource):
 
     def fetch_company(self, company: CompanyConfig) -> list[JobPosting]:
         """GreetingHR 채용 페이지에서 공고를 수집한다."""
+        page = http_client.get_html(company.url)
+        return self._parse_page(page.content, page.url, company, page.encoding)
+
+    async def fetch_company_async(
+        self,
+        company: CompanyConfig,
+        http: AsyncHttpClient,
+    ) -> list[JobPosting]:
+        """fetch_company의 비동기 버전 (asyncio 엔진용)."""
+        page = await http.get_html(company.url)
+        return self._parse_page(page.content, page.url, company, page.encoding)
+
+    def _parse_page(
+        self,
+        html: str | bytes,
+        page_url: str,
+        company: CompanyConfig,
+        encoding: str | None = None,
+    ) -> list[JobPosting]:
+        """채용 페이지 HTML에서 공고 카드를 파싱한다."""
         today = date.today().isoformat()
         jobs: list[JobPosting] = []
 
-        resp = requests.get(company.url, headers=_HEADERS, timeout=30)
-        resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # 공고 링크(<a href=".../ko/o/...">)와 그 하위 요소만 파싱한다.
+        soup = parse_html(html, parse_only=_JOB_LINK_STRAINER, encoding=encoding)
 
         # ── 공고 링크 찾기: href에 "/ko/o/" 패턴 ──────────
-        job_links = soup.find_all("a", href=lambda h: h and "/ko/o/" in h)
+        job_links = soup.find_all("a", href=_is_job_link)
 
         if not job_links:
             logger.warning(
@@ -86,7 +109,7 @@ class GreetingHRSource(BaseSource):
             )
             return jobs
 
-        base_url = f"{resp.url.split('/ko/')[0]}" if "/ko/" in resp.url else resp.url.rsplit("/", 1)[0]
+        base_url = f"{page_url.split('/ko/')[0]}" if "/ko/" in page_url else page_url.rsplit("/", 1)[0]
 
         for link_tag in job_links:
             try:
@@ -156,9 +179,8 @@ class GreetingHRSource(BaseSource):
         ]
 
         try:
-            resp = requests.get(job.url, headers=_HEADERS, timeout=15)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            page = http_client.get_html(job.url, timeout=DETAIL_TIMEOUT)
+            soup = parse_html(page.content, encoding=page.encoding)
 
             if desc_sel:
                 area = soup.select_one(desc_sel)
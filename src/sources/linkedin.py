@@ -20,30 +20,28 @@ import logging
 import re
 import time
 from datetime import date
+from typing import TYPE_CHECKING
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
+import http_client
 from config_loader import CompanyConfig
+from html_parser import parse_html
 from models import JobPosting
 from sources.base import BaseSource
 
+if TYPE_CHECKING:
+    from async_engine import AsyncHttpClient
+
 logger = logging.getLogger(__name__)
 
-# 요청 헤더 (비로그인 접근)
-_HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-}
 
 # 링크드인 company slug 추출
 _COMPANY_SLUG_PATTERN = re.compile(r"/company/([^/]+)")
 
+# 채용 페이지에서 먼저 파싱할 부분 (검색 결과 목록만)
+_RESULTS_STRAINER = SoupStrainer("ul", class_="jobs-search__results-list")
+
 
 class LinkedInSource(BaseSource):
     """링크드인 채용 공고 수집 소스.
@@ -65,28 +63,39 @@ class LinkedInSource(BaseSource):
         Returns:
             수집된 채용 공고 목록
         """
+        page = http_client.get_html(_jobs_url(company.url))
+        return self._parse_page(page.content, company, page.encoding)
+
+    async def fetch_company_async(
+        self,
+        company: CompanyConfig,
+        http: AsyncHttpClient,
+    ) -> list[JobPosting]:
+        """fetch_company의 비동기 버전 (asyncio 엔진용)."""
+        page = await http.get_html(_jobs_url(company.url))
+        return self._parse_page(page.content, company, page.encoding)
+
+    def _parse_page(
+        self,
+        html: str | bytes,
+        company: CompanyConfig,
+        encoding: str | None = None,
+    ) -> list[JobPosting]:
+        """기업 채용 페이지 HTML에서 공고 카드를 파싱한다."""
         today = date.today().isoformat()
         jobs: list[JobPosting] = []
 
-        # URL 정규화: /jobs/ 경로 확보
-        url = company.url.rstrip("/")
-        if not url.endswith("/jobs"):
-            url += "/jobs/"
-        else:
-            url += "/"
-
-        resp = requests.get(url, headers=_HEADERS, timeout=30)
-        resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-
         # ── 공고 목록 파싱 ────────────────────────────────
         # 링크드인 비로그인 기업 채용 페이지의 공고 카드를 찾는다.
-        job_cards = (
-            soup.select("ul.jobs-search__results-list li")            # 검색 결과
-            or soup.select("div.base-card")                           # 기본 카드
-            or soup.select("a[data-tracking-control-name*='job']")    # 링크 폴백
-        )
+        # 검색 결과 목록만 먼저 파싱하고, 없으면 전체 트리에서 폴백 셀렉터를 시도한다.
+        results = parse_html(html, parse_only=_RESULTS_STRAINER, encoding=encoding)
+        job_cards = results.select("ul.jobs-search__results-list li")    # 검색 결과
+        if not job_cards:
+            soup = parse_html(html, encoding=encoding)
+            job_cards = (
+                soup.select("div.base-card")                              # 기본 카드
+                or soup.select("a[data-tracking-control-name*='job']")    # 링크 폴백
+            )
 
         for card in job_cards:
             try:
@@ -140,3 +149,13 @@ class LinkedInSource(BaseSource):
             len(jobs),
         )
         return jobs
+
+
+def _jobs_url(url: str) -> str:
+    """기업 페이지 URL을 /jobs/ 경로로 정규화한다."""
+    url = url.rstrip("/")
+    if not url.endswith("/jobs"):
+        url += "/jobs/"
+    else:
+        url += "/"
+    return url
@@ -26,6 +26,28 @@ companies.yaml 설정 예시:
 
 selectors를 지정하지 않으면 자동으로 일반적인 패턴을 시도한다.
 
+네트워크 캡처 모드 (capture, 선택):
+  목록을 XHR/fetch JSON으로 불러오는 SPA는 렌더링 중 매칭되는 응답을 기록해
+  DOM 파싱 없이 바로 JobPosting을 만든다. 캡처된 항목이 없으면 DOM 파싱으로 폴백한다.
+
+    capture:
+      url_pattern: "/api/v1/jobs"            # 응답 URL 정규식
+      items_path: "jobList"                  # JSON 안의 공고 목록 경로
+      fields:
+        title: "jobOfferTitle"
+        location: "locationName"
+        experience: "careerTypeName"
+      url_template: "https://careers.kakao.com/jobs/{realId}"
+
+렌더링 대기 전략 (render, 선택):
+  기본은 selectors.job_list가 나타날 때까지 기다린 뒤 항목 수가 더 늘지 않을 때까지 스크롤한다.
+  셀렉터가 없거나 나타나지 않으면 고정 대기(3초 + 스크롤 5회 + 3초)로 폴백한다.
+
+    render:
+      wait: "fixed"          # "ready"(기본) 또는 "fixed"
+      max_wait_ms: 15000     # ready 방식 전체 상한
+      max_scrolls: 10
+
 의존성:
     pip install playwright
     playwright install chromium
@@ -34,19 +56,30 @@ selectors를 지정하지 않으면 자동으로 일반적인 패턴을 시도
 from __future__ import annotations
 
 import logging
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import date
+from typing import Any, Callable
 from urllib.parse import urljoin, urlparse
 
-from config_loader import CompanyConfig
+from config_loader import CompanyConfig, PlaywrightConfig
+from html_parser import parse_html
+from http_client import USER_AGENT
 from models import JobPosting
+from run_stats import RUN_STATS
 from sources.base import BaseSource
+from sources.browser_pool import BrowserPool
+from throttle import host_of
 
 logger = logging.getLogger(__name__)
 
 # Playwright 가용 여부 플래그
 _PLAYWRIGHT_AVAILABLE = False
 try:
-    from playwright.sync_api import sync_playwright
+    import playwright.sync_api  # noqa: F401
 
     _PLAYWRIGHT_AVAILABLE = True
 except ImportError:
@@ -88,6 +121,236 @@ _FALLBACK_LINK = [
     "a[href]",
 ]
 
+# url_template의 {경로} 치환 패턴
+_TEMPLATE_FIELD = re.compile(r"\{([^{}]+)\}")
+
+
+@dataclass
+class RenderOptions:
+    """페이지 렌더링 대기 전략 (companies.yaml의 render 항목으로 기업별 덮어쓰기).
+
+    Attributes:
+        wait: "ready" = job_list 셀렉터 등장 후 항목 수가 안정될 때까지 스크롤,
+              "fixed" = 고정 시간 대기 + 고정 횟수 스크롤
+        max_wait_ms: ready 방식의 셀렉터 대기 및 스크롤 전체 상한 (밀리초)
+        scroll_pause_ms: ready 방식의 스크롤 후 대기 (밀리초)
+        max_scrolls: ready 방식의 최대 스크롤 횟수
+        stable_rounds: 항목 수가 연속 몇 번 그대로면 멈출지
+        wait_ms: fixed 방식의 단계별 대기 (밀리초)
+        scroll_count: fixed 방식의 스크롤 횟수
+    """
+
+    wait: str = "ready"
+    max_wait_ms: int = 15000
+    scroll_pause_ms: int = 500
+    max_scrolls: int = 10
+    stable_rounds: int = 2
+    wait_ms: int = 3000
+    scroll_count: int = 5
+
+    @classmethod
+    def from_config(cls, raw: dict[str, Any] | None) -> RenderOptions:
+        """companies.yaml의 render 딕셔너리에서 생성한다 (알 수 없는 키는 무시)."""
+        known = {k: v for k, v in (raw or {}).items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+@dataclass
+class RenderResult:
+    """렌더링 결과.
+
+    Attributes:
+        html: 렌더링된 HTML (캡처된 공고 항목이 있으면 빈 문자열)
+        items: capture 설정에 매칭된 JSON 응답의 공고 항목 목록
+    """
+
+    html: str = ""
+    items: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class CaptureSpec:
+    """SPA가 공고 목록을 불러오는 XHR/fetch JSON 응답 캡처 설정.
+
+    companies.yaml의 capture 항목에서 생성한다.
+    경로는 점(.)으로 구분하며 리스트 인덱스도 사용할 수 있다 (예: "data.list", "result.0.items").
+
+    Attributes:
+        url_pattern: 캡처할 응답 URL 정규식 (search 매칭)
+        items_path: JSON 응답에서 공고 목록까지의 경로 (빈 값이면 응답 자체가 목록)
+        fields: title/url/location/experience → 항목 안의 경로
+        url_template: 상세 URL 템플릿 (예: "https://careers.kakao.com/jobs/{realId}")
+    """
+
+    url_pattern: re.Pattern[str]
+    items_path: str = ""
+    fields: dict[str, str] = field(default_factory=dict)
+    url_template: str = ""
+
+    @classmethod
+    def from_config(cls, raw: dict[str, Any] | None) -> CaptureSpec | None:
+        """capture 설정이 없으면 None을 반환한다."""
+        if not raw or not raw.get("url_pattern"):
+            return None
+        return cls(
+            url_pattern=re.compile(str(raw["url_pattern"])),
+            items_path=str(raw.get("items_path", "")),
+            fields={str(k): str(v) for k, v in (raw.get("fields", {}) or {}).items()},
+            url_template=str(raw.get("url_template", "")),
+        )
+
+    def matches(self, url: str) -> bool:
+        return bool(self.url_pattern.search(url))
+
+    def items_from(self, payload: Any) -> list[dict[str, Any]]:
+        """JSON 응답에서 공고 항목 목록을 꺼낸다."""
+        items = _dig(payload, self.items_path) if self.items_path else payload
+        if not isinstance(items, list):
+            return []
+        return [item for item in items if isinstance(item, dict)]
+
+    def value(self, item: dict[str, Any], name: str) -> str:
+        """fields에 지정된 경로의 값을 문자열로 반환한다 (없으면 빈 문자열)."""
+        path = self.fields.get(name)
+        if not path:
+            return ""
+        value = _dig(item, path)
+        return "" if value is None else str(value).strip()
+
+    def url_for(self, item: dict[str, Any], page_url: str) -> str:
+        """url_template 또는 fields.url로 상세 URL을 만든다."""
+        if self.url_template:
+            url = _TEMPLATE_FIELD.sub(
+                lambda m: str(_dig(item, m.group(1)) or ""), self.url_template
+            )
+        else:
+            url = self.value(item, "url")
+        return urljoin(page_url, url) if url else ""
+
+
+class _CaptureRecorder:
+    """페이지 응답 중 capture 패턴에 맞는 것을 모아 두고, 필요할 때 JSON을 파싱한다."""
+
+    def __init__(self, capture: CaptureSpec) -> None:
+        self.capture = capture
+        self._pending: list[Any] = []
+        self._items: list[dict[str, Any]] = []
+
+    def on_response(self, response) -> None:
+        # 이벤트 핸들러 안에서는 기록만 하고 본문 파싱은 뒤로 미룬다.
+        if response.ok and self.capture.matches(response.url):
+            self._pending.append(response)
+
+    def items(self) -> list[dict[str, Any]]:
+        while self._pending:
+            response = self._pending.pop(0)
+            try:
+                self._items.extend(self.capture.items_from(response.json()))
+            except Exception as exc:
+                logger.debug("[playwright] 캡처 응답 JSON 파싱 실패 (%s): %s", response.url, exc)
+        return self._items
+
+    def item_count(self) -> int:
+        return len(self.items())
+
+
+def _dig(obj: Any, path: str) -> Any:
+    """점(.) 경로로 중첩 dict/list 값을 꺼낸다. 없으면 None."""
+    for key in path.split("."):
+        if isinstance(obj, dict):
+            obj = obj.get(key)
+        elif isinstance(obj, list) and key.isdigit() and int(key) < len(obj):
+            obj = obj[int(key)]
+        else:
+            return None
+    return obj
+
+
+# 차단한 요청이 받았을 응답 크기 추정치 (리소스 타입별 바이트, 웹 페이지 요청 크기 중앙값 수준)
+# 중단된 요청은 응답 헤더가 없어 Content-Length를 알 수 없으므로 이 값으로 절약량을 추정한다.
+_ESTIMATED_BYTES = {
+    "image": 20 * 1024,
+    "font": 30 * 1024,
+    "media": 300 * 1024,
+    "stylesheet": 10 * 1024,
+    "script": 25 * 1024,
+}
+_ESTIMATED_BYTES_DEFAULT = 5 * 1024
+
+
+class ResourceFilter:
+    """DOM만 읽는 크롤링에 필요 없는 요청을 중단시키는 라우트 필터.
+
+    리소스 타입(image, font, media 등)과 도메인 차단 목록으로 판단한다.
+    중단된 요청은 본문을 받지 않으므로 크기를 알 수 없어, 리소스 타입별 추정치
+    (_ESTIMATED_BYTES)로 요청 호스트별 절약 바이트를 누적하고
+    실제로 내려받은 바이트 수와 함께 기록한다.
+    """
+
+    def __init__(self, block_types: list[str], block_domains: list[str]) -> None:
+        self.block_types = frozenset(block_types)
+        self.block_domains = tuple(block_domains)
+        self.blocked: Counter[str] = Counter()
+        self.saved_bytes: Counter[str] = Counter()  # 요청 호스트 → 절약 바이트 추정치
+        self.allowed = 0
+        self.received_bytes = 0
+
+    def install(self, context) -> None:
+        """컨텍스트의 모든 요청에 라우트 핸들러를 건다."""
+        if self.block_types or self.block_domains:
+            context.route("**/*", self._handle)
+
+    def _handle(self, route) -> None:
+        request = route.request
+        reason = self._block_reason(request.resource_type, request.url)
+        if reason:
+            self.blocked[reason] += 1
+            self.saved_bytes[host_of(request.url) or "-"] += _ESTIMATED_BYTES.get(
+                request.resource_type, _ESTIMATED_BYTES_DEFAULT
+            )
+            route.abort()
+        else:
+            self.allowed += 1
+            route.continue_()
+
+    def _block_reason(self, resource_type: str, url: str) -> str:
+        """차단 사유(리소스 타입 또는 "denylist")를 반환한다. 허용이면 빈 문자열."""
+        if resource_type in self.block_types:
+            return resource_type
+        host = host_of(url)
+        if host and any(host == d or host.endswith(f".{d}") for d in self.block_domains):
+            return "denylist"
+        return ""
+
+    def on_response(self, response) -> None:
+        """응답 헤더의 content-length로 내려받은 바이트 수를 누적한다."""
+        try:
+            self.received_bytes += int(response.headers.get("content-length", 0))
+        except (TypeError, ValueError):
+            pass
+
+    def report(self, company_name: str) -> None:
+        """사이트별 차단/절약/수신 통계를 로그와 실행 통계에 남긴다."""
+        total_blocked = sum(self.blocked.values())
+        if not total_blocked and not self.allowed:
+            return
+        detail = ", ".join(f"{reason} {n}" for reason, n in self.blocked.most_common())
+        saved_kb = sum(self.saved_bytes.values()) / 1024
+        top_hosts = ", ".join(f"{host} {n / 1024:.0f}KB" for host, n in self.saved_bytes.most_common(3))
+        logger.info(
+            "[playwright → %s] 요청 차단 %d건 (%s), 절약 추정 %.1fKB (%s), 허용 %d건, 수신 %.1fKB",
+            company_name,
+            total_blocked,
+            detail or "-",
+            saved_kb,
+            top_hosts or "-",
+            self.allowed,
+            self.received_bytes / 1024,
+        )
+        RUN_STATS.set("playwright_blocked", company_name, f"{total_blocked}/{total_blocked + self.allowed}")
+        RUN_STATS.add("playwright_saved_kb", company_name, saved_kb)
+        RUN_STATS.add("playwright_received_kb", company_name, self.received_bytes / 1024)
+
 
 class PlaywrightSource(BaseSource):
     """SPA 채용 페이지를 Playwright로 렌더링 후 크롤링하는 소스.
@@ -97,6 +360,17 @@ class PlaywrightSource(BaseSource):
 
     name = "playwright"
 
+    def __init__(self, config: PlaywrightConfig | None = None, pool_size: int = 1) -> None:
+        self.config = config or PlaywrightConfig()
+        # 동시에 띄울 브라우저 수 (open()에서 동시 수집 기업 수로 갱신)
+        self.pool_size = pool_size
+        self._pool: BrowserPool | None = None
+        self._pool_lock = threading.Lock()
+
+    def open(self, max_workers: int = 1) -> None:
+        """워커(동시 수집 기업)당 브라우저 하나를 쓰도록 풀 크기를 맞춘다."""
+        self.pool_size = max(1, max_workers)
+
     def fetch_company(self, company: CompanyConfig) -> list[JobPosting]:
         """Playwright로 채용 페이지를 렌더링하고 공고를 수집한다."""
         if not _PLAYWRIGHT_AVAILABLE:
@@ -108,11 +382,21 @@ class PlaywrightSource(BaseSource):
             return []
 
         today = date.today().isoformat()
-        jobs: list[JobPosting] = []
         sel = company.selectors
 
+        resource_filter = ResourceFilter(
+            self.config.block_resource_types,
+            self.config.block_domains,
+        )
+        capture = CaptureSpec.from_config(company.capture)
         try:
-            html = self._render_page(company.url)
+            result = self._render_page(
+                company.url,
+                RenderOptions.from_config(company.render),
+                sel.get("job_list"),
+                resource_filter,
+                capture,
+            )
         except Exception as exc:
             logger.error(
                 "[playwright → %s] 페이지 렌더링 실패: %s",
@@ -120,11 +404,33 @@ class PlaywrightSource(BaseSource):
                 exc,
             )
             return []
+        resource_filter.report(company.name)
+
+        # ── 0. 네트워크 캡처 모드: JSON 응답에서 바로 공고 생성 ──
+        if result.items and capture is not None:
+            jobs = self._jobs_from_capture(result.items, capture, company, today)
+            logger.info(
+                "[playwright → %s] 네트워크 캡처 파싱 완료 – %d건 발견 (JSON 항목 %d개)",
+                company.name,
+                len(jobs),
+                len(result.items),
+            )
+            return jobs
+        if capture is not None:
+            logger.warning(
+                "[playwright → %s] 캡처된 JSON 응답 없음 (pattern: %s) – DOM 파싱으로 폴백",
+                company.name,
+                capture.url_pattern.pattern,
+            )
+        return self._parse_dom(result.html, company, today)
 
-        # BeautifulSoup으로 렌더링된 HTML 파싱
-        from bs4 import BeautifulSoup, Tag
+    def _parse_dom(self, html: str, company: CompanyConfig, today: str) -> list[JobPosting]:
+        """렌더링된 HTML에서 selectors 설정에 따라 공고를 파싱한다."""
+        from bs4 import Tag
 
-        soup = BeautifulSoup(html, "html.parser")
+        jobs: list[JobPosting] = []
+        sel = company.selectors
+        soup = parse_html(html)
 
         # ── 1. 공고 목록 컨테이너 찾기 ───────────────────
         job_items: list[Tag] = []
@@ -200,58 +506,190 @@ class PlaywrightSource(BaseSource):
         )
         return jobs
 
-    @staticmethod
-    def _render_page(url: str, wait_ms: int = 3000, scroll_count: int = 5) -> str:
-        """Playwright로 페이지를 렌더링하고 HTML을 반환한다.
-
-        SPA에서 동적으로 로딩되는 공고를 가져오기 위해
-        스크롤 + 대기를 반복한다.
-
-        Args:
-            url: 렌더링할 URL
-            wait_ms: 각 단계별 대기 시간 (밀리초)
-            scroll_count: 스크롤 반복 횟수
-
-        Returns:
-            렌더링된 HTML 문자열
-        """
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                locale="ko-KR",
-                viewport={"width": 1920, "height": 1080},
+    def _render_page(
+        self,
+        url: str,
+        options: RenderOptions,
+        job_list: str | None = None,
+        resource_filter: ResourceFilter | None = None,
+        capture: CaptureSpec | None = None,
+    ) -> RenderResult:
+        """공유 브라우저 풀의 새 컨텍스트에서 페이지를 렌더링한다."""
+        return self._browser_pool().run(
+            lambda context: _render_in_context(
+                context, url, options, job_list, resource_filter, capture
             )
-            page = context.new_page()
+        )
 
+    def _jobs_from_capture(
+        self,
+        items: list[dict[str, Any]],
+        capture: CaptureSpec,
+        company: CompanyConfig,
+        today: str,
+    ) -> list[JobPosting]:
+        """캡처된 JSON 항목을 JobPosting으로 변환한다."""
+        jobs: list[JobPosting] = []
+        for item in items:
             try:
-                # networkidle 대기 (타임아웃 시 무시하고 진행)
-                try:
-                    page.goto(url, wait_until="networkidle", timeout=30000)
-                except Exception:
-                    logger.debug("[playwright] networkidle 타임아웃, 계속 진행")
+                title = capture.value(item, "title")
+                if not title:
+                    continue
+                exp_text = capture.value(item, "experience")
+                jobs.append(
+                    JobPosting(
+                        source=self.name,
+                        company=company.name,
+                        title=f"{title} - {exp_text}" if exp_text else title,
+                        location=capture.value(item, "location"),
+                        url=capture.url_for(item, company.url),
+                        date_found=today,
+                    )
+                )
+            except Exception as exc:
+                logger.debug("[playwright → %s] 캡처 항목 파싱 실패: %s", company.name, exc)
+                continue
+        return jobs
+
+    def _browser_pool(self) -> BrowserPool:
+        """브라우저 풀을 반환한다 (첫 호출 시 생성)."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = BrowserPool(
+                    size=self.pool_size,
+                    context_options={
+                        "user_agent": USER_AGENT,
+                        "locale": "ko-KR",
+                        "viewport": {"width": 1920, "height": 1080},
+                    },
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """브라우저 풀을 종료한다 (다음 수집 시 다시 생성)."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+
+def _render_in_context(
+    context,
+    url: str,
+    options: RenderOptions,
+    job_list: str | None,
+    resource_filter: ResourceFilter | None = None,
+    capture: CaptureSpec | None = None,
+) -> RenderResult:
+    """Playwright 컨텍스트에서 페이지를 렌더링한다.
+
+    wait="ready"이면 job_list 셀렉터(또는 capture 설정 시 매칭되는 JSON 응답)가
+    나타날 때까지 기다린 뒤 항목 수가 더 늘지 않을 때까지만 스크롤한다.
+    셀렉터가 없거나 제한 시간 안에 나타나지 않으면 고정 대기 방식으로 진행한다.
+    (페이지는 이미 열렸으면 다시 불러오지 않고 그 페이지에서 고정 대기/스크롤만 한다.)
+
+    Args:
+        context: 공고 1개 사이트 전용 BrowserContext
+        url: 렌더링할 URL
+        options: 대기 전략 설정
+        job_list: 공고 목록 셀렉터 (companies.yaml selectors.job_list)
+        resource_filter: 이미지/폰트/광고 등 불필요한 요청 차단기 (None이면 차단 안 함)
+        capture: JSON 응답 캡처 설정 (None이면 DOM만 사용)
+
+    Returns:
+        렌더링 결과 (캡처된 공고 항목이 있으면 HTML은 비어 있음)
+    """
+    if resource_filter is not None:
+        resource_filter.install(context)
+    page = context.new_page()
+    if resource_filter is not None:
+        page.on("response", resource_filter.on_response)
+    recorder = _CaptureRecorder(capture) if capture is not None else None
+    if recorder is not None:
+        page.on("response", recorder.on_response)
+
+    loaded = False
+    if options.wait == "ready" and (job_list or recorder is not None):
+        try:
+            page.goto(url, wait_until="domcontentloaded", timeout=options.max_wait_ms)
+            loaded = True
+            if recorder is not None:
+                _wait_for_capture(page, recorder, options)
+                count_items = recorder.item_count
+            else:
+                page.wait_for_selector(job_list, state="attached", timeout=options.max_wait_ms)
+                count_items = page.locator(job_list).count
+        except Exception as exc:
+            logger.info("[playwright] 목록 대기 실패 (%s) – 고정 대기로 전환: %s", url, exc)
+        else:
+            _scroll_until_stable(page, count_items, options)
+            return _finish_render(page, recorder)
+
+    _render_fixed(page, url, options, navigate=not loaded)
+    return _finish_render(page, recorder)
 
-                # 초기 렌더링 대기
-                page.wait_for_timeout(wait_ms)
 
-                # 스크롤로 동적 콘텐츠 로딩 유도
-                for _ in range(scroll_count):
-                    page.evaluate("window.scrollBy(0, 800)")
-                    page.wait_for_timeout(1000)
+def _finish_render(page, recorder: _CaptureRecorder | None) -> RenderResult:
+    """캡처된 공고가 있으면 DOM 직렬화(page.content())를 건너뛴다."""
+    items = recorder.items() if recorder is not None else []
+    return RenderResult(html="" if items else page.content(), items=items)
+
+
+def _wait_for_capture(page, recorder: _CaptureRecorder, options: RenderOptions) -> None:
+    """매칭되는 JSON 응답에서 공고 항목이 나올 때까지 기다린다."""
+    deadline = time.monotonic() + options.max_wait_ms / 1000
+    while time.monotonic() < deadline:
+        if recorder.item_count():
+            return
+        page.wait_for_timeout(200)
+    raise TimeoutError(f"{options.max_wait_ms}ms 안에 캡처된 JSON 응답 없음")
+
+
+def _scroll_until_stable(page, count_items: Callable[[], int], options: RenderOptions) -> None:
+    """항목 수가 연속으로 늘지 않을 때까지 스크롤한다 (max_scrolls / max_wait_ms 상한)."""
+    deadline = time.monotonic() + options.max_wait_ms / 1000
+    count = count_items()
+    stable = 0
+    scrolls = 0
+
+    while scrolls < options.max_scrolls and time.monotonic() < deadline:
+        scrolls += 1
+        page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
+        page.wait_for_timeout(options.scroll_pause_ms)
+
+        new_count = count_items()
+        if new_count > count:
+            count, stable = new_count, 0
+            continue
+        stable += 1
+        if stable >= options.stable_rounds:
+            break
+
+    logger.debug("[playwright] 항목 %d개에서 안정화 (스크롤 %d회)", count, scrolls)
+
+
+def _render_fixed(page, url: str, options: RenderOptions, navigate: bool = True) -> None:
+    """고정 시간 대기 + 고정 횟수 스크롤 (wait="fixed" 또는 readiness 대기 실패 시 폴백).
+
+    navigate=False면 이미 열린 페이지에서 대기/스크롤만 한다 (readiness 대기 실패 시).
+    """
+    # networkidle 대기 (타임아웃 시 무시하고 진행)
+    if navigate:
+        try:
+            page.goto(url, wait_until="networkidle", timeout=30000)
+        except Exception:
+            logger.debug("[playwright] networkidle 타임아웃, 계속 진행")
 
-                # 최종 대기 (AJAX 완료)
-                page.wait_for_timeout(wait_ms)
+    # 초기 렌더링 대기
+    page.wait_for_timeout(options.wait_ms)
 
-                html = page.content()
-            finally:
-                context.close()
-                browser.close()
+    # 스크롤로 동적 콘텐츠 로딩 유도
+    for _ in range(options.scroll_count):
+        page.evaluate("window.scrollBy(0, 800)")
+        page.wait_for_timeout(1000)
 
-        return html
+    # 최종 대기 (AJAX 완료)
+    page.wait_for_timeout(options.wait_ms)
 
 
 # ── 헬퍼 함수 ─────────────────────────────────────────────────
@@ -14,25 +14,27 @@ import logging
 import re
 from datetime import date
 from urllib.parse import quote, urlencode
+from typing import TYPE_CHECKING
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+import http_client
+from async_engine import AsyncHttpError
 from config_loader import CompanyConfig, SaraminConfig
+from html_parser import parse_html
+from http_client import DETAIL_TIMEOUT, HtmlPage
 from models import JobPosting
+from paging import fetch_pages, fetch_pages_async
 from sources.base import BaseSource
 
+if TYPE_CHECKING:
+    from async_engine import AsyncHttpClient
+
 logger = logging.getLogger(__name__)
 
-# 요청 헤더
+# 사람인 전용 헤더 (공통 헤더는 http_client.DEFAULT_HEADERS)
 _HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Accept-Language": "ko-KR,ko;q=0.9",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Referer": "https://www.saramin.co.kr/",
 }
 
@@ -45,6 +47,12 @@ _PAGE_COUNT = 40
 # 최대 페이지 수 (과도한 요청 방지)
 _MAX_PAGES = 3
 
+# 요청할 페이지 번호 목록 (1부터 시작)
+_PAGES = list(range(1, _MAX_PAGES + 1))
+
+# 검색 결과 페이지에서 파싱할 부분 (공고 아이템만)
+_RESULT_STRAINER = SoupStrainer("div", class_="item_recruit")
+
 
 class SaraminSource(BaseSource):
     """사람인 채용 공고 검색 소스.
@@ -54,6 +62,7 @@ class SaraminSource(BaseSource):
     """
 
     name = "saramin"
+    default_host = "www.saramin.co.kr"
 
     def __init__(self, config: SaraminConfig | None = None) -> None:
         self.config = config or SaraminConfig()
@@ -96,37 +105,91 @@ class SaraminSource(BaseSource):
         today = date.today().isoformat()
         all_jobs: list[JobPosting] = []
 
-        for page in range(1, _MAX_PAGES + 1):
+        def fetch(page: int) -> HtmlPage | None:
             url = self._build_search_url(page=page)
-
             logger.info(
                 "[saramin] 검색 페이지 %d 요청: %s",
                 page,
                 url[:120] + "...",
             )
-
             try:
-                resp = requests.get(url, headers=_HEADERS, timeout=30)
-                resp.raise_for_status()
+                return http_client.get_html(url, headers=_HEADERS)
             except requests.RequestException as exc:
                 logger.warning("[saramin] 페이지 %d 요청 실패: %s", page, exc)
-                break
+                return None
 
-            soup = BeautifulSoup(resp.text, "html.parser")
-            page_jobs = self._parse_search_results(soup, company.name, today)
+        def collect(page: int, doc: HtmlPage) -> bool:
+            return self._collect_page(doc.content, page, company.name, today, all_jobs, doc.encoding)
 
-            if not page_jobs:
-                logger.info("[saramin] 페이지 %d – 결과 없음, 종료", page)
-                break
+        fetch_pages(_PAGES, fetch, collect)
 
-            all_jobs.extend(page_jobs)
-            logger.info(
-                "[saramin] 페이지 %d – %d건 수집 (누적 %d건)",
-                page,
-                len(page_jobs),
-                len(all_jobs),
-            )
+        self._log_done(company, all_jobs)
+        return all_jobs
+
+    async def fetch_company_async(
+        self,
+        company: CompanyConfig,
+        http: AsyncHttpClient,
+    ) -> list[JobPosting]:
+        """fetch_company의 비동기 버전 (asyncio 엔진용)."""
+        today = date.today().isoformat()
+        all_jobs: list[JobPosting] = []
+
+        async def fetch(page: int) -> HtmlPage | None:
+            url = self._build_search_url(page=page)
+            logger.info("[saramin] 검색 페이지 %d 요청(async): %s", page, url[:120] + "...")
+            try:
+                return await http.get_html(url, headers=_HEADERS)
+            except AsyncHttpError as exc:
+                logger.warning("[saramin] 페이지 %d 요청 실패: %s", page, exc)
+                return None
+
+        def collect(page: int, doc: HtmlPage) -> bool:
+            return self._collect_page(doc.content, page, company.name, today, all_jobs, doc.encoding)
+
+        await fetch_pages_async(_PAGES, fetch, collect)
+
+        self._log_done(company, all_jobs)
+        return all_jobs
+
+    def _collect_page(
+        self,
+        html: str | bytes,
+        page: int,
+        company_name: str,
+        today: str,
+        all_jobs: list[JobPosting],
+        encoding: str | None = None,
+    ) -> bool:
+        """검색 결과 페이지 하나를 파싱해 all_jobs에 추가한다.
 
+        공고 아이템(div.item_recruit)만 파싱하고,
+        못 찾았을 때만 전체 트리로 폴백 셀렉터(div.list_item)를 시도한다.
+
+        Returns:
+            다음 페이지를 계속 요청해야 하면 True
+        """
+        soup = parse_html(html, parse_only=_RESULT_STRAINER, encoding=encoding)
+        page_jobs = self._parse_search_results(soup, company_name, today)
+        marker = b"list_item" if isinstance(html, bytes) else "list_item"
+        if not page_jobs and marker in html:
+            soup = parse_html(html, encoding=encoding)
+            page_jobs = self._parse_search_results(soup, company_name, today)
+
+        if not page_jobs:
+            logger.info("[saramin] 페이지 %d – 결과 없음, 종료", page)
+            return False
+
+        all_jobs.extend(page_jobs)
+        logger.info(
+            "[saramin] 페이지 %d – %d건 수집 (누적 %d건)",
+            page,
+            len(page_jobs),
+            len(all_jobs),
+        )
+        return True
+
+    def _log_done(self, company: CompanyConfig, all_jobs: list[JobPosting]) -> None:
         logger.info(
             "[saramin → %s] 검색 완료 – 총 %d건 발견 (키워드: %s, 경력: %d~%d년)",
             company.name,
@@ -135,7 +198,6 @@ class SaraminSource(BaseSource):
             self.config.experience_min,
             self.config.experience_max,
         )
-        return all_jobs
 
     def _parse_search_results(
         self,
@@ -242,9 +304,8 @@ class SaraminSource(BaseSource):
         ]
 
         try:
-            resp = requests.get(job.url, headers=_HEADERS, timeout=15)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            page = http_client.get_html(job.url, headers=_HEADERS, timeout=DETAIL_TIMEOUT)
+            soup = parse_html(page.content, encoding=page.encoding)
 
             if desc_sel:
                 area = soup.select_one(desc_sel)
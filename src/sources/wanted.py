@@ -4,6 +4,11 @@ WantedSource – 원티드(Wanted) 채용 공고 검색 소스.
 원티드 내부 웹 API를 통해 백엔드/자바 경력직 공고를 수집한다.
 검색 조건(직군 태그, 경력 범위, 키워드)은 config/settings.yaml에서 로드한다.
 
+증분 모드(wanted.incremental)에서는 최신순 결과를 읽다가 키워드 매칭 공고가
+모두 이전 실행에서 저장한 공고인 페이지를 만나면 멈추고, 요청하지 않은
+기존 공고는 그대로 유지한다. 마감 공고 감지를 위해 마지막 전체 수집 후
+full_sweep_days가 지나면 전체를 훑는다 (마지막 전체 수집 날짜는 state_path에 기록).
+
 원티드 API:
 - 엔드포인트: https://www.wanted.co.kr/api/v4/jobs
 - 인증 불필요 (웹 브라우저와 동일한 내부 API)
@@ -11,26 +16,31 @@ WantedSource – 원티드(Wanted) 채용 공고 검색 소스.
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 from datetime import date
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import requests
 
+import http_client
+from async_engine import AsyncHttpError
 from config_loader import CompanyConfig, WantedConfig
+from http_client import ACCEPT_JSON, DETAIL_TIMEOUT
 from models import JobPosting
+from paging import DEFAULT_PAGE_CONCURRENCY, fetch_pages, fetch_pages_async
 from sources.base import BaseSource
 
+if TYPE_CHECKING:
+    from async_engine import AsyncHttpClient
+
 logger = logging.getLogger(__name__)
 
-# 요청 헤더 (브라우저 위장)
+# 원티드 API 전용 헤더 (공통 헤더는 http_client.DEFAULT_HEADERS)
 _HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-    "Accept": "application/json, text/plain, */*",
+    "Accept": ACCEPT_JSON,
     "Referer": "https://www.wanted.co.kr/",
     "wanted-user-country": "KR",
     "wanted-user-language": "ko",
@@ -48,6 +58,9 @@ _LIMIT = 100
 # 최대 페이지 수 (과도한 요청 방지)
 _MAX_PAGES = 5
 
+# 요청할 페이지 offset 목록
+_OFFSETS = [page * _LIMIT for page in range(_MAX_PAGES)]
+
 
 class WantedSource(BaseSource):
     """원티드 채용 공고 검색 소스.
@@ -58,15 +71,83 @@ class WantedSource(BaseSource):
     """
 
     name = "wanted"
+    default_host = "www.wanted.co.kr"
+    uses_known_jobs = True
 
-    def __init__(self, config: WantedConfig | None = None) -> None:
+    def __init__(self, config: WantedConfig | None = None, state_path: Path | None = None) -> None:
         self.config = config or WantedConfig()
+        # 마지막 전체 수집 날짜 기록 파일 (None이면 이번 프로세스 안에서만 기억)
+        self.state_path = state_path
+        self._last_full_sweep: date | None = None
+        # 이번 실행에서 끝까지 마친 전체 수집 (저장소 저장 후 on_saved에서 기록)
+        self._pending_full_sweep: date | None = None
         # 키워드 리스트 (쉼표 구분 문자열 → 리스트)
         self._keywords = [
             kw.strip().lower()
             for kw in self.config.keywords.split(",")
             if kw.strip()
         ]
+        # 이전 실행에서 저장된 공고 (원티드 공고 ID → 공고)
+        self._known_jobs: dict[str, JobPosting] = {}
+
+    def set_known_jobs(self, jobs: list[JobPosting]) -> None:
+        """이전 실행의 원티드 공고를 공고 ID 기준으로 기억한다 (증분 수집용)."""
+        self._known_jobs = {
+            job_id: job for job in jobs if (job_id := job.native_id)
+        }
+
+    def _incremental_mode(self) -> bool:
+        """이번 수집을 증분 모드로 실행할지 결정한다."""
+        if not self.config.incremental or not self._known_jobs:
+            return False
+        days = self.config.full_sweep_days
+        if days <= 0:
+            return True
+        last = self._last_full_sweep or self._read_last_full_sweep()
+        if last is None or (date.today() - last).days >= days:
+            logger.info(
+                "[wanted] 전체 수집 – 마지막 전체 수집: %s, 마감 공고 감지를 위해 모든 페이지 요청",
+                last or "기록 없음",
+            )
+            return False
+        return True
+
+    def _read_last_full_sweep(self) -> date | None:
+        if self.state_path is None or not self.state_path.exists():
+            return None
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            return date.fromisoformat(state["last_full_sweep"])
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning("[wanted] 수집 상태 파일 파싱 실패 (%s): %s", self.state_path, exc)
+            return None
+
+    def _finish_full_sweep(self, complete: bool) -> None:
+        """전체 수집 결과를 기록 대기로 둔다 (증분 모드를 쓸 때만).
+
+        요청 실패로 중간에 멈춘 수집은 받지 못한 페이지의 공고가 삭제로 잡히므로
+        전체 수집으로 치지 않는다 – 다음 실행에서 다시 전체를 훑는다.
+        """
+        if not self.config.incremental:
+            return
+        if complete:
+            self._pending_full_sweep = date.today()
+        else:
+            logger.warning("[wanted] 전체 수집이 목록 끝까지 가지 못함 – 다음 실행에서 다시 전체 수집")
+
+    def on_saved(self) -> None:
+        """저장소 저장이 끝난 뒤 이번 전체 수집 날짜를 기록한다."""
+        if self._pending_full_sweep is None:
+            return
+        self._last_full_sweep, self._pending_full_sweep = self._pending_full_sweep, None
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"last_full_sweep": self._last_full_sweep.isoformat()}), encoding="utf-8"
+        )
+        os.replace(tmp_path, self.state_path)
 
     def _build_api_params(self, offset: int = 0) -> dict:
         """API 요청 파라미터를 생성한다."""
@@ -93,54 +174,132 @@ class WantedSource(BaseSource):
         """
         today = date.today().isoformat()
         all_jobs: list[JobPosting] = []
+        incremental = self._incremental_mode()
 
-        for page in range(_MAX_PAGES):
-            offset = page * _LIMIT
-            params = self._build_api_params(offset=offset)
-
-            logger.info(
-                "[wanted] API 요청 – offset: %d, limit: %d",
-                offset,
-                _LIMIT,
-            )
-
+        def fetch(offset: int) -> dict | None:
+            logger.info("[wanted] API 요청 – offset: %d, limit: %d", offset, _LIMIT)
             try:
-                resp = requests.get(
+                resp = http_client.get(
                     _API_BASE,
-                    params=params,
+                    params=self._build_api_params(offset=offset),
                     headers=_HEADERS,
-                    timeout=30,
                 )
                 resp.raise_for_status()
-                data = resp.json()
+                return resp.json()
             except requests.RequestException as exc:
                 logger.warning("[wanted] API 요청 실패 (offset=%d): %s", offset, exc)
-                break
             except ValueError as exc:
                 logger.warning("[wanted] JSON 파싱 실패: %s", exc)
-                break
+            return None
 
-            job_list = data.get("data", [])
-            if not job_list:
-                logger.info("[wanted] offset %d – 결과 없음, 종료", offset)
-                break
+        def collect(offset: int, data: dict) -> bool:
+            return self._collect_page(data, offset, company.name, today, all_jobs, incremental)
 
-            # 각 공고를 파싱하고 키워드 필터 적용
-            page_jobs = self._parse_jobs(job_list, company.name, today)
-            all_jobs.extend(page_jobs)
+        complete = fetch_pages(_OFFSETS, fetch, collect, self._page_concurrency(incremental))
 
-            logger.info(
-                "[wanted] offset %d – 전체 %d건 중 키워드 매칭 %d건 (누적 %d건)",
-                offset,
-                len(job_list),
-                len(page_jobs),
-                len(all_jobs),
-            )
+        if incremental:
+            all_jobs = self._with_unrequested_known(all_jobs)
+        else:
+            self._finish_full_sweep(complete)
+        self._log_done(company, all_jobs)
+        return all_jobs
 
-            # 다음 페이지 없으면 종료
-            if not data.get("links", {}).get("next"):
-                break
+    async def fetch_company_async(
+        self,
+        company: CompanyConfig,
+        http: AsyncHttpClient,
+    ) -> list[JobPosting]:
+        """fetch_company의 비동기 버전 (asyncio 엔진용)."""
+        today = date.today().isoformat()
+        all_jobs: list[JobPosting] = []
+        incremental = self._incremental_mode()
+
+        async def fetch(offset: int) -> dict | None:
+            logger.info("[wanted] API 요청(async) – offset: %d, limit: %d", offset, _LIMIT)
+            try:
+                return await http.get_json(
+                    _API_BASE,
+                    params=self._build_api_params(offset=offset),
+                    headers=_HEADERS,
+                )
+            except AsyncHttpError as exc:
+                logger.warning("[wanted] API 요청 실패 (offset=%d): %s", offset, exc)
+            except ValueError as exc:
+                logger.warning("[wanted] JSON 파싱 실패: %s", exc)
+            return None
+
+        def collect(offset: int, data: dict) -> bool:
+            return self._collect_page(data, offset, company.name, today, all_jobs, incremental)
+
+        complete = await fetch_pages_async(
+            _OFFSETS, fetch, collect, self._page_concurrency(incremental)
+        )
+
+        if incremental:
+            all_jobs = self._with_unrequested_known(all_jobs)
+        else:
+            self._finish_full_sweep(complete)
+        self._log_done(company, all_jobs)
+        return all_jobs
+
+    def _page_concurrency(self, incremental: bool) -> int:
+        """동시에 요청할 페이지 수. 증분 모드는 대개 첫 페이지에서 끝나므로 한 장씩 요청한다."""
+        return 1 if incremental else DEFAULT_PAGE_CONCURRENCY
+
+    def _collect_page(
+        self,
+        data: dict,
+        offset: int,
+        company_name: str,
+        today: str,
+        all_jobs: list[JobPosting],
+        incremental: bool = False,
+    ) -> bool:
+        """API 응답 한 페이지를 파싱해 all_jobs에 추가한다.
+
+        증분 모드에서는 키워드 매칭 공고가 모두 이미 아는 공고이면 멈춘다.
+        (최신순 정렬이므로 이후 페이지도 이전 실행에서 본 공고다.)
+
+        Returns:
+            다음 페이지를 계속 요청해야 하면 True
+        """
+        job_list = data.get("data", [])
+        if not job_list:
+            logger.info("[wanted] offset %d – 결과 없음, 종료", offset)
+            return False
+
+        # 각 공고를 파싱하고 키워드 필터 적용
+        page_jobs = self._parse_jobs(job_list, company_name, today)
+        all_jobs.extend(page_jobs)
 
+        logger.info(
+            "[wanted] offset %d – 전체 %d건 중 키워드 매칭 %d건 (누적 %d건)",
+            offset,
+            len(job_list),
+            len(page_jobs),
+            len(all_jobs),
+        )
+
+        if incremental and page_jobs and all(
+            job.native_id in self._known_jobs for job in page_jobs
+        ):
+            logger.info("[wanted] offset %d – 모두 기존 공고, 증분 수집 종료", offset)
+            return False
+
+        # 다음 페이지 없으면 종료
+        return bool(data.get("links", {}).get("next"))
+
+    def _with_unrequested_known(self, all_jobs: list[JobPosting]) -> list[JobPosting]:
+        """증분 수집에서 요청하지 않은 페이지의 기존 공고를 결과에 이어 붙인다.
+
+        붙이지 않으면 변경 감지에서 삭제된 공고로 처리된다.
+        """
+        fetched = {job.native_id for job in all_jobs}
+        carried = [job for job_id, job in self._known_jobs.items() if job_id not in fetched]
+        logger.info("[wanted] 증분 수집 – 신규/갱신 %d건, 기존 공고 유지 %d건", len(all_jobs), len(carried))
+        return all_jobs + carried
+
+    def _log_done(self, company: CompanyConfig, all_jobs: list[JobPosting]) -> None:
         logger.info(
             "[wanted → %s] 검색 완료 – 총 %d건 (경력: %d~%d년, 키워드: %s)",
             company.name,
@@ -149,7 +308,6 @@ class WantedSource(BaseSource):
             self.config.years_max,
             self.config.keywords,
         )
-        return all_jobs
 
     def _parse_jobs(
         self,
@@ -228,15 +386,13 @@ class WantedSource(BaseSource):
 
     def fetch_description(self, job: JobPosting, selectors: dict[str, str] | None = None) -> str:
         """원티드 상세 API에서 공고 설명을 가져온다."""
-        if "/wd/" not in job.url:
-            return ""
-        job_id = job.url.rstrip("/").split("/wd/")[-1]
-        if not job_id.isdigit():
+        job_id = job.native_id
+        if not job_id:
             return ""
 
         api_url = f"{_API_BASE}/{job_id}"
         try:
-            resp = requests.get(api_url, headers=_HEADERS, timeout=15)
+            resp = http_client.get(api_url, headers=_HEADERS, timeout=DETAIL_TIMEOUT)
             resp.raise_for_status()
             data = resp.json()
             job_detail = data.get("job", {}).get("detail", {})
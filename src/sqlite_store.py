@@ -0,0 +1,279 @@
+"""
+SQLite 공고 저장소.
+
+data/jobs.json 전체를 매번 읽고 다시 쓰는 대신, 공고를 SQLite 테이블에 두고
+이번 실행에서 바뀐 행만 트랜잭션으로 반영한다.
+신규/삭제/유지 판별도 SQL로 계산한다.
+
+- 삭제된 공고는 지우지 않고 active = 0으로 남긴다 (이력 보존).
+- 불러오기는 active 공고만 읽으므로 이력이 쌓여도 비용이 늘지 않는다.
+- git에 커밋하는 data/jobs.json은 json_export 설정으로 계속 내보낸다.
+- DB가 비어 있으면 기존 data/jobs.json을 한 번 가져온다.
+- 고유키 계산 방식이 바뀌면(PRAGMA user_version) 열 때 기존 행의 키를 다시 계산한다.
+- description은 DB 컬럼에 두고, 내보내는 jobs.json에서만 blob 저장소 키로 바꾼다.
+
+settings.yaml의 storage.backend를 "sqlite"로 지정하면 사용된다.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from contextlib import closing
+from datetime import date
+from pathlib import Path
+from typing import Iterator
+
+from blob_store import BlobStore
+from models import DiffResult, JobPosting
+
+logger = logging.getLogger(__name__)
+
+# 공고 행에 저장하는 JobPosting 필드 (순서 = 컬럼 순서)
+_FIELDS = (
+    "unique_key",
+    "source",
+    "company",
+    "title",
+    "level",
+    "location",
+    "url",
+    "description",
+    "date_found",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    unique_key   TEXT PRIMARY KEY,
+    source       TEXT NOT NULL,
+    company      TEXT NOT NULL,
+    title        TEXT NOT NULL,
+    level        TEXT NOT NULL DEFAULT '',
+    location     TEXT NOT NULL DEFAULT '',
+    url          TEXT NOT NULL DEFAULT '',
+    description  TEXT NOT NULL DEFAULT '',
+    date_found   TEXT NOT NULL,
+    active       INTEGER NOT NULL DEFAULT 1,
+    date_removed TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs (source);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS idx_jobs_date_found ON jobs (date_found);
+CREATE INDEX IF NOT EXISTS idx_jobs_active ON jobs (active);
+"""
+
+_SELECT = f"SELECT {', '.join(_FIELDS)} FROM jobs"
+
+# 고유키 계산 방식 버전 (1: 소스 고유 ID 기준 키 + URL 정규화, 2: GreetingHR ID에 기업 호스트 포함)
+_KEY_VERSION = 2
+
+
+class SqliteJobStore:
+    """SQLite 기반 공고 저장소.
+
+    Attributes:
+        path: SQLite 파일 경로
+        json_path: 내보내기/최초 가져오기에 쓰는 JSON 파일 경로 (None이면 사용 안 함)
+        blobs: JSON 내보내기/가져오기에 쓰는 description 저장소 (None이면 본문을 그대로)
+        compact: JSON 내보내기를 compact 형식으로 쓸지 여부
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        json_path: Path | None = None,
+        blobs: BlobStore | None = None,
+        compact: bool = False,
+    ) -> None:
+        self.path = path
+        self.json_path = json_path
+        self.blobs = blobs
+        self.compact = compact
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        (key_version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if key_version < _KEY_VERSION:
+            self._migrate_keys()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    streams_previous = False
+
+    def iter_jobs(self) -> Iterator[JobPosting]:
+        return iter(self.load())
+
+    def load(self) -> list[JobPosting]:
+        """현재 유효한(active) 공고를 불러온다. DB가 비어 있으면 JSON에서 가져온다."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
+        if count == 0:
+            self._import_json()
+        rows = self._conn.execute(f"{_SELECT} WHERE active = 1 ORDER BY rowid").fetchall()
+        jobs = [_job_from_row(row) for row in rows]
+        logger.info("기존 공고 %d건 로드 완료 (sqlite: %s)", len(jobs), self.path)
+        return jobs
+
+    def compute_diff(
+        self,
+        previous: list[JobPosting] | None,
+        current: list[JobPosting],
+    ) -> DiffResult:
+        """현재 공고를 DB의 active 공고와 SQL로 비교한다.
+
+        previous는 다른 저장소와 호출 형태를 맞추기 위한 인자로, 비교에는 DB를 쓴다.
+        DB에 있는 공고는 storage.job_changed로 수정 여부를 판별한다.
+        """
+        from storage import job_changed
+
+        current_by_key = {job.unique_key: job for job in current}
+        with closing(self._conn.cursor()) as cur:
+            cur.execute("CREATE TEMP TABLE IF NOT EXISTS run_keys (unique_key TEXT PRIMARY KEY)")
+            cur.execute("DELETE FROM run_keys")
+            cur.executemany("INSERT INTO run_keys VALUES (?)", ((key,) for key in current_by_key))
+            known = {
+                row[0]: _job_from_row(row)
+                for row in cur.execute(
+                    f"SELECT {', '.join('j.' + name for name in _FIELDS)} FROM run_keys r "
+                    "JOIN jobs j ON j.unique_key = r.unique_key AND j.active = 1"
+                )
+            }
+            removed_rows = cur.execute(
+                f"{_SELECT} WHERE active = 1 "
+                "AND unique_key NOT IN (SELECT unique_key FROM run_keys) ORDER BY rowid"
+            ).fetchall()
+
+        new_jobs = [job for key, job in current_by_key.items() if key not in known]
+        updated_jobs = [
+            job for key, job in current_by_key.items() if key in known and job_changed(known[key], job)
+        ]
+        updated_keys = {job.unique_key for job in updated_jobs}
+        unchanged_jobs = [
+            job for key, job in current_by_key.items() if key in known and key not in updated_keys
+        ]
+        removed_jobs = [_job_from_row(row) for row in removed_rows]
+
+        logger.info(
+            "변경 감지 결과 – 신규: %d, 삭제: %d, 수정: %d, 유지: %d",
+            len(new_jobs),
+            len(removed_jobs),
+            len(updated_jobs),
+            len(unchanged_jobs),
+        )
+        return DiffResult(
+            new_jobs=new_jobs,
+            removed_jobs=removed_jobs,
+            unchanged_jobs=unchanged_jobs,
+            updated_jobs=updated_jobs,
+        )
+
+    def save(self, diff: DiffResult) -> None:
+        """변경된 행만 한 트랜잭션으로 반영한다.
+
+        - 신규 공고: upsert (이전에 삭제된 공고가 다시 올라오면 되살림)
+        - 삭제 공고: active = 0
+        - 수정 공고: 내용 컬럼 갱신 (date_found는 유지)
+        - 유지 공고: 이번에 description을 얻은 경우에만 갱신
+        """
+        today = date.today().isoformat()
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO jobs ({', '.join(_FIELDS)}) "
+                f"VALUES ({', '.join('?' for _ in _FIELDS)}) "
+                "ON CONFLICT(unique_key) DO UPDATE SET "
+                + ", ".join(f"{name} = excluded.{name}" for name in _FIELDS[1:])
+                + ", active = 1, date_removed = NULL",
+                (_row_of(job) for job in diff.new_jobs),
+            )
+            self._conn.executemany(
+                "UPDATE jobs SET active = 0, date_removed = ? WHERE unique_key = ?",
+                ((today, job.unique_key) for job in diff.removed_jobs),
+            )
+            self._conn.executemany(
+                "UPDATE jobs SET title = ?, level = ?, location = ?, url = ?, description = ? "
+                "WHERE unique_key = ?",
+                (
+                    (job.title, job.level, job.location, job.url, job.description, job.unique_key)
+                    for job in diff.updated_jobs
+                ),
+            )
+            self._conn.executemany(
+                "UPDATE jobs SET description = ? WHERE unique_key = ? AND description != ?",
+                (
+                    (job.description, job.unique_key, job.description)
+                    for job in diff.unchanged_jobs
+                    if job.description
+                ),
+            )
+        logger.info(
+            "공고 저장 완료 (sqlite) – 추가 %d건, 삭제 표시 %d건, 수정 %d건",
+            len(diff.new_jobs),
+            len(diff.removed_jobs),
+            len(diff.updated_jobs),
+        )
+        if self.json_path is not None:
+            from storage import _prune_blobs, save_jobs
+
+            jobs = diff.all_current_jobs
+            save_jobs(jobs, self.json_path, self.blobs, self.compact)
+            _prune_blobs(self.blobs, jobs)
+
+    def _migrate_keys(self) -> None:
+        """모든 행의 고유키/URL을 현재 방식으로 다시 계산한다.
+
+        여러 행이 같은 키로 합쳐지면 active 행, 그중 가장 나중에 저장된 행을 남긴다.
+        """
+        rows = self._conn.execute(
+            f"SELECT rowid, {', '.join(_FIELDS)} FROM jobs ORDER BY active, rowid"
+        ).fetchall()
+        winners: dict[str, tuple[int, JobPosting]] = {}
+        for rowid, *values in rows:
+            job = _job_from_row(tuple(values))
+            job = JobPosting.from_dict(job.to_dict())
+            winners[job.unique_key] = (rowid, job)
+        keep = {rowid for rowid, _ in winners.values()}
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM jobs WHERE rowid = ?",
+                ((rowid,) for rowid, *_ in rows if rowid not in keep),
+            )
+            # 바뀐 키끼리 PK가 겹치지 않도록 임시 키를 거쳐 바꾼다
+            self._conn.executemany(
+                "UPDATE jobs SET unique_key = '~' || rowid WHERE rowid = ?",
+                ((rowid,) for rowid, _ in winners.values()),
+            )
+            self._conn.executemany(
+                "UPDATE jobs SET unique_key = ?, url = ? WHERE rowid = ?",
+                ((key, job.url, rowid) for key, (rowid, job) in winners.items()),
+            )
+            self._conn.execute(f"PRAGMA user_version = {_KEY_VERSION}")
+        if rows:
+            logger.info(
+                "sqlite 고유키 재계산 완료 – %d행 → %d행 (중복 %d행 정리)",
+                len(rows),
+                len(winners),
+                len(rows) - len(winners),
+            )
+
+    def _import_json(self) -> None:
+        """비어 있는 DB에 기존 JSON 데이터를 가져온다."""
+        if self.json_path is None or not self.json_path.exists():
+            return
+        from storage import load_jobs
+
+        jobs = load_jobs(self.json_path, self.blobs)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO jobs ({', '.join(_FIELDS)}) "
+                f"VALUES ({', '.join('?' for _ in _FIELDS)})",
+                (_row_of(job) for job in jobs),
+            )
+        logger.info("기존 JSON 공고 %d건을 sqlite로 가져옴: %s", len(jobs), self.json_path)
+
+
+def _row_of(job: JobPosting) -> tuple[str, ...]:
+    return tuple(getattr(job, name) for name in _FIELDS)
+
+
+def _job_from_row(row: tuple[str, ...]) -> JobPosting:
+    return JobPosting(**dict(zip(_FIELDS, row)))
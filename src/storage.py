@@ -3,24 +3,89 @@
 
 이전 실행 결과를 JSON 파일로 영속화하고,
 이번 실행 결과와 비교하여 DiffResult를 반환한다.
+
+main.run()은 open_job_store()로 설정(storage.backend)에 맞는 저장소를 열어
+load → compute_diff → save 순서로 사용한다.
+- "json": data/jobs.json 전체를 읽고 쓴다 (JsonJobStore)
+  JSON 배열은 통째로 파싱해야 하므로 변경 감지 메모리도 이전 공고 수에 비례한다.
+- "jsonl": data/jobs.jsonl에 한 줄에 공고 하나씩 스트리밍으로 읽고 쓴다 (JsonlJobStore)
+  이전 공고를 파일에서 한 줄씩 병합하므로 변경 감지 메모리가 이전 공고 수와 무관하다.
+- "sqlite": 바뀐 행만 반영하고 data/jobs.json은 내보내기로 유지한다 (sqlite_store)
+
+JSON 인코딩/디코딩은 codec 모듈(orjson/msgspec, 없으면 표준 json)을 쓴다.
+storage.compact가 켜져 있으면 들여쓰기 없이, 기본값 필드와 unique_key(불러올 때 재계산)를 빼고 저장한다.
 """
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, Protocol
 
-from models import DiffResult, JobPosting
+import codec
+from blob_store import BlobStore
+from config_loader import StorageConfig
+from models import DEFAULT_LEVEL, DiffResult, JobPosting
 
 logger = logging.getLogger(__name__)
 
+# 리포지토리 루트
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
 # 기본 데이터 저장 경로 (리포지토리 루트 기준)
-DEFAULT_DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "jobs.json"
+DEFAULT_DATA_PATH = ROOT_DIR / "data" / "jobs.json"
+
+# JSON Lines 저장 경로 (storage.backend: "jsonl")
+JSONL_DATA_PATH = ROOT_DIR / "data" / "jobs.jsonl"
+
+
+# compact 저장 시 생략하는 필드와 그 기본값 (불러올 때 from_dict가 채운다)
+_COMPACT_DEFAULTS = {
+    "level": DEFAULT_LEVEL,
+    "location": "",
+    "url": "",
+    "description": "",
+    "description_ref": "",
+}
 
 
-def load_jobs(path: Path = DEFAULT_DATA_PATH) -> list[JobPosting]:
+def _record_of(job: JobPosting, blobs: BlobStore | None, compact: bool = False) -> dict[str, Any]:
+    """저장용 딕셔너리를 만든다.
+
+    blobs가 있으면 description 대신 키만 남기고 (아직 읽지 않은 본문은 읽지 않음),
+    compact면 기본값인 필드와 unique_key를 뺀다.
+    """
+    if blobs is None:
+        record = job.to_dict()
+    elif not job.description_loaded and job.description_ref:
+        record = job.to_dict(description=False)
+    else:
+        if job.description:
+            job.description_ref = blobs.put(job.description)
+        record = job.to_dict(description=False)
+    if compact:
+        del record["unique_key"]
+        for name, default in _COMPACT_DEFAULTS.items():
+            if record[name] == default:
+                del record[name]
+    return record
+
+
+def _job_of(record: dict[str, Any], blobs: BlobStore | None) -> JobPosting:
+    """저장된 딕셔너리에서 공고를 만든다.
+
+    description_ref가 있으면 본문은 처음 읽을 때 blob 저장소에서 가져온다.
+    """
+    job = JobPosting.from_dict(record)
+    if blobs is not None and job.description_ref and not job.description:
+        job.set_description_loader(partial(blobs.get, job.description_ref))
+    return job
+
+
+def load_jobs(path: Path = DEFAULT_DATA_PATH, blobs: BlobStore | None = None) -> list[JobPosting]:
     """저장된 공고 목록을 불러온다.
 
     파일이 없거나 비어있으면 빈 리스트를 반환한다.
@@ -30,50 +95,334 @@ def load_jobs(path: Path = DEFAULT_DATA_PATH) -> list[JobPosting]:
         return []
 
     try:
-        raw = path.read_text(encoding="utf-8")
-        data: list[dict[str, Any]] = json.loads(raw) if raw.strip() else []
-        jobs = [JobPosting.from_dict(item) for item in data]
+        raw = path.read_bytes()
+        data: list[dict[str, Any]] = codec.loads(raw) if raw.strip() else []
+        jobs = [_job_of(item, blobs) for item in data]
         logger.info("기존 공고 %d건 로드 완료", len(jobs))
         return jobs
-    except (json.JSONDecodeError, KeyError) as exc:
+    except (ValueError, KeyError) as exc:
         logger.error("데이터 파일 파싱 실패: %s", exc)
         return []
 
 
-def save_jobs(jobs: list[JobPosting], path: Path = DEFAULT_DATA_PATH) -> None:
+def save_jobs(
+    jobs: list[JobPosting],
+    path: Path = DEFAULT_DATA_PATH,
+    blobs: BlobStore | None = None,
+    compact: bool = False,
+) -> None:
     """공고 목록을 JSON 파일로 저장한다.
 
     디렉토리가 없으면 자동 생성한다.
+    blobs가 있으면 description은 blob 저장소에 두고 키(description_ref)만 기록한다.
+    compact면 들여쓰기 없이 기본값 필드를 빼고 쓴다.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    data = [job.to_dict() for job in jobs]
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    data = [_record_of(job, blobs, compact) for job in jobs]
+    path.write_bytes(codec.dumps(data, indent=not compact))
     logger.info("공고 %d건 저장 완료: %s", len(jobs), path)
 
 
+def iter_jobs(path: Path = JSONL_DATA_PATH, blobs: BlobStore | None = None) -> Iterator[JobPosting]:
+    """저장된 공고를 하나씩 읽는다.
+
+    .jsonl 파일은 한 줄씩 읽으므로 전체 목록을 메모리에 올리지 않는다.
+    (그 외 파일은 JSON 배열로 보고 load_jobs로 읽는다.)
+    깨진 줄은 건너뛴다.
+    """
+    if path.suffix != ".jsonl":
+        yield from load_jobs(path, blobs)
+        return
+    if not path.exists():
+        logger.info("기존 데이터 파일이 없습니다: %s", path)
+        return
+    with path.open("rb") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield _job_of(codec.loads(line), blobs)
+            except (ValueError, KeyError, TypeError) as exc:
+                logger.error("데이터 파일 %s:%d 파싱 실패: %s", path, line_no, exc)
+
+
+def save_jobs_jsonl(
+    jobs: Iterable[JobPosting],
+    path: Path = JSONL_DATA_PATH,
+    blobs: BlobStore | None = None,
+    compact: bool = False,
+) -> int:
+    """공고를 한 줄에 하나씩 JSON Lines로 스트리밍 저장하고 저장 건수를 반환한다.
+
+    임시 파일에 쓴 뒤 교체하므로 중간에 실패해도 기존 파일이 남는다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    with tmp_path.open("wb") as f:
+        for job in jobs:
+            f.write(codec.dumps(_record_of(job, blobs, compact)))
+            f.write(b"\n")
+            count += 1
+    os.replace(tmp_path, path)
+    logger.info("공고 %d건 저장 완료: %s", count, path)
+    return count
+
+
+def job_changed(previous: JobPosting, current: JobPosting) -> bool:
+    """같은 공고(고유키 동일)의 내용이 바뀌었는지 여부 – 제목이나 지역이 다르면 수정으로 본다.
+
+    상세 설명은 비교하지 않는다. 변경 감지는 목록 수집 직후(상세 설명 보강 전)에 돌고,
+    기존 공고의 설명은 다시 크롤링하지 않고 이전 것을 재활용하기 때문이다.
+    """
+    return previous.title != current.title or previous.location != current.location
+
+
+def _sorted_unique(jobs: Iterable[JobPosting], label: str) -> Iterator[JobPosting]:
+    """고유키 오름차순 입력에서 같은 키가 연속되면 마지막 것만 내보낸다.
+
+    순서가 어긋나면 ValueError를 던진다.
+    """
+    pending: JobPosting | None = None
+    for job in jobs:
+        if pending is not None:
+            if job.unique_key < pending.unique_key:
+                raise ValueError(f"{label} 입력이 고유키 순으로 정렬되어 있지 않음: {job.unique_key}")
+            if job.unique_key != pending.unique_key:
+                yield pending
+        pending = job
+    if pending is not None:
+        yield pending
+
+
+def merge_diff(
+    previous: Iterable[JobPosting],
+    current: Iterable[JobPosting],
+) -> Iterator[tuple[str, JobPosting]]:
+    """고유키 순으로 정렬된 두 공고 스트림을 병합하며 (분류, 공고)를 내보낸다.
+
+    분류는 "new", "removed", "updated", "unchanged" 중 하나다.
+    두 입력을 한 건씩만 읽으므로 메모리 사용량이 입력 크기와 무관하다.
+    (removed는 이전 공고, 나머지는 현재 공고를 내보낸다.)
+    같은 공고의 현재 쪽에 description이 없으면 이전 description(지연 로더째)을 넘겨받으므로
+    상세 설명 보강에 이전 공고 목록이 따로 필요 없다.
+    """
+    prev_iter = _sorted_unique(previous, "previous")
+    curr_iter = _sorted_unique(current, "current")
+    prev = next(prev_iter, None)
+    curr = next(curr_iter, None)
+    while prev is not None or curr is not None:
+        if curr is None or (prev is not None and prev.unique_key < curr.unique_key):
+            yield "removed", prev
+            prev = next(prev_iter, None)
+        elif prev is None or curr.unique_key < prev.unique_key:
+            yield "new", curr
+            curr = next(curr_iter, None)
+        else:
+            if not curr.has_description and prev.has_description:
+                curr.copy_description_from(prev)
+            yield ("updated" if job_changed(prev, curr) else "unchanged"), curr
+            prev = next(prev_iter, None)
+            curr = next(curr_iter, None)
+
+
+def _diff_result(classified: Iterable[tuple[str, JobPosting]]) -> DiffResult:
+    buckets: dict[str, list[JobPosting]] = {"new": [], "removed": [], "updated": [], "unchanged": []}
+    for kind, job in classified:
+        buckets[kind].append(job)
+    return DiffResult(
+        new_jobs=buckets["new"],
+        removed_jobs=buckets["removed"],
+        updated_jobs=buckets["updated"],
+        unchanged_jobs=buckets["unchanged"],
+    )
+
+
+def _log_diff(diff: DiffResult) -> None:
+    logger.info(
+        "변경 감지 결과 – 신규: %d, 삭제: %d, 수정: %d, 유지: %d",
+        len(diff.new_jobs),
+        len(diff.removed_jobs),
+        len(diff.updated_jobs),
+        len(diff.unchanged_jobs),
+    )
+
+
 def compute_diff(
     previous: list[JobPosting],
     current: list[JobPosting],
 ) -> DiffResult:
     """이전 공고와 현재 공고를 비교하여 DiffResult를 반환한다.
 
-    고유키(unique_key)를 기준으로 신규/삭제/유지를 판별한다.
+    고유키(unique_key)를 기준으로 신규/삭제/수정/유지를 판별한다.
+    두 목록을 고유키 순으로 정렬해 merge_diff로 병합하고,
+    결과는 입력 순서(신규/수정/유지는 현재 목록, 삭제는 이전 목록 순)로 되돌린다.
+
+    이미 메모리에 있는 두 목록을 비교하므로 메모리 사용량은 제한되지 않는다.
+    이전 공고가 많아 메모리가 문제면 jsonl 저장소(파일에서 스트리밍 병합)를 쓴다.
     """
-    prev_keys = {job.unique_key: job for job in previous}
-    curr_keys = {job.unique_key: job for job in current}
+    key = attrgetter("unique_key")
+    diff = _diff_result(merge_diff(sorted(previous, key=key), sorted(current, key=key)))
 
-    new_jobs = [curr_keys[k] for k in curr_keys if k not in prev_keys]
-    removed_jobs = [prev_keys[k] for k in prev_keys if k not in curr_keys]
-    unchanged_jobs = [curr_keys[k] for k in curr_keys if k in prev_keys]
+    prev_rank = {job.unique_key: i for i, job in enumerate(previous)}
+    curr_rank = {job.unique_key: i for i, job in enumerate(current)}
+    diff.removed_jobs.sort(key=lambda job: prev_rank[job.unique_key])
+    for jobs in (diff.new_jobs, diff.updated_jobs, diff.unchanged_jobs):
+        jobs.sort(key=lambda job: curr_rank[job.unique_key])
 
-    logger.info(
-        "변경 감지 결과 – 신규: %d, 삭제: %d, 유지: %d",
-        len(new_jobs),
-        len(removed_jobs),
-        len(unchanged_jobs),
-    )
-    return DiffResult(
-        new_jobs=new_jobs,
-        removed_jobs=removed_jobs,
-        unchanged_jobs=unchanged_jobs,
-    )
+    _log_diff(diff)
+    return diff
+
+
+class JobStore(Protocol):
+    """main.run()이 사용하는 공고 저장소 인터페이스.
+
+    streams_previous가 True인 저장소는 이전 공고를 목록으로 불러오지 않는다.
+    main.run()은 load() 대신 iter_jobs()로 한 번 훑고, compute_diff에는 previous=None을 넘긴다.
+    """
+
+    streams_previous: bool
+
+    def load(self) -> list[JobPosting]: ...
+
+    def iter_jobs(self) -> Iterator[JobPosting]: ...
+
+    def compute_diff(self, previous: list[JobPosting] | None, current: list[JobPosting]) -> DiffResult: ...
+
+    def save(self, diff: DiffResult) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonJobStore:
+    """data/jobs.json 하나에 현재 공고 전체를 저장하는 기본 저장소.
+
+    blobs가 있으면 description은 blob 저장소에 두고,
+    저장 후 현재 공고가 참조하지 않는 blob은 정리한다.
+    """
+
+    streams_previous = False
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_DATA_PATH,
+        blobs: BlobStore | None = None,
+        compact: bool = False,
+    ) -> None:
+        self.path = path
+        self.blobs = blobs
+        self.compact = compact
+
+    def load(self) -> list[JobPosting]:
+        return load_jobs(self.path, self.blobs)
+
+    def iter_jobs(self) -> Iterator[JobPosting]:
+        return iter(self.load())
+
+    def compute_diff(self, previous: list[JobPosting] | None, current: list[JobPosting]) -> DiffResult:
+        return compute_diff(self.load() if previous is None else previous, current)
+
+    def save(self, diff: DiffResult) -> None:
+        jobs = diff.all_current_jobs
+        save_jobs(jobs, self.path, self.blobs, self.compact)
+        _prune_blobs(self.blobs, jobs)
+
+    def close(self) -> None:
+        pass
+
+
+class JsonlJobStore:
+    """data/jobs.jsonl에 공고를 한 줄씩 저장하는 저장소.
+
+    JSON Lines 파일이 없고 기존 JSON 배열 파일(legacy_path)이 있으면
+    처음 불러올 때 자동으로 변환하고 기존 파일은 지운다.
+    공고는 고유키 순으로 저장하므로, 변경 감지 때 이전 공고를 파일에서
+    한 줄씩 읽으며 merge_diff로 병합할 수 있다 (이전 공고 목록을 메모리에 올리지 않음).
+    """
+
+    streams_previous = True
+
+    def __init__(
+        self,
+        path: Path = JSONL_DATA_PATH,
+        legacy_path: Path = DEFAULT_DATA_PATH,
+        blobs: BlobStore | None = None,
+        compact: bool = False,
+    ) -> None:
+        self.path = path
+        self.legacy_path = legacy_path
+        self.blobs = blobs
+        self.compact = compact
+
+    def iter_jobs(self) -> Iterator[JobPosting]:
+        """저장된 공고를 하나씩 읽는다 (필요하면 먼저 변환)."""
+        self._migrate()
+        return iter_jobs(self.path, self.blobs)
+
+    def load(self) -> list[JobPosting]:
+        jobs = list(self.iter_jobs())
+        logger.info("기존 공고 %d건 로드 완료 (jsonl)", len(jobs))
+        return jobs
+
+    def compute_diff(self, previous: list[JobPosting] | None, current: list[JobPosting]) -> DiffResult:
+        """파일의 이전 공고와 현재 공고를 스트리밍 병합으로 비교한다.
+
+        previous는 쓰지 않는다 (None이면 됨). 파일이 고유키 순이 아니면
+        (이전 버전에서 저장한 경우) 파일을 목록으로 읽어 비교한다.
+        """
+        try:
+            diff = _diff_result(merge_diff(self.iter_jobs(), sorted(current, key=attrgetter("unique_key"))))
+        except ValueError as exc:
+            logger.info("jsonl 파일이 정렬되어 있지 않아 목록 비교 사용: %s", exc)
+            return compute_diff(self.load(), current)
+        _log_diff(diff)
+        return diff
+
+    def save(self, diff: DiffResult) -> None:
+        jobs = sorted(diff.all_current_jobs, key=attrgetter("unique_key"))
+        save_jobs_jsonl(jobs, self.path, self.blobs, self.compact)
+        _prune_blobs(self.blobs, jobs)
+
+    def close(self) -> None:
+        pass
+
+    def _migrate(self) -> None:
+        if self.path.exists() or not self.legacy_path.exists():
+            return
+        # save와 같이 고유키 순으로 써야 첫 변경 감지부터 스트리밍 병합을 쓸 수 있다
+        jobs = sorted(load_jobs(self.legacy_path, self.blobs), key=attrgetter("unique_key"))
+        count = save_jobs_jsonl(jobs, self.path, self.blobs, self.compact)
+        # 남겨 두면 data/를 통째로 커밋하는 워크플로우가 갱신되지 않는 옛 파일을 계속 커밋한다
+        self.legacy_path.unlink()
+        logger.info(
+            "JSON 배열 → JSON Lines 변환 완료 (%d건): %s → %s (기존 파일 삭제)",
+            count,
+            self.legacy_path,
+            self.path,
+        )
+
+
+def _prune_blobs(blobs: BlobStore | None, jobs: list[JobPosting]) -> None:
+    """현재 공고가 참조하지 않는 description blob을 지운다."""
+    if blobs is not None:
+        blobs.prune(job.description_ref for job in jobs if job.description_ref)
+
+
+def open_job_store(config: StorageConfig | None = None) -> JobStore:
+    """설정에 맞는 공고 저장소를 연다 (알 수 없는 backend면 json)."""
+    config = config or StorageConfig()
+    blobs = BlobStore(ROOT_DIR / config.description_dir) if config.description_blobs else None
+    if config.backend == "sqlite":
+        from sqlite_store import SqliteJobStore
+
+        return SqliteJobStore(
+            ROOT_DIR / config.sqlite_path,
+            json_path=DEFAULT_DATA_PATH if config.json_export else None,
+            blobs=blobs,
+            compact=config.compact,
+        )
+    if config.backend == "jsonl":
+        return JsonlJobStore(blobs=blobs, compact=config.compact)
+    if config.backend != "json":
+        logger.warning("알 수 없는 storage.backend '%s' – json 사용", config.backend)
+    return JsonJobStore(blobs=blobs, compact=config.compact)
@@ -0,0 +1,421 @@
+"""
+호스트별 요청 제어 모듈.
+
+여러 기업/소스를 동시에 수집할 때 같은 도메인에 요청이 몰리지 않도록
+호스트 단위로 동시 실행 수를 제한한다.
+
+- HostLimiter / AsyncHostLimiter: 호스트별 동시 실행 수 제한
+- HostRateLimiter: 호스트별 토큰 버킷으로 초당 요청 수 제한
+- AdaptiveRateLimiter: 429/503/Retry-After 응답에 따라 호스트별 속도를 자동 조절
+- CircuitBreaker: 연속 실패한 호스트로의 요청을 실행 끝까지 차단
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Iterator
+from urllib.parse import urlparse
+
+from run_stats import RUN_STATS
+
+logger = logging.getLogger(__name__)
+
+# 호스트당 기본 동시 요청 수
+DEFAULT_PER_HOST_LIMIT = 2
+
+# 호스트당 기본 초당 요청 수 / 버스트 크기
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 2
+
+# 호스트 차단 전 허용하는 기본 연속 실패 횟수
+DEFAULT_BREAKER_THRESHOLD = 5
+
+# 재시도 대기 시간 상한 (초)
+DEFAULT_MAX_BACKOFF = 30.0
+
+# 속도를 줄여야 한다는 신호로 보는 응답 상태 코드
+THROTTLE_STATUS = frozenset({429, 503})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환한다."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def host_of(url: str) -> str:
+    """URL에서 호스트명(소문자)을 추출한다. 실패하면 빈 문자열."""
+    if not url:
+        return ""
+    try:
+        return (urlparse(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+def decorrelated_jitter(previous: float, base: float, cap: float = DEFAULT_MAX_BACKOFF) -> float:
+    """decorrelated jitter 방식으로 다음 재시도 대기 시간(초)을 계산한다.
+
+    직전 대기 시간의 3배 안에서 무작위로 고르므로, 같은 호스트에서 동시에 실패한
+    요청들이 같은 시각에 다시 몰리지 않는다.
+    """
+    return min(cap, random.uniform(base, max(base, previous * 3)))
+
+
+class HostLimiter:
+    """호스트별 동시 실행 수 제한기.
+
+    호스트마다 BoundedSemaphore를 하나씩 두고,
+    `slot(host)` 컨텍스트 안에서만 해당 호스트로 요청하도록 한다.
+    여러 소스가 같은 인스턴스를 공유하면 소스를 넘어 전역으로 제한된다.
+
+    Attributes:
+        limit: 호스트당 최대 동시 실행 수
+    """
+
+    def __init__(self, limit: int = DEFAULT_PER_HOST_LIMIT) -> None:
+        self.limit = max(1, limit)
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.limit)
+                self._semaphores[host] = sem
+            return sem
+
+    @contextmanager
+    def slot(self, host: str) -> Iterator[None]:
+        """호스트 슬롯을 하나 점유한다 (빈 호스트는 제한하지 않음)."""
+        if not host:
+            yield
+            return
+        sem = self._semaphore(host)
+        sem.acquire()
+        try:
+            yield
+        finally:
+            sem.release()
+
+
+class AsyncHostLimiter:
+    """HostLimiter의 asyncio 버전 (이벤트 루프 하나 안에서만 사용)."""
+
+    def __init__(self, limit: int = DEFAULT_PER_HOST_LIMIT) -> None:
+        self.limit = max(1, limit)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """호스트 슬롯을 하나 점유한다 (빈 호스트는 제한하지 않음)."""
+        if not host:
+            yield
+            return
+        sem = self._semaphores.setdefault(host, asyncio.Semaphore(self.limit))
+        async with sem:
+            yield
+
+
+class TokenBucket:
+    """스레드 안전한 토큰 버킷.
+
+    초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓인다.
+    acquire()는 토큰이 생길 때까지 기다린 뒤 하나를 소비한다.
+
+    Attributes:
+        rate: 초당 토큰 충전 수
+        burst: 버킷 최대 크기
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST) -> None:
+        self.rate = max(rate, 0.001)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 사용 가능해질 때까지 기다려야 할 시간(초)을 반환한다."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            # 음수 토큰은 앞선 대기자가 이미 예약한 몫이다.
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def set_rate(self, rate: float) -> None:
+        """충전 속도를 바꾼다 (그 시점까지 쌓인 토큰은 기존 속도로 계산)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(rate, 0.001)
+
+    def acquire(self) -> float:
+        """토큰 하나를 소비한다. 실제로 기다린 시간(초)을 반환한다."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 모음.
+
+    호스트마다 독립된 버킷을 두므로 서로 다른 호스트는 병렬로 진행되고,
+    같은 호스트는 rate(초당 요청 수)와 burst 이내로만 요청한다.
+
+    Attributes:
+        rate: 호스트당 초당 요청 수
+        burst: 호스트당 버스트 크기
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def acquire(self, host: str) -> float:
+        """호스트의 토큰을 하나 소비한다 (빈 호스트는 제한하지 않음)."""
+        if not host:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[host] = bucket
+        return bucket.acquire()
+
+
+@dataclass
+class _AdaptiveHostState:
+    """AdaptiveRateLimiter의 호스트별 상태."""
+
+    bucket: TokenBucket | None = None
+    paused_until: float = 0.0
+    successes: int = 0
+    recent: deque = field(default_factory=lambda: deque(maxlen=20))
+
+    def observed_rate(self) -> float:
+        """최근 요청 간격으로 추정한 초당 요청 수 (추정 불가면 0)."""
+        if len(self.recent) < 2:
+            return 0.0
+        elapsed = self.recent[-1] - self.recent[0]
+        return (len(self.recent) - 1) / elapsed if elapsed > 0 else 0.0
+
+
+class AdaptiveRateLimiter:
+    """응답 상태에 따라 호스트별 속도를 조절하는 제한기 (AIMD 방식).
+
+    - 처음에는 제한 없이 요청한다 (max_rate > 0이면 그 속도가 상한).
+    - 429/503을 받으면 현재 속도를 decrease 배로 줄이고,
+      Retry-After(없으면 default_pause초) 동안 해당 호스트 요청을 멈춘다.
+    - success_threshold번 연속 성공하면 속도를 increase 배로 올린다.
+
+    스레드와 이벤트 루프에서 함께 쓸 수 있도록
+    대기는 reserve()가 돌려준 시간만큼 호출 측이 직접 기다린다.
+
+    Attributes:
+        max_rate: 호스트당 최대 초당 요청 수 (0이면 무제한에서 시작)
+        min_rate: 속도를 줄일 때의 하한
+        decrease: 429/503 수신 시 속도 배율
+        increase: 연속 성공 시 속도 배율
+        success_threshold: 속도를 올리기 위한 연속 성공 횟수
+        default_pause: Retry-After가 없을 때 멈추는 시간 (초)
+    """
+
+    def __init__(
+        self,
+        max_rate: float = 0.0,
+        min_rate: float = 0.2,
+        decrease: float = 0.5,
+        increase: float = 1.25,
+        success_threshold: int = 20,
+        default_pause: float = 5.0,
+    ) -> None:
+        self.max_rate = max_rate
+        self.min_rate = max(min_rate, 0.001)
+        self.decrease = decrease
+        self.increase = increase
+        self.success_threshold = max(1, success_threshold)
+        self.default_pause = default_pause
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _AdaptiveHostState] = {}
+
+    def _state(self, host: str) -> _AdaptiveHostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _AdaptiveHostState()
+            if self.max_rate > 0:
+                state.bucket = TokenBucket(self.max_rate, 1)
+            self._hosts[host] = state
+        return state
+
+    def reserve(self, host: str) -> float:
+        """요청 한 건을 예약하고 기다려야 할 시간(초)을 반환한다."""
+        if not host:
+            return 0.0
+        with self._lock:
+            state = self._state(host)
+            now = time.monotonic()
+            pause = max(0.0, state.paused_until - now)
+            bucket = state.bucket
+            state.recent.append(now + pause)
+        wait = bucket.reserve() if bucket is not None else 0.0
+        return max(pause, wait)
+
+    def acquire(self, host: str) -> float:
+        """reserve() 후 그 시간만큼 기다린다. 기다린 시간(초)을 반환한다."""
+        wait = self.reserve(host)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record(self, host: str, status: int, retry_after: str | float | None = None) -> None:
+        """응답 상태를 반영해 호스트 속도를 조절한다."""
+        if not host:
+            return
+        with self._lock:
+            state = self._state(host)
+            if status in THROTTLE_STATUS:
+                self._slow_down(host, state, status, retry_after)
+            elif status < 500:
+                state.successes += 1
+                if state.successes >= self.success_threshold:
+                    state.successes = 0
+                    self._speed_up(host, state)
+
+    def rate_of(self, host: str) -> float:
+        """호스트의 현재 제한 속도 (0이면 무제한)."""
+        with self._lock:
+            state = self._hosts.get(host)
+            return state.bucket.rate if state and state.bucket else 0.0
+
+    def _slow_down(
+        self,
+        host: str,
+        state: _AdaptiveHostState,
+        status: int,
+        retry_after: str | float | None,
+    ) -> None:
+        current = state.bucket.rate if state.bucket else state.observed_rate() or 1.0
+        new_rate = max(self.min_rate, current * self.decrease)
+        if state.bucket is None:
+            state.bucket = TokenBucket(new_rate, 1)
+        else:
+            state.bucket.set_rate(new_rate)
+        state.successes = 0
+
+        if isinstance(retry_after, (int, float)):
+            pause = float(retry_after)
+        else:
+            pause = parse_retry_after(retry_after)
+            if pause is None:
+                pause = self.default_pause
+        state.paused_until = max(state.paused_until, time.monotonic() + pause)
+
+        RUN_STATS.add("rate_limit_throttled", host)
+        RUN_STATS.set("rate_limit_rate", host, round(new_rate, 2))
+        logger.warning(
+            "[throttle] %s – %d 응답, %.2freq/s로 감속, %.1f초 대기",
+            host,
+            status,
+            new_rate,
+            pause,
+        )
+
+    def _speed_up(self, host: str, state: _AdaptiveHostState) -> None:
+        if state.bucket is None:
+            return
+        new_rate = state.bucket.rate * self.increase
+        if self.max_rate > 0:
+            new_rate = min(self.max_rate, new_rate)
+        if new_rate == state.bucket.rate:
+            return
+        state.bucket.set_rate(new_rate)
+        RUN_STATS.set("rate_limit_rate", host, round(new_rate, 2))
+        logger.info("[throttle] %s – 연속 성공, %.2freq/s로 가속", host, new_rate)
+
+
+class CircuitBreaker:
+    """호스트별 서킷 브레이커.
+
+    같은 호스트에서 failure_threshold번 연속으로 실패하면 서킷을 열고,
+    이번 실행이 끝날 때까지 그 호스트로의 수집을 바로 건너뛴다.
+    성공하면 연속 실패 횟수는 0으로 돌아간다.
+
+    Attributes:
+        failure_threshold: 서킷을 열기 위한 연속 실패 횟수
+    """
+
+    def __init__(self, failure_threshold: int = DEFAULT_BREAKER_THRESHOLD) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}
+        self._open: set[str] = set()
+
+    def reset(self, failure_threshold: int | None = None) -> None:
+        """상태를 초기화한다 (실행 시작 시 설정값 반영용)."""
+        with self._lock:
+            if failure_threshold is not None:
+                self.failure_threshold = max(1, failure_threshold)
+            self._failures.clear()
+            self._open.clear()
+
+    def allow(self, host: str) -> bool:
+        """호스트로 요청해도 되는지 반환한다 (빈 호스트는 항상 허용)."""
+        if not host:
+            return True
+        with self._lock:
+            return host not in self._open
+
+    def record_success(self, host: str) -> None:
+        if not host:
+            return
+        with self._lock:
+            self._failures[host] = 0
+
+    def record_failure(self, host: str) -> None:
+        """연속 실패를 기록하고, 임계치에 도달하면 서킷을 연다."""
+        if not host:
+            return
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if failures < self.failure_threshold or host in self._open:
+                return
+            self._open.add(host)
+        RUN_STATS.set("circuit_breaker", host, f"open ({failures} failures)")
+        logger.warning(
+            "[breaker] %s – 연속 실패 %d회, 서킷 열림 (이번 실행 동안 요청 건너뜀)",
+            host,
+            failures,
+        )
+
+    def open_hosts(self) -> list[str]:
+        with self._lock:
+            return sorted(self._open)
+
+
+# 모든 소스가 공유하는 호스트별 서킷 브레이커
+HOST_BREAKER = CircuitBreaker()
@@ -0,0 +1,8 @@
+"""pytest 공통 설정 – src 디렉토리를 임포트 경로에 추가한다."""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
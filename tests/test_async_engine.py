@@ -0,0 +1,174 @@
+"""asyncio 수집 엔진을 로컬 HTTP 서버(http.server)에 대고 검증한다."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+import http_client
+from async_engine import AsyncHttpClient, AsyncHttpError, open_http_client, run_async_collection
+from config_loader import AppSettings, CompanyConfig
+from models import JobPosting
+from sources.base import BaseSource
+from throttle import HOST_BREAKER
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """/jobs?name=X&delay=초 → X, /error → 500."""
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        if parts.path == "/error":
+            self.send_error(500)
+            return
+        query = parse_qs(parts.query)
+        time.sleep(float(query.get("delay", ["0"])[0]))
+        body = query["name"][0].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class _NativeSource(BaseSource):
+    """fetch_company_async를 직접 구현한 소스."""
+
+    name = "native-test"
+    max_retries = 1
+    backoff_base = 0
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: list[Exception] = []
+
+    def fetch_company(self, company: CompanyConfig) -> list[JobPosting]:
+        raise AssertionError("비동기 경로에서는 호출되지 않아야 함")
+
+    async def fetch_company_async(self, company: CompanyConfig, http: AsyncHttpClient) -> list[JobPosting]:
+        try:
+            text, _ = await http.get_text(company.url)
+        except Exception as exc:
+            self.errors.append(exc)
+            raise
+        return [JobPosting(source=self.name, company=company.name, title=text)]
+
+
+class _ThreadSource(BaseSource):
+    """동기 fetch_company만 구현한 소스 (to_thread 어댑터로 실행)."""
+
+    name = "thread-test"
+    max_retries = 1
+    backoff_base = 0
+
+    def fetch_company(self, company: CompanyConfig) -> list[JobPosting]:
+        resp = http_client.get(company.url)
+        resp.raise_for_status()
+        return [JobPosting(source=self.name, company=company.name, title=resp.text)]
+
+
+def _companies(server_url: str) -> list[CompanyConfig]:
+    # 앞선 기업일수록 늦게 응답하게 해서 완료 순서와 결과 순서를 다르게 만든다.
+    companies = [
+        CompanyConfig(name=f"c{i}", source="test", url=f"{server_url}/jobs?name=c{i}&delay={0.3 - i * 0.1:.1f}")
+        for i in range(3)
+    ]
+    companies.insert(1, CompanyConfig(name="broken", source="test", url=f"{server_url}/error"))
+    return companies
+
+
+def _collect(source: BaseSource, companies: list[CompanyConfig]) -> list[str]:
+    async def run() -> list[JobPosting]:
+        async with open_http_client(8) as http:
+            assert http is not None
+            return await source.fetch_all_companies_async(companies, http, max_workers=4)
+
+    HOST_BREAKER.reset()
+    return [job.title for job in asyncio.run(run())]
+
+
+def test_native_source_keeps_order_and_wraps_errors(server_url):
+    source = _NativeSource()
+    assert source.supports_async
+
+    titles = _collect(source, _companies(server_url))
+
+    assert titles == ["c0", "c1", "c2"]
+    assert len(source.errors) == 1
+    assert isinstance(source.errors[0], AsyncHttpError)
+    assert source.errors[0].status == 500
+
+
+def test_thread_adapter_keeps_order(server_url):
+    source = _ThreadSource()
+    assert not source.supports_async
+
+    titles = _collect(source, _companies(server_url))
+
+    assert titles == ["c0", "c1", "c2"]
+
+
+def test_http_client_raises_async_http_error(server_url):
+    async def run() -> None:
+        async with open_http_client(2) as http:
+            await http.get_text(f"{server_url}/error")
+
+    with pytest.raises(AsyncHttpError) as exc_info:
+        asyncio.run(run())
+    assert exc_info.value.status == 500
+
+
+class _SlowOpenSource(_ThreadSource):
+    """open()이 브라우저 기동처럼 오래 걸리는 소스."""
+
+    name = "slow-open-test"
+
+    def open(self, max_workers: int = 1) -> None:
+        self.open_thread = threading.get_ident()
+        time.sleep(0.3)
+        self.opened_at = time.perf_counter()
+
+
+def test_blocking_open_runs_off_the_event_loop(server_url):
+    settings = AppSettings()
+    settings.experience_filter.enabled = False
+    slow = _SlowOpenSource()
+    probe: dict[str, float | int] = {}
+
+    class _Probe(_ThreadSource):
+        name = "probe-test"
+
+        async def fetch_all_companies_async(self, companies, http, **kwargs):
+            probe["thread"] = threading.get_ident()
+            probe["finished_at"] = time.perf_counter()
+            return []
+
+    runnable = [
+        ("slow-open-test", slow, [CompanyConfig(name="c0", source="slow-open-test", url=f"{server_url}/jobs?name=c0")]),
+        ("probe-test", _Probe(), [CompanyConfig(name="p", source="probe-test", url=f"{server_url}/jobs?name=p")]),
+    ]
+    HOST_BREAKER.reset()
+    results = run_async_collection(runnable, settings)
+
+    # open()은 루프 밖 스레드에서 돌고, 그동안 다른 소스는 먼저 끝난다
+    assert slow.open_thread != probe["thread"]
+    assert probe["finished_at"] < slow.opened_at
+    assert [job.title for job in results[0]] == ["c0"]
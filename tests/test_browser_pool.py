@@ -0,0 +1,61 @@
+"""BrowserPool – 워커가 모두 죽거나 작업이 멈춰도 run()이 무한 대기하지 않는지 확인."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import types
+from concurrent.futures import TimeoutError as FutureTimeout
+from contextlib import contextmanager
+
+import pytest
+
+from sources.browser_pool import BrowserPool
+
+
+class _FakeContext:
+    def close(self) -> None:
+        pass
+
+
+class _FakeBrowser:
+    def new_context(self, **options):
+        return _FakeContext()
+
+    def close(self) -> None:
+        pass
+
+
+def _install_playwright(monkeypatch, launch) -> None:
+    """playwright.sync_api.sync_playwright를 launch()로 브라우저를 만드는 가짜로 바꾼다."""
+
+    @contextmanager
+    def sync_playwright():
+        yield types.SimpleNamespace(chromium=types.SimpleNamespace(launch=launch))
+
+    module = types.ModuleType("playwright.sync_api")
+    module.sync_playwright = sync_playwright
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", module)
+
+
+def test_run_fails_fast_when_every_worker_dies(monkeypatch):
+    def launch(**options):
+        raise RuntimeError("chromium 없음")
+
+    _install_playwright(monkeypatch, launch)
+    pool = BrowserPool(size=2, task_timeout=5)
+    for _ in range(20):
+        with pytest.raises(RuntimeError):
+            pool.run(lambda context: "html")
+    pool.close()
+
+
+def test_run_times_out_on_stuck_task(monkeypatch):
+    _install_playwright(monkeypatch, lambda **options: _FakeBrowser())
+    release = threading.Event()
+    pool = BrowserPool(size=1, task_timeout=0.2)
+    with pytest.raises(FutureTimeout):
+        pool.run(lambda context: release.wait(5))
+    release.set()
+    assert pool.run(lambda context: "html") == "html"
+    pool.close()
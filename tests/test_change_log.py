@@ -0,0 +1,30 @@
+"""change_log: compaction 전후로 조회 결과가 같아야 한다."""
+
+from change_log import ChangeLog
+from models import JobPosting
+
+
+def _job(title: str) -> JobPosting:
+    return JobPosting(source="mock", company="테스트", title=title)
+
+
+def _summary(log: ChangeLog) -> list[tuple[str, str, str]]:
+    return [(event["at"], event["event"], event["key"]) for event in log.changes_since("")]
+
+
+def test_changes_since_is_stable_across_compaction(tmp_path):
+    log = ChangeLog(tmp_path, compact_after=0)
+    existing, updated, fresh = _job("기존"), _job("수정"), _job("신규")
+    # 로그가 생기기 전부터 있던 공고: 첫 이벤트가 removed/updated
+    log.append(removed=[existing], at="2026-10-01T09:00:00+09:00")
+    log.append(updated=[updated], at="2026-10-02T09:00:00+09:00")
+    log.append(new=[fresh], at="2026-10-03T09:00:00+09:00")
+    log.append(removed=[fresh], at="2026-10-04T09:00:00+09:00")
+
+    before = _summary(log)
+    log.compact()
+    after = _summary(log)
+
+    assert after == before
+    assert [event for _, event, key in after if key == existing.unique_key] == ["removed"]
+
@@ -0,0 +1,47 @@
+"""공고 고유키 – GreetingHR 기업(테넌트) 구분과 sqlite 키 재계산."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+
+from models import DiffResult, JobPosting
+from sqlite_store import SqliteJobStore
+
+
+def _greetinghr(host: str, title: str = "서버 개발자") -> JobPosting:
+    return JobPosting(
+        source="greetinghr",
+        company=host.split(".")[0],
+        title=title,
+        url=f"https://{host}/ko/o/123456",
+        date_found="2026-10-17",
+    )
+
+
+def test_greetinghr_key_includes_tenant_host():
+    kakaopay = _greetinghr("kakaopay.career.greetinghr.com")
+    mobility = _greetinghr("kakaomobility.career.greetinghr.com")
+    assert kakaopay.native_id == "kakaopay.career.greetinghr.com|123456"
+    assert kakaopay.unique_key != mobility.unique_key
+    # 같은 기업의 같은 공고는 제목이 바뀌어도 같은 키
+    assert kakaopay.unique_key == _greetinghr("KakaoPay.career.greetinghr.com", "백엔드 개발자").unique_key
+
+
+def test_sqlite_recomputes_keys_from_previous_version(tmp_path):
+    path = tmp_path / "jobs.db"
+    job = _greetinghr("kakaopay.career.greetinghr.com")
+    store = SqliteJobStore(path)
+    store.save(DiffResult(new_jobs=[job]))
+    store.close()
+
+    # 호스트 없이 만든 이전 방식(버전 1)의 키로 되돌린다
+    old_key = hashlib.sha256(b"greetinghr|id|123456").hexdigest()[:16]
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE jobs SET unique_key = ?", (old_key,))
+        conn.execute("PRAGMA user_version = 1")
+    conn.close()
+
+    store = SqliteJobStore(path)
+    assert [loaded.unique_key for loaded in store.load()] == [job.unique_key]
+    store.close()
@@ -0,0 +1,62 @@
+"""collect_all – 소스 예외 격리와 이전 공고 전달."""
+
+from __future__ import annotations
+
+from config_loader import AppSettings, CompanyConfig
+from main import collect_all
+from models import JobPosting
+from sources.base import BaseSource
+
+
+class _OkSource(BaseSource):
+    name = "ok"
+
+    def fetch_company(self, company: CompanyConfig) -> list[JobPosting]:
+        return [JobPosting(source=self.name, company=company.name, title="서버 개발자 - 경력 5년")]
+
+
+class _BrokenSource(BaseSource):
+    name = "broken"
+
+    def open(self, max_workers: int = 1) -> None:
+        raise RuntimeError("브라우저 시작 실패")
+
+    def fetch_company(self, company: CompanyConfig) -> list[JobPosting]:
+        raise AssertionError("open 실패 후 호출되면 안 됨")
+
+
+def test_sequential_collection_survives_failing_source():
+    settings = AppSettings(
+        companies=[
+            CompanyConfig(name="A", source="ok", url="https://a.example/"),
+            CompanyConfig(name="B", source="broken", url="https://b.example/"),
+        ]
+    )
+    settings.experience_filter.enabled = False
+    settings.concurrency.parallel_sources = False
+    registry = {"ok": _OkSource(), "broken": _BrokenSource()}
+    jobs = collect_all(settings, [], registry)
+    assert [job.company for job in jobs] == ["A"]
+
+
+class _KnownSource(_OkSource):
+    name = "known"
+    uses_known_jobs = True
+
+    def set_known_jobs(self, jobs: list[JobPosting]) -> None:
+        self.known = jobs
+
+
+def test_previous_jobs_are_streamed_once_to_sources_that_use_them():
+    settings = AppSettings(
+        companies=[
+            CompanyConfig(name="A", source="ok", url="https://a.example/"),
+            CompanyConfig(name="K", source="known", url="https://k.example/"),
+        ]
+    )
+    settings.experience_filter.enabled = False
+    settings.concurrency.parallel_sources = False
+    known = _KnownSource()
+    previous = (JobPosting(source=source, company="X", title=f"공고 {source}") for source in ("ok", "known"))
+    collect_all(settings, previous, {"ok": _OkSource(), "known": known})
+    assert [job.source for job in known.known] == ["known"]
@@ -0,0 +1,54 @@
+"""JobPosting – 지연 로드되는 description과 repr/비교, null 필드 불러오기."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from models import JobPosting
+from storage import load_jobs
+
+
+def _job(**overrides) -> JobPosting:
+    fields = {
+        "source": "wanted",
+        "company": "토스",
+        "title": "서버 개발자",
+        "url": "https://www.wanted.co.kr/wd/1",
+        "date_found": "2026-10-17",
+    }
+    fields.update(overrides)
+    return JobPosting(**fields)
+
+
+def test_repr_and_eq_do_not_load_description():
+    calls = []
+
+    def loader() -> str:
+        calls.append(1)
+        return "본문"
+
+    job, other = _job(description_ref="abc"), _job(description_ref="abc")
+    job.set_description_loader(loader)
+    assert "본문" not in repr(job)
+    assert job == other
+    assert calls == []
+    assert job.description == "본문"
+    assert calls == [1]
+
+
+def test_description_loader_is_not_an_init_argument():
+    with pytest.raises(TypeError):
+        _job(_description_loader=lambda: "본문")
+
+
+def test_from_dict_treats_null_fields_as_empty(tmp_path):
+    record = _job().to_dict()
+    record.update(company=None, level=None, location=None, url=None, description_ref=None)
+    job = JobPosting.from_dict(record)
+    assert (job.company, job.level, job.location, job.url, job.description_ref) == ("", "", "", "", "")
+
+    path = tmp_path / "jobs.json"
+    path.write_text(json.dumps([record]), encoding="utf-8")
+    assert [loaded.unique_key for loaded in load_jobs(path)] == [job.unique_key]
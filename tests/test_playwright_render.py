@@ -0,0 +1,87 @@
+"""Playwright 렌더링 – readiness 대기 실패 폴백과 리소스 차단 절약량."""
+
+from __future__ import annotations
+
+from sources.playwright_source import _ESTIMATED_BYTES, RenderOptions, ResourceFilter, _render_in_context
+
+
+class _FakePage:
+    def __init__(self, selector_appears: bool) -> None:
+        self.selector_appears = selector_appears
+        self.gotos: list[str] = []
+        self.waited_ms = 0
+
+    def on(self, event, handler) -> None:
+        pass
+
+    def goto(self, url, wait_until, timeout) -> None:
+        self.gotos.append(wait_until)
+
+    def wait_for_selector(self, selector, state, timeout) -> None:
+        if not self.selector_appears:
+            raise TimeoutError("selector 없음")
+
+    def locator(self, selector):
+        return type("Locator", (), {"count": lambda _self: 3})()
+
+    def evaluate(self, script) -> None:
+        pass
+
+    def wait_for_timeout(self, ms) -> None:
+        self.waited_ms += ms
+
+    def content(self) -> str:
+        return "<html></html>"
+
+
+class _FakeContext:
+    def __init__(self, page: _FakePage) -> None:
+        self.page = page
+
+    def new_page(self) -> _FakePage:
+        return self.page
+
+
+def test_readiness_failure_reuses_loaded_page():
+    page = _FakePage(selector_appears=False)
+    options = RenderOptions(wait_ms=100, scroll_count=2)
+    result = _render_in_context(_FakeContext(page), "https://example.com/jobs", options, "a.job")
+    assert page.gotos == ["domcontentloaded"]
+    assert page.waited_ms == 100 + 2 * 1000 + 100
+    assert result.html == "<html></html>"
+
+
+def test_fixed_wait_still_navigates():
+    page = _FakePage(selector_appears=True)
+    options = RenderOptions(wait="fixed", wait_ms=100, scroll_count=0)
+    _render_in_context(_FakeContext(page), "https://example.com/jobs", options, "a.job")
+    assert page.gotos == ["networkidle"]
+
+
+class _FakeRoute:
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.request = type("Request", (), {"url": url, "resource_type": resource_type})()
+        self.aborted = False
+
+    def abort(self) -> None:
+        self.aborted = True
+
+    def continue_(self) -> None:
+        pass
+
+
+def test_resource_filter_estimates_saved_bytes_per_host():
+    resource_filter = ResourceFilter(["image", "font"], ["ads.example"])
+    routes = [
+        _FakeRoute("https://cdn.example.com/a.png", "image"),
+        _FakeRoute("https://cdn.example.com/b.woff2", "font"),
+        _FakeRoute("https://x.ads.example/track.js", "script"),
+        _FakeRoute("https://www.example.com/jobs", "document"),
+    ]
+    for route in routes:
+        resource_filter._handle(route)
+    assert [route.aborted for route in routes] == [True, True, True, False]
+    assert resource_filter.saved_bytes == {
+        "cdn.example.com": _ESTIMATED_BYTES["image"] + _ESTIMATED_BYTES["font"],
+        "x.ads.example": _ESTIMATED_BYTES["script"],
+    }
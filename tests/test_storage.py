@@ -0,0 +1,61 @@
+"""공고 저장소 – JSON 배열 → JSON Lines 변환, sqlite JSON 내보내기의 blob 정리."""
+
+from __future__ import annotations
+
+from blob_store import BlobStore
+from models import DiffResult, JobPosting
+from sqlite_store import SqliteJobStore
+from storage import JsonlJobStore, save_jobs
+
+
+def _jobs(count: int) -> list[JobPosting]:
+    return [
+        JobPosting(
+            source="wanted",
+            company="토스",
+            title=f"서버 개발자 {i}",
+            url=f"https://www.wanted.co.kr/wd/{1000 + i}",
+            description=f"본문 {i}",
+            date_found="2026-10-17",
+        )
+        for i in range(count)
+    ]
+
+
+def test_jsonl_migration_writes_sorted_by_key(tmp_path):
+    legacy = tmp_path / "jobs.json"
+    save_jobs(_jobs(20), legacy)
+    store = JsonlJobStore(tmp_path / "jobs.jsonl", legacy_path=legacy)
+    keys = [job.unique_key for job in store.iter_jobs()]
+    assert keys == sorted(keys)
+    assert len(keys) == 20
+    assert not legacy.exists()
+
+
+def test_jsonl_diff_streams_previous_and_carries_descriptions(tmp_path):
+    blobs = BlobStore(tmp_path / "descriptions")
+    store = JsonlJobStore(tmp_path / "jobs.jsonl", legacy_path=tmp_path / "jobs.json", blobs=blobs)
+    store.save(DiffResult(new_jobs=_jobs(3)))
+
+    current = [
+        JobPosting(source=job.source, company=job.company, title=job.title, url=job.url, date_found=job.date_found)
+        for job in _jobs(2)
+    ]
+    diff = store.compute_diff(None, current)
+    assert (len(diff.unchanged_jobs), len(diff.removed_jobs), len(diff.new_jobs)) == (2, 1, 0)
+    assert not any(job.description_loaded for job in diff.unchanged_jobs)  # 아직 읽지 않음
+    assert [job.description for job in current] == ["본문 0", "본문 1"]
+
+
+def test_sqlite_export_prunes_unreferenced_blobs(tmp_path):
+    blobs = BlobStore(tmp_path / "descriptions")
+    store = SqliteJobStore(tmp_path / "jobs.db", json_path=tmp_path / "jobs.json", blobs=blobs)
+    jobs = _jobs(3)
+    store.save(DiffResult(new_jobs=jobs))
+    assert len(list(blobs.root.glob("*/*"))) == 3
+
+    store.save(DiffResult(unchanged_jobs=jobs[:1], removed_jobs=jobs[1:]))
+    store.close()
+    assert [path.parent.name + path.name.split(".", 1)[0] for path in blobs.root.glob("*/*")] == [
+        jobs[0].description_ref
+    ]
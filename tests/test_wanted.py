@@ -0,0 +1,65 @@
+"""WantedSource – 증분 수집 중 전체 수집 주기 판단과 기록."""
+
+from __future__ import annotations
+
+import json
+from datetime import date, timedelta
+
+from config_loader import WantedConfig
+from models import JobPosting
+from paging import fetch_pages
+from sources.wanted import WantedSource
+
+
+def _source(state_path, days: int = 7) -> WantedSource:
+    source = WantedSource(WantedConfig(full_sweep_days=days), state_path=state_path)
+    source.set_known_jobs(
+        [JobPosting(source="wanted", company="토스", title="서버 개발자", url="https://www.wanted.co.kr/wd/1")]
+    )
+    return source
+
+
+def _write_last_sweep(path, days_ago: int) -> None:
+    last = date.today() - timedelta(days=days_ago)
+    path.write_text(json.dumps({"last_full_sweep": last.isoformat()}), encoding="utf-8")
+
+
+def test_full_sweep_when_interval_elapsed(tmp_path):
+    path = tmp_path / "wanted_state.json"
+    assert not _source(path)._incremental_mode()  # 기록 없음 → 전체 수집
+
+    _write_last_sweep(path, 6)
+    assert _source(path)._incremental_mode()
+
+    _write_last_sweep(path, 7)
+    assert not _source(path)._incremental_mode()
+
+
+def test_full_sweep_is_recorded_after_save(tmp_path):
+    path = tmp_path / "wanted_state.json"
+    _write_last_sweep(path, 30)
+    source = _source(path)
+    assert not source._incremental_mode()
+    source._finish_full_sweep(complete=True)
+    assert _source(path)._read_last_full_sweep() == date.today() - timedelta(days=30)  # 저장 전
+
+    source.on_saved()
+    assert json.loads(path.read_text(encoding="utf-8")) == {"last_full_sweep": date.today().isoformat()}
+    assert _source(path)._incremental_mode()
+
+
+def test_interrupted_full_sweep_is_not_recorded(tmp_path):
+    path = tmp_path / "wanted_state.json"
+    source = _source(path)
+    source._finish_full_sweep(complete=False)
+    source.on_saved()
+    assert not path.exists()
+    assert not source._incremental_mode()
+
+
+def test_fetch_pages_reports_whether_the_list_ended():
+    pages = [0, 1, 2, 3]
+    ends_at_2 = lambda page, result: page < 2  # noqa: E731
+    assert fetch_pages(pages, lambda page: {"page": page}, ends_at_2, max_concurrency=2)
+    assert not fetch_pages(pages, lambda page: None if page == 1 else {}, ends_at_2, max_concurrency=2)
+    assert not fetch_pages(pages, lambda page: {}, lambda page, result: True)  # 끝이 안 나옴